@@ -0,0 +1,506 @@
+"""
+Application Index Module for Nova AI Assistant
+Persistent name -> launcher map, refreshed incrementally by directory mtimes
+"""
+
+import bisect
+import json
+import os
+import platform
+import random
+import shlex
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
+
+
+VERSION = 1
+
+# Field codes in a .desktop Exec line, replaced by files or URLs at launch
+_DESKTOP_FIELD_CODES = ('%f', '%F', '%u', '%U', '%d', '%D', '%n', '%N', '%i', '%c', '%k', '%v', '%m')
+
+# Installer leftovers that should never be what "open X" means
+_SKIPPED_WORDS = ('uninstall', 'unins0', 'setup', 'updater', 'crashpad', 'crash_reporter')
+
+
+def normalize_app_name(name: str) -> str:
+    """Lookup form of an application name: lower case, words split on _ - . and spaces"""
+    for separator in ('_', '-', '.'):
+        name = name.replace(separator, ' ')
+    return " ".join(name.lower().split())
+
+
+def launcher_roots(system: Optional[str] = None) -> List[str]:
+    """
+    Directories applications are launched from, most preferred first
+    
+    Args:
+        system: platform.system() name in lower case, defaults to this machine's
+    """
+    system = system or platform.system().lower()
+    home = os.path.expanduser("~")
+    if system == "windows":
+        roots = [
+            os.path.join(os.environ.get('APPDATA', os.path.join(home, 'AppData', 'Roaming')),
+                         'Microsoft', 'Windows', 'Start Menu', 'Programs'),
+            os.path.join(os.environ.get('PROGRAMDATA', 'C:\\ProgramData'),
+                         'Microsoft', 'Windows', 'Start Menu', 'Programs'),
+            os.path.join(home, 'AppData', 'Local', 'Programs'),
+            os.environ.get('PROGRAMFILES', 'C:\\Program Files'),
+            os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'),
+        ]
+    elif system == "darwin":
+        roots = ['/Applications', os.path.join(home, 'Applications')]
+    else:
+        data_home = os.environ.get('XDG_DATA_HOME', os.path.join(home, '.local', 'share'))
+        data_dirs = os.environ.get('XDG_DATA_DIRS', '/usr/local/share:/usr/share').split(':')
+        roots = [os.path.join(directory, 'applications') for directory in [data_home] + data_dirs if directory]
+        roots += ['/var/lib/flatpak/exports/share/applications', '/var/lib/snapd/desktop/applications']
+    return roots
+
+
+def path_directories() -> List[str]:
+    """Directories on $PATH, whose programs can be opened by name too"""
+    directories = []
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        if directory and directory not in directories:
+            directories.append(directory)
+    return directories
+
+
+def parse_desktop_file(path: str) -> Optional[Tuple[List[str], str]]:
+    """
+    Read a freedesktop.org .desktop launcher
+    
+    Returns:
+        (names, command), or None if it is hidden or not an application
+    """
+    values = {}
+    in_entry = False
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as desktop_file:
+            for line in desktop_file:
+                line = line.strip()
+                if line.startswith('['):
+                    if in_entry:
+                        break
+                    in_entry = line == '[Desktop Entry]'
+                elif in_entry and '=' in line:
+                    key, _, value = line.partition('=')
+                    values.setdefault(key.strip(), value.strip())
+    except OSError:
+        return None
+    
+    if (values.get('Type', 'Application') != 'Application' or not values.get('Exec')
+            or values.get('NoDisplay', '').lower() == 'true' or values.get('Hidden', '').lower() == 'true'):
+        return None
+    
+    command = " ".join(part for part in values['Exec'].split() if part not in _DESKTOP_FIELD_CODES)
+    stem = os.path.basename(path)[:-len('.desktop')]
+    names = [values.get('Name', ''), stem.rsplit('.', 1)[-1], stem]
+    return [name for name in names if name], command
+
+
+def _scan_entries(directory: str, names: List[str], on_path: bool) -> List[Tuple[str, str]]:
+    """
+    Applications directly inside a directory
+    
+    Returns:
+        (name, launch target) pairs
+    """
+    entries = []
+    for name in names:
+        lower = name.lower()
+        path = os.path.join(directory, name)
+        if lower.endswith('.desktop'):
+            parsed = parse_desktop_file(path)
+            if parsed is not None:
+                entries.extend((app_name, parsed[1]) for app_name in parsed[0])
+        elif lower.endswith(('.exe', '.lnk')):
+            entries.append((name[:-4], path))
+        elif lower.endswith('.app'):
+            entries.append((name[:-4], path))
+        elif on_path and os.name != 'nt' and os.access(path, os.X_OK) and not os.path.isdir(path):
+            entries.append((name, shlex.quote(path)))
+    return [(app_name, target) for app_name, target in entries
+            if not any(word in app_name.lower() for word in _SKIPPED_WORDS)]
+
+
+class AppIndex:
+    """Application names and how to launch them, kept on disk between runs"""
+    
+    def __init__(self, roots: Optional[List[str]] = None, path: Optional[str] = None,
+                 max_depth: int = 8, path_dirs: Optional[List[str]] = None):
+        """
+        Initialize the index
+        
+        Args:
+            roots: Directories searched for applications, most preferred
+                first; defaults to launcher_roots()
+            path: JSON file the index is kept in, None to keep it in memory
+            max_depth: Directory levels searched below each root
+            path_dirs: Directories whose programs are indexed without
+                searching below them; defaults to $PATH when roots is not given
+        """
+        self.roots = roots if roots is not None else launcher_roots()
+        if path_dirs is None:
+            path_dirs = path_directories() if roots is None else []
+        self.path_dirs = path_dirs
+        self.path = path
+        self.max_depth = max_depth
+        
+        # Directory -> [mtime, [[name, target], ...], [subdirectories]]
+        self.directories: Dict[str, list] = {}
+        
+        # (normalized name -> launch target, sorted names, word -> names
+        # containing it, shortest first), replaced whole so readers never
+        # see half an update
+        self._tables: Tuple[Dict[str, str], List[str], Dict[str, List[str]]] = ({}, [], {})
+        # Held while refreshing or saving, which may happen on a watcher thread
+        self._lock = threading.Lock()
+        
+        # Directories listed by the last refresh, and ones only stat()ed
+        self.last_listed = 0
+        self.last_checked = 0
+    
+    def __len__(self) -> int:
+        return len(self.apps)
+    
+    @property
+    def apps(self) -> Dict[str, str]:
+        """Normalized name -> launch target"""
+        return self._tables[0]
+    
+    @classmethod
+    def load(cls, path: str, roots: Optional[List[str]] = None, max_depth: int = 8,
+             path_dirs: Optional[List[str]] = None) -> "AppIndex":
+        """
+        Load an index saved by save(), or start an empty one
+        
+        The loaded index may be stale; call refresh() to bring it up to date.
+        """
+        index = cls(roots, path, max_depth, path_dirs)
+        try:
+            with open(path, 'r', encoding='utf-8') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return index
+        
+        # Records for other roots would be listed again anyway
+        if (data.get('version') == VERSION and data.get('roots') == index.roots
+                and data.get('path_dirs') == index.path_dirs):
+            index.directories = data.get('directories', {})
+            index._rebuild()
+        return index
+    
+    def save(self) -> None:
+        """Write the index to its file atomically"""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        try:
+            with self._lock:
+                with open(temp_path, 'w', encoding='utf-8') as index_file:
+                    json.dump({'version': VERSION, 'roots': self.roots, 'path_dirs': self.path_dirs,
+                               'directories': self.directories}, index_file)
+                os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not save the application index: {e}")
+    
+    def refresh(self, changed: Optional[Collection[str]] = None) -> bool:
+        """
+        Bring the index up to date
+        
+        Only directories whose mtime changed are listed again; the rest
+        cost one stat() each. A directory's mtime changes when entries are
+        added to, removed from or renamed in it, so every install and
+        uninstall is seen.
+        
+        Args:
+            changed: Directories known to have changed, e.g. from a watcher;
+                when given, every other indexed directory is trusted as is
+                and not even stat()ed
+        
+        Returns:
+            True if anything changed
+        """
+        with self._lock:
+            return self._refresh(changed)
+    
+    def _refresh(self, changed: Optional[Collection[str]]) -> bool:
+        seen: Dict[str, list] = {}
+        listed = checked = 0
+        # $PATH directories hold programs directly; application roots are searched below
+        for top, recursive in [(root, True) for root in self.roots] + [(directory, False) for directory in self.path_dirs]:
+            # Breadth first, so a program near the top of its tree wins over helpers deeper down
+            queue = deque([(top, 0)])
+            while queue:
+                directory, depth = queue.popleft()
+                if directory in seen:
+                    continue
+                
+                record = self.directories.get(directory)
+                if record is None or changed is None or directory in changed:
+                    try:
+                        mtime = os.stat(directory).st_mtime
+                    except OSError:
+                        continue
+                    checked += 1
+                    # A reported change is listed even if the mtime is the same, e.g. an edited .desktop file
+                    if record is None or record[0] != mtime or changed is not None:
+                        record = self._list(directory, mtime, not recursive)
+                        listed += 1
+                seen[directory] = record
+                
+                if recursive and depth < self.max_depth:
+                    queue.extend((subdirectory, depth + 1) for subdirectory in record[2])
+        
+        changed = list(seen) != list(self.directories) or any(
+            self.directories[directory] is not record for directory, record in seen.items())
+        self.directories = seen
+        self.last_listed = listed
+        self.last_checked = checked
+        if changed:
+            self._rebuild()
+        return changed
+    
+    def _list(self, directory: str, mtime: float, on_path: bool) -> list:
+        """List one directory: its applications and subdirectories"""
+        files = []
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower().endswith('.app'):
+                                # macOS bundles are applications, not places to search
+                                files.append(entry.name)
+                            else:
+                                subdirectories.append(entry.path)
+                        else:
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return [mtime, [], []]
+        return [mtime, [list(pair) for pair in _scan_entries(directory, files, on_path)], subdirectories]
+    
+    def _rebuild(self) -> None:
+        """Rebuild the lookup tables; directories are in refresh order, so earlier roots win"""
+        apps: Dict[str, str] = {}
+        for record in self.directories.values():
+            for name, target in record[1]:
+                apps.setdefault(normalize_app_name(name), target)
+        
+        words: Dict[str, List[str]] = {}
+        for name in apps:
+            for word in set(name.split()):
+                words.setdefault(word, []).append(name)
+        for names in words.values():
+            names.sort(key=len)
+        
+        self._tables = (apps, sorted(apps), words)
+    
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        Find how to launch an application
+        
+        Tries the exact name, then the shortest name starting with it, then
+        the shortest name containing all of its words.
+        
+        Returns:
+            Launch target (a path or command line), or None
+        """
+        key = normalize_app_name(name)
+        if not key:
+            return None
+        apps, sorted_names, word_names = self._tables
+        if key in apps:
+            return apps[key]
+        
+        position = bisect.bisect_left(sorted_names, key)
+        prefixed = []
+        while position < len(sorted_names) and sorted_names[position].startswith(key):
+            prefixed.append(sorted_names[position])
+            position += 1
+            if len(prefixed) >= 32:
+                break
+        if prefixed:
+            return apps[min(prefixed, key=len)]
+        
+        words = key.split()
+        for candidate in word_names.get(words[0], []):
+            candidate_words = candidate.split()
+            if all(word in candidate_words for word in words[1:]):
+                return apps[candidate]
+        return None
+    
+    def names(self, prefix: str = '', limit: int = 20) -> List[str]:
+        """Indexed names starting with a prefix, in sorted order"""
+        key = normalize_app_name(prefix)
+        sorted_names = self._tables[1]
+        position = bisect.bisect_left(sorted_names, key)
+        found = []
+        while position < len(sorted_names) and len(found) < limit and sorted_names[position].startswith(key):
+            found.append(sorted_names[position])
+            position += 1
+        return found
+
+
+def walk_lookup(roots: Iterable[str], app_name: str) -> Optional[str]:
+    """The full-tree search SystemControls used to do on every miss, for comparison"""
+    app_name = app_name.lower()
+    for root in roots:
+        if os.path.exists(root):
+            for directory, _, files in os.walk(root):
+                for file in files:
+                    if file.lower().startswith(app_name) and file.lower().endswith('.exe'):
+                        return os.path.join(directory, file)
+    return None
+
+
+def build_synthetic_tree(root: str, files: int = 100000, apps: int = 500, seed: int = 0) -> List[str]:
+    """
+    Lay out a fake install tree for benchmarking
+    
+    Args:
+        root: Directory to fill
+        files: Files to create in total, mostly libraries and data
+        apps: How many of them are .exe applications
+        seed: Random seed
+    
+    Returns:
+        Names of the applications created
+    """
+    generator = random.Random(seed)
+    vendors = [f"vendor{number}" for number in range(max(1, files // 2000))]
+    app_names = []
+    for number in range(files):
+        vendor = vendors[number % len(vendors)]
+        product = f"product{number % 97}"
+        directory = os.path.join(root, vendor, product, f"lib{generator.randrange(4)}")
+        os.makedirs(directory, exist_ok=True)
+        if number < apps:
+            name = f"app{number}"
+            app_names.append(name)
+            filename = f"{name}.exe"
+        else:
+            filename = f"file{number}.{generator.choice(['dll', 'dat', 'pak', 'json'])}"
+        with open(os.path.join(directory, filename), 'wb'):
+            pass
+    return app_names
+
+
+def benchmark_index(files: int = 100000, lookups: int = 200) -> Dict[str, float]:
+    """
+    Compare the full-tree walk with building, refreshing and querying the index
+    
+    Returns:
+        Dictionary with walk_ms (per missed lookup), build_ms, refresh_ms,
+        refresh_after_install_ms, lookup_us and the counts involved
+    """
+    root = tempfile.mkdtemp(prefix='nova-apps-')
+    try:
+        app_names = build_synthetic_tree(root, files)
+        index_path = os.path.join(root, 'app_index.json')
+        
+        start = time.perf_counter()
+        walk_lookup([root], 'no such app')
+        walk_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        index = AppIndex([root], index_path)
+        index.refresh()
+        index.save()
+        build_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        index = AppIndex.load(index_path, [root])
+        load_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        index.refresh()
+        refresh_ms = (time.perf_counter() - start) * 1000
+        directories = index.last_checked
+        
+        # Modification times can be coarse; make sure the new one differs
+        installed = os.path.join(root, 'vendor0', 'newly installed')
+        os.makedirs(installed)
+        with open(os.path.join(installed, 'freshapp.exe'), 'wb'):
+            pass
+        start = time.perf_counter()
+        index.refresh()
+        refresh_after_install_ms = (time.perf_counter() - start) * 1000
+        relisted = index.last_listed
+        
+        queries = [generator_name for generator_name in app_names[:lookups]] + ['fresh', 'no such app']
+        start = time.perf_counter()
+        found = sum(index.lookup(query) is not None for query in queries)
+        lookup_us = (time.perf_counter() - start) / len(queries) * 1e6
+        
+        return {
+            'files': files,
+            'directories': directories,
+            'apps': len(index),
+            'walk_ms': walk_ms,
+            'build_ms': build_ms,
+            'load_ms': load_ms,
+            'refresh_ms': refresh_ms,
+            'refresh_after_install_ms': refresh_after_install_ms,
+            'relisted': relisted,
+            'lookup_us': lookup_us,
+            'found': found,
+            'queries': len(queries),
+        }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def print_benchmark(report: Dict[str, float]) -> None:
+    """Print a benchmark_index() report"""
+    print(f"  {report['files']:,} files in {report['directories']:,} directories, {report['apps']} applications")
+    print(f"  Full walk per missed lookup  {report['walk_ms']:9.1f} ms")
+    print(f"  Build and save the index     {report['build_ms']:9.1f} ms")
+    print(f"  Load the saved index         {report['load_ms']:9.1f} ms")
+    print(f"  Refresh, nothing changed     {report['refresh_ms']:9.1f} ms")
+    print(f"  Refresh after an install     {report['refresh_after_install_ms']:9.1f} ms "
+          f"({report['relisted']} directories listed)")
+    print(f"  Lookup                       {report['lookup_us']:9.1f} µs "
+          f"({report['found']}/{report['queries']} found)")
+
+
+if __name__ == "__main__":
+    # Build, query and benchmark application indexes
+    usage = [
+        "  python app_index.py list [prefix]",
+        "  python app_index.py lookup NAME",
+        "  python app_index.py bench [files]",
+    ]
+    arguments = sys.argv[1:]
+    if not arguments or arguments[0] not in ('list', 'lookup', 'bench'):
+        print("Usage:")
+        print("\n".join(usage))
+        sys.exit(1)
+    
+    if arguments[0] == 'bench':
+        print("🎯 Benchmarking the application index")
+        print_benchmark(benchmark_index(int(arguments[1]) if len(arguments) > 1 else 100000))
+        sys.exit(0)
+    
+    index = AppIndex()
+    start = time.perf_counter()
+    index.refresh()
+    print(f"📇 {len(index)} applications from {index.last_checked} directories "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    if arguments[0] == 'list':
+        for name in index.names(" ".join(arguments[1:]), limit=50):
+            print(f"  {name}: {index.apps[name]}")
+    else:
+        print(f"🚀 {index.lookup(' '.join(arguments[1:]))}")
@@ -0,0 +1,415 @@
+"""
+Application Watcher Module for Nova AI Assistant
+Keeps the application index current in the background: inotify on Linux, mtime polling elsewhere
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from app_index import AppIndex, build_synthetic_tree
+
+
+# Event bits from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Everything that can add, remove or change a launcher in a directory
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+# struct inotify_event header: wd, mask, cookie, len; the name follows
+_EVENT_HEADER = struct.Struct('iIII')
+
+# Kernel memory per watch on 64-bit Linux, per the max_user_watches documentation
+KERNEL_BYTES_PER_WATCH = 1080
+
+
+class Inotify:
+    """Directory watches on a Linux inotify descriptor, through libc"""
+    
+    def __init__(self):
+        """
+        Open an inotify descriptor
+        
+        Raises:
+            OSError: inotify is not available
+        """
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        
+        # Watch descriptor <-> directory
+        self.paths: Dict[int, str] = {}
+        self.watches: Dict[str, int] = {}
+    
+    def add(self, path: str) -> None:
+        """
+        Watch a directory
+        
+        Raises:
+            OSError: It could not be watched, e.g. ENOSPC when
+                fs.inotify.max_user_watches is used up
+        """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+        self.paths[wd] = path
+        self.watches[path] = wd
+    
+    def remove(self, path: str) -> None:
+        """Stop watching a directory"""
+        wd = self.watches.pop(path, None)
+        if wd is not None:
+            self.paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self.fd, wd)
+    
+    def read(self, timeout: float) -> List[Tuple[str, int, str]]:
+        """
+        Wait for events
+        
+        Args:
+            timeout: Most seconds to wait
+        
+        Returns:
+            (watched directory, event mask, entry name) for each event; the
+            directory is '' for a queue overflow
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                if mask & IN_IGNORED:
+                    # The directory is gone and the kernel dropped its watch
+                    path = self.paths.pop(wd, None)
+                    if path is not None and self.watches.get(path) == wd:
+                        del self.watches[path]
+                    continue
+                events.append((self.paths.get(wd, ''), mask, name))
+        return events
+    
+    def close(self) -> None:
+        """Release the descriptor and every watch"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.paths.clear()
+        self.watches.clear()
+
+
+class AppWatcher:
+    """Updates an AppIndex on a background thread as applications are installed and removed"""
+    
+    def __init__(self, index: AppIndex, interval: float = 30.0, use_inotify: bool = True,
+                 debounce: float = 0.5, rescan_interval: float = 3600.0, save_delay: float = 5.0):
+        """
+        Initialize the watcher
+        
+        Args:
+            index: Index to keep current, saved to disk after changes
+            interval: Seconds between mtime polls when inotify is not used
+            use_inotify: Watch directories with inotify where available
+            debounce: Seconds to wait for an install to settle before updating
+            rescan_interval: Seconds between full refreshes under inotify,
+                which pick up roots created after the watcher started
+            save_delay: Seconds without changes before the index is saved;
+                saving takes longer than updating, so bursts are saved once
+        """
+        self.index = index
+        self.interval = interval
+        self.use_inotify = use_inotify
+        self.debounce = debounce
+        self.rescan_interval = rescan_interval
+        self.save_delay = save_delay
+        
+        # 'inotify' or 'polling', known once started
+        self.mode: Optional[str] = None
+        self.events = 0
+        self.updates = 0
+        self.last_update_ms = 0.0
+        # CPU time used by the watcher thread, and when it started
+        self.cpu_seconds = 0.0
+        self.started_at: Optional[float] = None
+        
+        # When the index last changed without being saved since
+        self._unsaved_since: Optional[float] = None
+        
+        self._inotify: Optional[Inotify] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start watching in the background; the index is refreshed first, off the caller's thread"""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="nova-app-watcher", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop watching"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._close_inotify()
+        self._save()
+    
+    def _run(self) -> None:
+        cpu_start = time.thread_time()
+        self._update(None)
+        self._save()
+        
+        if self.use_inotify:
+            try:
+                self._inotify = Inotify()
+                self._sync_watches()
+                self.mode = 'inotify'
+            except OSError as e:
+                print(f"Warning: Watching applications by polling instead of inotify: {e}")
+                self._close_inotify()
+        if self._inotify is None:
+            self.mode = 'polling'
+        self.cpu_seconds = time.thread_time() - cpu_start
+        
+        last_rescan = time.monotonic()
+        while not self._stop.is_set():
+            if self._inotify is None:
+                self._stop.wait(self.interval)
+                if not self._stop.is_set():
+                    self._update(None)
+                    self._save()
+            else:
+                self._watch_once()
+                if time.monotonic() - last_rescan >= self.rescan_interval:
+                    self._update(None)
+                    last_rescan = time.monotonic()
+                if self._unsaved_since is not None and time.monotonic() - self._unsaved_since >= self.save_delay:
+                    self._save()
+            self.cpu_seconds = time.thread_time() - cpu_start
+    
+    def _watch_once(self) -> None:
+        """Wait for events, let them settle, then update the directories they touched"""
+        events = self._inotify.read(1.0)
+        if not events:
+            return
+        
+        changed: Optional[Set[str]] = set()
+        while events:
+            self.events += len(events)
+            for directory, mask, _ in events:
+                if mask & IN_Q_OVERFLOW:
+                    # Events were lost; only a full refresh can tell what changed
+                    changed = None
+                elif changed is not None:
+                    changed.add(directory)
+                    if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                        changed.add(os.path.dirname(directory))
+            if self._stop.is_set():
+                return
+            # An installer writes many files; wait until it goes quiet
+            events = self._inotify.read(self.debounce)
+        
+        self._update(changed)
+        try:
+            added = self._sync_watches()
+            if added:
+                # Directories created before their watch was in place
+                self._update(added)
+        except OSError as e:
+            print(f"Warning: Watching applications by polling instead of inotify: {e}")
+            self._close_inotify()
+            self.mode = 'polling'
+    
+    def _update(self, changed: Optional[Set[str]]) -> None:
+        """Refresh the index, all of it or the given directories"""
+        start = time.perf_counter()
+        try:
+            if self.index.refresh(changed):
+                self._unsaved_since = time.monotonic()
+        except Exception as e:
+            print(f"Warning: Could not update the application index: {e}")
+            return
+        self.updates += 1
+        self.last_update_ms = (time.perf_counter() - start) * 1000
+    
+    def _save(self) -> None:
+        """Save the index if it changed since it was last saved"""
+        if self._unsaved_since is not None:
+            self._unsaved_since = None
+            self.index.save()
+    
+    def _sync_watches(self) -> Set[str]:
+        """
+        Watch every indexed directory and no others
+        
+        Returns:
+            Directories that were not watched before
+        """
+        wanted = self.index.directories
+        for path in [path for path in self._inotify.watches if path not in wanted]:
+            self._inotify.remove(path)
+        added = set()
+        for path in wanted:
+            if path not in self._inotify.watches:
+                try:
+                    self._inotify.add(path)
+                except FileNotFoundError:
+                    continue
+                added.add(path)
+        return added
+    
+    def _close_inotify(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+    
+    def overhead(self) -> Dict[str, float]:
+        """
+        Report what the watcher costs
+        
+        Returns:
+            Dictionary with mode, watches, events, updates, last_update_ms,
+            cpu_seconds, cpu_percent (of one core since starting) and
+            memory_bytes (watch tables plus the kernel's per-watch memory,
+            an estimate)
+        """
+        watches = len(self._inotify.watches) if self._inotify is not None else 0
+        memory = 0
+        if self._inotify is not None:
+            memory = (sys.getsizeof(self._inotify.watches) + sys.getsizeof(self._inotify.paths)
+                      + watches * KERNEL_BYTES_PER_WATCH)
+        elapsed = time.time() - self.started_at if self.started_at else 0.0
+        return {
+            'mode': self.mode or 'stopped',
+            'watches': watches,
+            'events': self.events,
+            'updates': self.updates,
+            'last_update_ms': self.last_update_ms,
+            'cpu_seconds': self.cpu_seconds,
+            'cpu_percent': self.cpu_seconds / elapsed * 100 if elapsed else 0.0,
+            'memory_bytes': memory,
+        }
+
+
+def benchmark_watcher(files: int = 100000, idle: float = 5.0, installs: int = 20) -> Dict[str, Dict]:
+    """
+    Measure how quickly installs become visible and what watching costs
+    
+    Both modes watch the same synthetic tree in turn; polling checks every
+    second.
+    
+    Args:
+        files: Files in the synthetic install tree
+        idle: Seconds to watch an unchanging tree
+        installs: Applications to install one at a time
+    
+    Returns:
+        Mode -> overhead() after the run, plus initial_ms, idle_cpu_seconds
+        and visible_ms_p50/max (install until "open X" finds it)
+    """
+    root = tempfile.mkdtemp(prefix='nova-watch-')
+    reports = {}
+    try:
+        build_synthetic_tree(os.path.join(root, 'apps'), files)
+        for mode in ('inotify', 'polling'):
+            index = AppIndex([os.path.join(root, 'apps')], os.path.join(root, f'{mode}.json'))
+            watcher = AppWatcher(index, interval=1.0, use_inotify=mode == 'inotify', debounce=0.05)
+            
+            start = time.perf_counter()
+            watcher.start()
+            while watcher.mode is None:
+                time.sleep(0.01)
+            initial_ms = (time.perf_counter() - start) * 1000
+            
+            cpu_before = watcher.cpu_seconds
+            time.sleep(idle)
+            idle_cpu = watcher.cpu_seconds - cpu_before
+            
+            visible = []
+            for number in range(installs):
+                directory = os.path.join(root, 'apps', f'vendor{number % 3}', f'{mode}{number}')
+                os.makedirs(directory)
+                installed = time.perf_counter()
+                name = f'{mode}app{number}'
+                with open(os.path.join(directory, f'{name}.exe'), 'wb'):
+                    pass
+                while index.lookup(name) is None and time.perf_counter() - installed < 10:
+                    time.sleep(0.005)
+                visible.append((time.perf_counter() - installed) * 1000)
+            visible.sort()
+            
+            report = watcher.overhead()
+            watcher.stop()
+            report.update({
+                'files': files,
+                'directories': len(index.directories),
+                'initial_ms': initial_ms,
+                'idle_seconds': idle,
+                'idle_cpu_seconds': idle_cpu,
+                'visible_ms_p50': visible[len(visible) // 2],
+                'visible_ms_max': visible[-1],
+            })
+            reports[mode] = report
+        return reports
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def print_benchmark(report: Dict[str, float]) -> None:
+    """Print a benchmark_watcher() report"""
+    print(f"  {report['mode']}: {report['files']:,} files in {report['directories']:,} directories, "
+          f"{report['watches']:,} watches")
+    print(f"  Initial refresh          {report['initial_ms']:9.1f} ms (background)")
+    print(f"  CPU while idle           {report['idle_cpu_seconds'] * 1000:9.1f} ms over {report['idle_seconds']:g}s")
+    print(f"  Install visible after    p50 {report['visible_ms_p50']:.1f} ms, max {report['visible_ms_max']:.1f} ms")
+    print(f"  Watcher CPU in total     {report['cpu_seconds'] * 1000:9.1f} ms ({report['cpu_percent']:.2f}% of a core)")
+    print(f"  Watch memory             {report['memory_bytes'] / 1e6:9.2f} MB (estimate, kernel included)")
+
+
+if __name__ == "__main__":
+    # Benchmark both modes, e.g. python app_watcher.py 100000
+    print("🎯 Benchmarking the application watcher")
+    for report in benchmark_watcher(int(sys.argv[1]) if len(sys.argv) > 1 else 100000).values():
+        print_benchmark(report)
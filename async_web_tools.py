@@ -0,0 +1,299 @@
+"""
+Async Web Tools Module for Nova AI Assistant
+Concurrent web lookups over one pooled asyncio HTTP client
+"""
+
+import asyncio
+import threading
+from typing import Awaitable, Dict, List, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from config import WEB_SETTINGS
+from web_tools import WebTools, WikipediaClient
+
+
+# WebTools methods with coroutine versions here, callable by name from fetch_all()
+ASYNC_METHODS = ['search_wikipedia', 'get_wikipedia_summary', 'get_weather_info',
+                 'get_news_headlines', 'get_definition']
+
+
+class AsyncWikipediaClient(WikipediaClient):
+    """WikipediaClient whose requests are coroutines"""
+    
+    def __init__(self, fetch_json, base_url: str, cache=None, timeout: float = 5.0,
+                 missing_ttl: float = 3600):
+        """
+        Initialize the client
+        
+        Args:
+            fetch_json: Coroutine function (url, params, timeout) -> parsed
+                JSON or None for a 404
+            base_url: Wikipedia site, or a local stand-in
+            cache: Cache for answers, shared with the synchronous client
+            timeout: Seconds to wait for each request
+            missing_ttl: Seconds to remember that an article does not exist
+        """
+        super().__init__(None, base_url, cache, timeout, missing_ttl)
+        self._fetch_json = fetch_json
+    
+    async def _get(self, path: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        self.round_trips += 1
+        return await self._fetch_json(f"{self.base_url}{path}", params, self.timeout)
+    
+    async def summary(self, title: str) -> Optional[Dict]:
+        key = self._summary_key(title)
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached or None
+        
+        page = self._parse_summary(title, await self._get(self._summary_path(title)))
+        if self.cache is not None:
+            self.cache.set(key, page or {}, None if page else self.missing_ttl)
+        return page
+    
+    async def search(self, query: str, limit: int = 5) -> List[str]:
+        key = f"search:{limit}:{query.strip().lower()}"
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached
+        
+        titles = self._parse_search(await self._get(self.SEARCH_PATH, {'q': query, 'limit': limit}))
+        if self.cache is not None:
+            self.cache.set(key, titles)
+        return titles
+
+
+class AsyncWebTools:
+    """Coroutine versions of the WebTools lookups, plus concurrent fan-out"""
+    
+    def __init__(self, web: Optional[WebTools] = None, connections: Optional[int] = None):
+        """
+        Initialize async web tools
+        
+        Args:
+            web: WebTools whose caches, offline indexes and settings are
+                shared; a new one is created if not given
+            connections: Most simultaneous connections in the pool
+        """
+        self.web = web if web is not None else WebTools()
+        self.connections = connections or WEB_SETTINGS.get('async_connections', 10)
+        self.timeout = WEB_SETTINGS.get('request_timeout', 5.0)
+        
+        self._session = None
+        self._session_loop = None
+        
+        wiki = self.web.wiki
+        self.wiki = AsyncWikipediaClient(self._fetch_json, wiki.base_url, wiki.cache,
+                                         wiki.timeout, wiki.missing_ttl)
+    
+    async def __aenter__(self) -> "AsyncWebTools":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def _get_session(self):
+        """Get the pooled session of the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session belongs to the loop it was made on
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connections),
+                headers=dict(self.web.session.headers),
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _fetch_json(self, url: str, params: Optional[Dict], timeout: float) -> Optional[Dict]:
+        """
+        GET a JSON document
+        
+        Returns:
+            Parsed JSON, or None if it does not exist
+        """
+        if aiohttp is None:
+            # Without aiohttp, the shared requests session runs on worker threads
+            def fetch():
+                response = self.web.session.get(url, params=params, timeout=timeout)
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                return response.json()
+            return await asyncio.to_thread(fetch)
+        
+        session = await self._get_session()
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            return await response.json(content_type=None)
+    
+    async def search_wikipedia(self, query: str, sentences: int = 3, resolve_options: bool = False) -> Dict:
+        """
+        Search Wikipedia for information
+        
+        Args:
+            query: Search query
+            sentences: Number of sentences to return in summary
+            resolve_options: For a disambiguation page, also fetch a
+                one-sentence summary of every option, all at once
+        
+        Returns:
+            Dictionary shaped like WebTools.search_wikipedia(), plus
+            option_summaries (title -> sentence) when options were resolved
+        """
+        web = self.web
+        try:
+            offline = web._offline_article(query, sentences)
+            if offline is not None:
+                return offline
+            
+            page = await self.wiki.summary(query)
+            
+            if page is not None and page['type'] != 'disambiguation':
+                return web._article_result(page['title'], page['extract'], page['url'], sentences)
+            
+            if page is not None:
+                result = web._disambiguation_result(query, page, await self.wiki.search(query, 6))
+                if resolve_options and result['options']:
+                    summaries = await self.gather({title: self.get_wikipedia_summary(title, 1)
+                                                   for title in result['options']})
+                    result['option_summaries'] = {title: summary['summary'] for title, summary in summaries.items()
+                                                  if summary.get('success')}
+                return result
+            
+            return web._search_result(query, web._suggest_titles(query) or await self.wiki.search(query, 5))
+        
+        except Exception as e:
+            return web._wikipedia_failure(query, e)
+    
+    async def get_wikipedia_summary(self, title: str, sentences: int = 3) -> Dict:
+        """
+        Get a specific Wikipedia article summary
+        
+        Returns:
+            Dictionary shaped like WebTools.get_wikipedia_summary()
+        """
+        try:
+            offline = self.web._offline_article(title, sentences)
+            page = None if offline is not None else await self.wiki.summary(title)
+            if offline is None and page is None:
+                return {
+                    'success': False,
+                    'message': f"Wikipedia article '{title}' not found"
+                }
+            
+            result = offline or self.web._article_result(title, page['extract'], page['url'], sentences)
+            result['message'] = f"Here's what I found about {title}"
+            return result
+        
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'message': f"Failed to get Wikipedia summary for '{title}'"
+            }
+    
+    async def get_weather_info(self, city: str, api_key: Optional[str] = None) -> Dict:
+        """Coroutine version of WebTools.get_weather_info()"""
+        # On a worker thread, so concurrent askers for a city still share one request
+        return await asyncio.to_thread(self.web.get_weather_info, city, api_key)
+    
+    async def get_news_headlines(self, category: str = "general", count: int = 5) -> Dict:
+        """Coroutine version of WebTools.get_news_headlines()"""
+        # Answered from memory, but on a worker thread like every other
+        # synchronous call, so nothing here can hold up the loop
+        return await asyncio.to_thread(self.web.get_news_headlines, category, count)
+    
+    async def get_definition(self, word: str) -> Dict:
+        """Coroutine version of WebTools.get_definition()"""
+        # The first lookup opens the dictionary index
+        return await asyncio.to_thread(self.web.get_definition, word)
+    
+    async def gather(self, calls: Dict[str, Awaitable[Dict]], timeout: Optional[float] = None,
+                     timeouts: Optional[Dict[str, float]] = None) -> Dict[str, Dict]:
+        """
+        Await several lookups concurrently
+        
+        Args:
+            calls: Name -> coroutine returning a result dictionary
+            timeout: Seconds each call may take, defaults to the request timeout
+            timeouts: Per-name overrides of timeout
+        
+        Returns:
+            Name -> result; calls that time out or fail get a
+            {'success': False, ...} result instead of failing the rest
+        """
+        timeouts = timeouts or {}
+        
+        async def guarded(name: str, call: Awaitable[Dict]) -> Dict:
+            limit = timeouts.get(name, timeout if timeout is not None else self.timeout)
+            try:
+                return await asyncio.wait_for(call, limit)
+            except asyncio.TimeoutError:
+                return {'success': False, 'error': 'timeout', 'message': f"{name} took longer than {limit:g}s"}
+            except Exception as e:
+                return {'success': False, 'error': str(e), 'message': f"{name} failed"}
+        
+        results = await asyncio.gather(*(guarded(name, call) for name, call in calls.items()))
+        return dict(zip(calls, results))
+    
+    async def run_calls(self, calls: Dict[str, Tuple], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Fan out calls given by method name, for synchronous callers
+        
+        Args:
+            calls: Name -> (method name, *arguments), method names from ASYNC_METHODS
+            timeout: Seconds each call may take
+        
+        Returns:
+            Name -> result
+        """
+        coroutines = {}
+        for name, (method, *arguments) in calls.items():
+            if method not in ASYNC_METHODS:
+                raise ValueError(f"Unknown lookup '{method}', expected one of: {', '.join(ASYNC_METHODS)}")
+            coroutines[name] = getattr(self, method)(*arguments)
+        return await self.gather(coroutines, timeout)
+
+
+class EventLoopThread:
+    """An asyncio event loop on a daemon thread, for running coroutines from synchronous code"""
+    
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="nova-web-loop", daemon=True)
+                self._thread.start()
+            return self._loop
+    
+    def run(self, coroutine, timeout: Optional[float] = None):
+        """Run a coroutine on the loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_started()).result(timeout)
+    
+    def stop(self) -> None:
+        """Stop the loop and its thread"""
+        with self._lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=2)
+            self._loop.close()
+            self._loop = None
+            self._thread = None
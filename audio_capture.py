@@ -0,0 +1,275 @@
+"""
+Audio Capture Module for Nova AI Assistant
+Keeps one microphone stream open and shares its audio through a ring buffer
+"""
+
+import math
+import threading
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+import speech_recognition as sr
+
+try:
+    import audioop
+except ImportError:  # Removed from the standard library in Python 3.13
+    audioop = None
+
+
+def chunk_rms(chunk: bytes, sample_width: int = 2) -> float:
+    """
+    Root mean square energy of a chunk of PCM audio
+    
+    Args:
+        chunk: Raw little-endian PCM samples
+        sample_width: Bytes per sample
+    
+    Returns:
+        RMS energy on the same scale as speech_recognition's energy_threshold
+    """
+    if not chunk:
+        return 0.0
+    if audioop is not None:
+        return float(audioop.rms(chunk, sample_width))
+    
+    samples = array({1: 'b', 2: 'h', 4: 'i'}[sample_width])
+    samples.frombytes(chunk[:len(chunk) - len(chunk) % sample_width])
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+
+
+class AudioRingBuffer:
+    """Fixed-size buffer of audio chunks addressed by sequence number"""
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the buffer
+        
+        Args:
+            capacity: Number of chunks kept before the oldest is overwritten
+        """
+        self.capacity = capacity
+        self._chunks: List[Optional[bytes]] = [None] * capacity
+        self._next = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        
+        # Chunks readers skipped because they fell a full buffer behind
+        self.dropped = 0
+    
+    @property
+    def latest(self) -> int:
+        """Sequence number the next written chunk will get"""
+        return self._next
+    
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk, overwriting the oldest one when full"""
+        with self._condition:
+            self._chunks[self._next % self.capacity] = chunk
+            self._next += 1
+            self._condition.notify_all()
+    
+    def read(self, sequence: int, timeout: Optional[float] = None) -> Tuple[Optional[bytes], int]:
+        """
+        Read the chunk with a given sequence number, waiting for it if needed
+        
+        Args:
+            sequence: Sequence number to read
+            timeout: Seconds to wait for new audio, None to wait forever
+        
+        Returns:
+            Tuple of (chunk, next sequence number); chunk is None on timeout
+            or once the buffer is closed and drained
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: sequence < self._next or self._closed, timeout):
+                return None, sequence
+            if sequence >= self._next:
+                return None, sequence
+            
+            oldest = max(0, self._next - self.capacity)
+            if sequence < oldest:
+                # The writer lapped this reader, resume at the oldest chunk left
+                self.dropped += oldest - sequence
+                sequence = oldest
+            
+            return self._chunks[sequence % self.capacity], sequence + 1
+    
+    def close(self) -> None:
+        """Wake every waiting reader and stop accepting waits"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+class _BufferedStream:
+    """File-like reader over an AudioRingBuffer, one chunk per read"""
+    
+    def __init__(self, buffer: AudioRingBuffer, sequence: int, read_timeout: float):
+        self.buffer = buffer
+        self.sequence = sequence
+        self.read_timeout = read_timeout
+    
+    def read(self, size: int) -> bytes:
+        chunk, self.sequence = self.buffer.read(self.sequence, self.read_timeout)
+        # An empty read ends Recognizer.listen the same way end of file does
+        return chunk or b""
+
+
+class BufferedAudioSource(sr.AudioSource):
+    """speech_recognition audio source reading from a CaptureStream's ring buffer"""
+    
+    def __init__(self, capture: "CaptureStream", sequence: int):
+        self.SAMPLE_RATE = capture.sample_rate
+        self.SAMPLE_WIDTH = capture.sample_width
+        self.CHUNK = capture.chunk_size
+        self.stream = _BufferedStream(capture.buffer, sequence, capture.read_timeout)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+    
+    @property
+    def position(self) -> int:
+        """Sequence number of the next chunk this source will read"""
+        return self.stream.sequence
+
+
+class CaptureStream:
+    """Long-lived capture thread feeding a ring buffer and a noise floor estimate"""
+    
+    def __init__(self, open_source: Optional[Callable[[], sr.AudioSource]] = None,
+                 buffer_seconds: float = 30.0, read_timeout: float = 2.0):
+        """
+        Initialize the capture stream
+        
+        Args:
+            open_source: Returns an unopened speech_recognition audio source,
+                defaults to sr.Microphone
+            buffer_seconds: Seconds of audio kept for listeners
+            read_timeout: Seconds a listener waits for audio before giving up
+        """
+        self.open_source = open_source or sr.Microphone
+        self.buffer_seconds = buffer_seconds
+        self.read_timeout = read_timeout
+        
+        self.sample_rate = 16000
+        self.sample_width = 2
+        self.chunk_size = 1024
+        self.buffer: Optional[AudioRingBuffer] = None
+        
+        # Background energy, tracked continuously instead of calibrating per listen
+        self.noise_floor: Optional[float] = None
+        self.chunks_captured = 0
+        
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._ready = threading.Event()
+        self._error: Optional[Exception] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the capture thread is running"""
+        return self._running and self._thread is not None and self._thread.is_alive()
+    
+    def start(self, timeout: float = 5.0) -> bool:
+        """
+        Open the device and start capturing
+        
+        Args:
+            timeout: Seconds to wait for the device to open
+        
+        Returns:
+            True if capture is running
+        """
+        if self.is_running:
+            return True
+        
+        self._running = True
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._capture_loop, name="nova-capture", daemon=True)
+        self._thread.start()
+        
+        if not self._ready.wait(timeout) or self._error is not None:
+            self._running = False
+            print(f"❌ Could not start audio capture: {self._error or 'device did not open'}")
+            return False
+        return True
+    
+    def stop(self) -> None:
+        """Stop capturing and release the device"""
+        self._running = False
+        if self.buffer is not None:
+            self.buffer.close()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+    
+    def _capture_loop(self):
+        """Read chunks from the device until stopped"""
+        try:
+            with self.open_source() as source:
+                self.sample_rate = source.SAMPLE_RATE
+                self.sample_width = source.SAMPLE_WIDTH
+                self.chunk_size = source.CHUNK
+                
+                chunks_per_second = self.sample_rate / self.chunk_size
+                self.buffer = AudioRingBuffer(max(1, int(self.buffer_seconds * chunks_per_second)))
+                self._ready.set()
+                
+                while self._running:
+                    chunk = source.stream.read(source.CHUNK)
+                    if not chunk:
+                        break
+                    self._update_noise_floor(chunk_rms(chunk, self.sample_width))
+                    self.buffer.write(chunk)
+                    self.chunks_captured += 1
+        except Exception as e:
+            self._error = e
+            if self._ready.is_set():
+                print(f"❌ Audio capture stopped: {e}")
+        finally:
+            self._running = False
+            if self.buffer is not None:
+                self.buffer.close()
+            self._ready.set()
+    
+    def _update_noise_floor(self, energy: float):
+        """Follow quiet stretches quickly and loud ones slowly"""
+        if self.noise_floor is None:
+            self.noise_floor = energy
+        elif energy < self.noise_floor:
+            self.noise_floor += (energy - self.noise_floor) * 0.5
+        else:
+            self.noise_floor += (energy - self.noise_floor) * 0.005
+    
+    def energy_threshold(self, ratio: float = 1.5, default: float = 4000) -> float:
+        """
+        Speech energy threshold from the current noise floor
+        
+        Args:
+            ratio: Multiple of the noise floor that counts as speech
+            default: Threshold to use before any audio has been seen
+        """
+        if self.noise_floor is None:
+            return default
+        # Keep silence from dropping the threshold to nothing
+        return max(self.noise_floor * ratio, 50.0)
+    
+    def source(self, position: Optional[int] = None) -> BufferedAudioSource:
+        """
+        Get an audio source for speech_recognition backed by the ring buffer
+        
+        Args:
+            position: Sequence number to start reading at, defaults to the
+                newest audio
+        """
+        if self.buffer is None:
+            raise RuntimeError("Audio capture is not running")
+        if position is None:
+            position = self.buffer.latest
+        return BufferedAudioSource(self, position)
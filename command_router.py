@@ -0,0 +1,219 @@
+"""
+Command Router Module for Nova AI Assistant
+Shared intent registration and dispatch for every Nova front end
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from config import SYSTEM_SETTINGS
+from intent_matcher import IntentMatcher
+
+
+# handler(assistant, command, parameter) -> response
+CommandHandler = Callable[[object, str, Optional[str]], Optional[str]]
+
+
+def normalize_command(command: str) -> str:
+    """Lowercase a command and collapse its whitespace"""
+    return " ".join(command.lower().split())
+
+
+class CommandRouter:
+    """Routes commands to registered intent handlers"""
+    
+    def __init__(self, name: str, cache_size: Optional[int] = None):
+        """
+        Initialize an empty router
+        
+        Args:
+            name: Name of the command table, e.g. 'nova' or 'gui'
+            cache_size: Number of resolved commands to remember, defaults
+                to SYSTEM_SETTINGS['resolution_cache_size']; 0 disables
+        """
+        self.name = name
+        self.command_patterns: Dict[str, List[str]] = {}
+        self.parameter_groups: Dict[str, Union[int, str]] = {}
+        self.handlers: Dict[str, CommandHandler] = {}
+        self.fallback: Optional[CommandHandler] = None
+        
+        self._matcher: Optional[IntentMatcher] = None
+        self._lock = threading.Lock()
+        
+        # Normalized command -> (intent, parameter), least recently used first.
+        # Only resolutions are cached, never responses.
+        if cache_size is None:
+            cache_size = SYSTEM_SETTINGS.get('resolution_cache_size', 512)
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: "OrderedDict[str, Tuple[Optional[str], Optional[str]]]" = OrderedDict()
+    
+    def register(self, intent: str, patterns: List[str], handler: CommandHandler,
+                 parameter_group: Optional[Union[int, str]] = None) -> None:
+        """
+        Register an intent
+        
+        Intents are tried in registration order, so register the most
+        specific ones first.
+        
+        Args:
+            intent: Intent name
+            patterns: Regex patterns recognizing the intent
+            handler: Called as handler(assistant, command, parameter)
+            parameter_group: Capture group holding the command parameter, if
+                any: a number (1-based, within the matching pattern) or a
+                name, for patterns whose parameters sit in different places
+        """
+        with self._lock:
+            self.command_patterns[intent] = list(patterns)
+            self.handlers[intent] = handler
+            if parameter_group is not None:
+                self.parameter_groups[intent] = parameter_group
+            else:
+                self.parameter_groups.pop(intent, None)
+            
+            # Recompiled on next use
+            self._matcher = None
+            self._cache.clear()
+    
+    def reload(self, setup: Callable[["CommandRouter"], None]) -> None:
+        """
+        Replace the whole command table
+        
+        Args:
+            setup: Called with this router to register its intents again
+        """
+        with self._lock:
+            self.command_patterns.clear()
+            self.parameter_groups.clear()
+            self.handlers.clear()
+            self.fallback = None
+            self._matcher = None
+            self._cache.clear()
+        
+        setup(self)
+    
+    def set_fallback(self, handler: CommandHandler) -> None:
+        """
+        Set the handler for commands that match no intent
+        
+        Args:
+            handler: Called as handler(assistant, command, None)
+        """
+        self.fallback = handler
+    
+    def _get_matcher(self) -> IntentMatcher:
+        """Get the compiled matcher, building it after registration changes"""
+        matcher = self._matcher
+        if matcher is None:
+            with self._lock:
+                if self._matcher is None:
+                    self._matcher = IntentMatcher(self.command_patterns, self.parameter_groups)
+                matcher = self._matcher
+        return matcher
+    
+    def resolve(self, command: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve a command to an intent without running its handler
+        
+        Repeated commands are answered from the resolution cache, keyed on
+        the normalized command text.
+        
+        Args:
+            command: Command text
+        
+        Returns:
+            Tuple of (intent, parameter); intent is None for unknown commands
+        """
+        key = normalize_command(command)
+        if self.cache_size <= 0:
+            return self._get_matcher().match(key)
+        
+        with self._lock:
+            resolved = self._cache.get(key)
+            if resolved is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return resolved
+            self.cache_misses += 1
+        
+        matcher = self._get_matcher()
+        resolved = matcher.match(key)
+        
+        with self._lock:
+            # Skip results from a table replaced while matching
+            if self._matcher is matcher:
+                self._cache[key] = resolved
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        
+        return resolved
+    
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Get resolution cache statistics
+        
+        Returns:
+            Dictionary with hits, misses, size and max_size
+        """
+        with self._lock:
+            return {
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'size': len(self._cache),
+                'max_size': self.cache_size,
+            }
+    
+    def clear_cache(self) -> None:
+        """Forget every cached resolution and reset the counters"""
+        with self._lock:
+            self._cache.clear()
+            self.cache_hits = 0
+            self.cache_misses = 0
+    
+    def dispatch(self, assistant: object, command: str) -> Optional[str]:
+        """
+        Resolve a command and run its handler
+        
+        Args:
+            assistant: Front end instance passed to the handler
+            command: Lowercased command text
+        
+        Returns:
+            The handler's response, or None if nothing handled the command
+        """
+        intent, parameter = self.resolve(command)
+        
+        if intent is not None:
+            return self.handlers[intent](assistant, command, parameter)
+        if self.fallback is not None:
+            return self.fallback(assistant, command, None)
+        return None
+
+
+# One router per command table, shared by every instance in the process
+_routers: Dict[str, CommandRouter] = {}
+_routers_lock = threading.Lock()
+
+
+def get_router(name: str, setup: Callable[[CommandRouter], None]) -> CommandRouter:
+    """
+    Get the process-wide router for a command table, building it once
+    
+    Args:
+        name: Name of the command table
+        setup: Called with the new router to register its intents; only
+            runs the first time the table is requested
+    
+    Returns:
+        The shared CommandRouter
+    """
+    with _routers_lock:
+        router = _routers.get(name)
+        if router is None:
+            router = CommandRouter(name)
+            setup(router)
+            _routers[name] = router
+        return router
@@ -10,6 +10,25 @@ VOICE_SETTINGS = {
     'volume': 0.9,        # Volume level (0.0 to 1.0)
     'timeout': 5,         # Seconds to wait for speech to start
     'phrase_time_limit': 10,  # Maximum seconds for a single phrase
+    'persistent_microphone': True,  # Keep one microphone stream open between listens
+    'capture_buffer_seconds': 30,  # Seconds of audio kept in the capture ring buffer
+    'vad': 'numpy',  # Phrase detection: 'numpy' (energy/ZCR detector) or 'recognizer'
+    'vad_hangover_ms': 300,  # Silence that ends a phrase
+    'vad_threshold_ratio': 3.0,  # Multiple of the noise floor that counts as speech
+    'wake_word_model': 'config/wake_word.npz',  # Templates from `python wake_word.py enroll`; recognizer used if missing
+    'wake_word_threshold': None,  # Override the template distance threshold stored with the templates
+    'stt_backend': 'google',  # Speech-to-text engine: 'google', 'vosk' (offline) or 'http'
+    'stt_language': 'en-US',  # Language for the Google backend
+    'vosk_model_path': 'models/vosk-model-small-en-us',  # Unpacked Vosk model for offline recognition
+    'stt_server_url': 'http://127.0.0.1:8765/recognize',  # Endpoint for the http backend
+    'stt_timeout': 10,  # Seconds to wait for the http backend
+    'tts_cache': True,  # Play fixed phrases from rendered WAV files instead of synthesizing them each time
+    'tts_cache_dir': 'cache/tts',  # Where rendered phrases are kept
+    'tts_cache_max_mb': 50,  # Disk budget for rendered phrases
+    'tts_cache_prewarm': False,  # Render all fixed phrases in the background at startup
+    'tts_sentence_chunking': True,  # Speak long responses a sentence at a time so audio starts sooner
+    'voice_pipeline': True,  # Capture the next command while the last response is being worked out and spoken
+    'pipeline_queue_size': 2,  # Commands allowed to wait between two pipeline stages
 }
 
 # Personality Settings
@@ -31,6 +50,18 @@ SYSTEM_SETTINGS = {
         'teams', 'zoom', 'skype'
     ],
     'volume_step': 10,  # Volume change increment
+    'volume_backend': 'auto',  # pycaw on Windows, pulse or alsa on Linux; 'fake' for testing
+    'alsa_control': 'Master',  # ALSA mixer control the alsa backend sets
+    'app_index_path': 'cache/app_index.json',  # Installed applications, refreshed incrementally
+    'app_index_max_depth': 8,  # Directory levels searched below each application root
+    'app_watcher': True,  # Update the application index in the background as apps are installed
+    'app_watch_inotify': True,  # Use inotify on Linux; otherwise directories are polled
+    'app_watch_interval': 30,  # Seconds between polls when not using inotify
+    'process_sample_interval': 2.0,  # Seconds between process table samples; CPU usage is averaged over it
+    'process_top_size': 50,  # Busiest processes kept ready in each sample
+    'telemetry_interval': 30,  # Seconds between refreshes of memory, CPU and disk metrics
+    'telemetry_partition_timeout': 1.0,  # Seconds a partition may take before its last reading is reused
+    'resolution_cache_size': 512,  # Resolved commands remembered per command table
 }
 
 # Web Tools Settings
@@ -38,13 +69,61 @@ WEB_SETTINGS = {
     'wikipedia_sentences': 3,  # Default number of sentences for Wikipedia summaries
     'search_results_limit': 5,  # Number of search results to return
     'news_categories': ['general', 'technology', 'science'],  # Available news categories
+    'request_timeout': 5,  # Seconds to wait for web APIs
+    'async_connections': 10,  # Connection pool size for concurrent lookups
+    'wikipedia_url': 'https://en.wikipedia.org',  # Wikipedia site, or a local_servers.py stand-in
+    'wikipedia_cache_dir': 'cache/wikipedia',  # Disk cache for Wikipedia answers, None for memory only
+    'wikipedia_cache_ttl': 24 * 3600,  # Seconds a cached Wikipedia answer stays fresh
+    'wikipedia_cache_entries': 2000,  # Most Wikipedia answers kept on disk; least recently used go first
+    'wikipedia_index': 'data/wikipedia.idx',  # Offline summaries from `python wiki_index.py build`; skipped if missing
+    'wikipedia_titles': 'data/wikipedia_titles.idx',  # Trigram title index from `python fuzzy_titles.py build`; skipped if missing
+    'news_feeds': {  # RSS/Atom feeds per news category, used unless API_KEYS['newsapi'] is set
+        'general': ['https://feeds.bbci.co.uk/news/rss.xml'],
+        'technology': ['https://feeds.bbci.co.uk/news/technology/rss.xml'],
+        'science': ['https://feeds.bbci.co.uk/news/science_and_environment/rss.xml'],
+    },
+    'news_refresh_interval': 900,  # Seconds between background news refreshes
+    'news_store_size': 50,  # Headlines kept in memory per category
+    'newsapi_url': 'https://newsapi.org',  # NewsAPI, or a local_servers.py stand-in
+    'dictionary_index': 'data/dictionary.idx',  # Definitions from `python lexicon.py build`; skipped if missing
+    'translation_backend': 'phrasebook',  # phrasebook (offline) or libretranslate
+    'translation_url': 'http://127.0.0.1:5000',  # LibreTranslate server, or a local_servers.py stand-in
+    'translation_cache_dir': 'cache/translations',  # Disk cache for translations, None for memory only
+    'translation_cache_ttl': 30 * 24 * 3600,  # Seconds a cached translation stays fresh
+    'translation_cache_entries': 5000,  # Most translations kept on disk; least recently used go first
+}
+
+# Websites Nova can open by name
+BROWSER_SITES = {
+    'google': 'https://www.google.com',
+    'youtube': 'https://www.youtube.com',
+    'github': 'https://github.com',
+    'stackoverflow': 'https://stackoverflow.com',
+    'reddit': 'https://www.reddit.com',
+    'twitter': 'https://twitter.com',
+    'linkedin': 'https://linkedin.com',
+    'facebook': 'https://facebook.com',
+    'instagram': 'https://instagram.com',
+    'netflix': 'https://netflix.com',
+    'spotify': 'https://open.spotify.com',
+    'amazon': 'https://amazon.com',
+    'wikipedia': 'https://wikipedia.org',
+    'news': 'https://news.google.com',
+    'weather': 'https://weather.com',
+    'maps': 'https://maps.google.com',
+    'gmail': 'https://gmail.com',
+    'drive': 'https://drive.google.com',
+    'calendar': 'https://calendar.google.com',
+    'translate': 'https://translate.google.com'
 }
 
 # Weather Settings (for future API integration)
 WEATHER_SETTINGS = {
-    'default_city': 'your area',
+    'default_city': None,  # City for "what's the weather" when none is named; None to ask
     'api_key': None,  # OpenWeatherMap API key
     'units': 'metric',  # metric or imperial
+    'base_url': 'https://api.openweathermap.org',  # Or a local stand-in
+    'cache_ttl': 600,  # Seconds to reuse a city's weather
 }
 
 # Logging Settings
@@ -109,6 +188,7 @@ API_KEYS = {
     'newsapi': None,         # Get from https://newsapi.org/
     'youtube': None,         # Get from Google Cloud Console
     'google_translate': None, # Get from Google Cloud Console
+    'libretranslate': None,  # Only if your LibreTranslate server requires one
 }
 
 # Paths and Directories
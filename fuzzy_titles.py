@@ -0,0 +1,325 @@
+"""
+Fuzzy Titles Module for Nova AI Assistant
+Ranked suggestions for misheard article titles from an on-disk trigram index
+"""
+
+import glob
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+import numpy as np
+
+from wiki_index import normalize_title
+
+
+MAGIC = b'NOVATRGM'
+VERSION = 1
+
+# magic, version, bucket bits, title count, posting count, then the offset
+# of each section: bucket offsets, postings, trigram counts, title offsets, titles
+HEADER = struct.Struct('<8sIIQQQQQQQ')
+
+
+def title_trigrams(title: str, buckets: int) -> Set[int]:
+    """
+    Hashed trigrams of a title
+    
+    Each word is padded with spaces, so word starts and ends count extra
+    and word order matters little. Distinct trigrams can share a bucket;
+    that only blurs the ranking a little.
+    """
+    padded = f"  {normalize_title(title)} ".replace(' ', '  ')
+    mask = buckets - 1
+    return {zlib.crc32(padded[index:index + 3].encode('utf-8')) & mask
+            for index in range(len(padded) - 2) if not padded[index:index + 3].isspace()}
+
+
+def build_trigram_index(titles: Iterable[str], path: str, bucket_bits: int = 20) -> int:
+    """
+    Write a trigram index over article titles
+    
+    Args:
+        titles: Titles to index; duplicates (ignoring case) are skipped
+        path: Index file to write
+        bucket_bits: log2 of the number of trigram hash buckets
+    
+    Returns:
+        Number of titles indexed
+    """
+    buckets = 1 << bucket_bits
+    # (bucket << 32) | title number, sorted later to group postings by bucket
+    pairs = array('Q')
+    counts = array('B')
+    title_offsets = array('Q', [0])
+    seen = set()
+    
+    with tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(path))) as title_blob:
+        for title in titles:
+            key = normalize_title(title)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            
+            number = len(counts)
+            grams = title_trigrams(title, buckets)
+            pairs.extend((gram << 32) | number for gram in grams)
+            counts.append(min(len(grams), 255))
+            
+            encoded = title.encode('utf-8')
+            title_blob.write(encoded)
+            title_offsets.append(title_offsets[-1] + len(encoded))
+        seen.clear()
+        
+        ordered = np.frombuffer(pairs, dtype=np.uint64) if pairs else np.zeros(0, dtype=np.uint64)
+        ordered.sort()
+        postings = (ordered & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        bucket_offsets = np.searchsorted(ordered >> np.uint64(32), np.arange(buckets + 1, dtype=np.uint64)).astype(np.uint64)
+        del ordered, pairs
+        
+        count = len(counts)
+        bucket_offsets_at = HEADER.size
+        postings_at = bucket_offsets_at + 8 * (buckets + 1)
+        counts_at = postings_at + 4 * len(postings)
+        title_offsets_at = counts_at + count
+        title_offsets_at += -title_offsets_at % 8
+        titles_at = title_offsets_at + 8 * (count + 1)
+        
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as index_file:
+            index_file.write(HEADER.pack(MAGIC, VERSION, bucket_bits, count, len(postings),
+                                         bucket_offsets_at, postings_at, counts_at,
+                                         title_offsets_at, titles_at))
+            bucket_offsets.tofile(index_file)
+            postings.tofile(index_file)
+            counts.tofile(index_file)
+            index_file.write(b'\x00' * (title_offsets_at - index_file.tell()))
+            title_offsets.tofile(index_file)
+            
+            title_blob.seek(0)
+            while True:
+                block = title_blob.read(1 << 20)
+                if not block:
+                    break
+                index_file.write(block)
+        os.replace(temp_path, path)
+    
+    return count
+
+
+class TrigramIndex:
+    """Memory-mapped trigram index; only the pages a query touches are read"""
+    
+    def __init__(self, path: str, posting_budget: int = 200000, shortlist: int = 200):
+        """
+        Map an index file
+        
+        Args:
+            path: File written by build_trigram_index()
+            posting_budget: Postings read per query, rarest trigrams first;
+                common trigrams say little and cost the most
+            shortlist: Candidates rescored exactly against the whole query
+        
+        Raises:
+            ValueError: The file is not a trigram index
+        """
+        self.path = path
+        self.posting_budget = posting_budget
+        self.shortlist = shortlist
+        with open(path, 'rb') as index_file:
+            self._map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        (magic, version, bucket_bits, count, posting_count, bucket_offsets_at, postings_at,
+         counts_at, title_offsets_at, titles_at) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a Nova trigram index")
+        
+        self.buckets = 1 << bucket_bits
+        self.count = count
+        self._bucket_offsets = np.frombuffer(self._map, np.uint64, self.buckets + 1, bucket_offsets_at)
+        self._postings = np.frombuffer(self._map, np.uint32, posting_count, postings_at)
+        self._counts = np.frombuffer(self._map, np.uint8, count, counts_at)
+        self._title_offsets = np.frombuffer(self._map, np.uint64, count + 1, title_offsets_at)
+        self._titles_at = titles_at
+        
+        # Seconds per suggest() call
+        self.latencies: List[float] = []
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __enter__(self) -> "TrigramIndex":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """Unmap the file"""
+        # NumPy views must go before the map can close
+        self._bucket_offsets = self._postings = self._counts = self._title_offsets = None
+        self._map.close()
+    
+    def title(self, number: int) -> str:
+        """Title by its number in the index"""
+        start = self._titles_at + int(self._title_offsets[number])
+        end = self._titles_at + int(self._title_offsets[number + 1])
+        return self._map[start:end].decode('utf-8')
+    
+    def suggest(self, query: str, limit: int = 5, min_score: float = 0.3) -> List[Tuple[str, float]]:
+        """
+        Rank titles by trigram similarity to a query
+        
+        Args:
+            query: Possibly misspelled title
+            limit: Most suggestions to return
+            min_score: Lowest Dice similarity (0 to 1) worth suggesting
+        
+        Returns:
+            (title, score) pairs, best first
+        """
+        start = time.perf_counter()
+        grams = title_trigrams(query, self.buckets)
+        
+        # Candidates come from the rarest trigrams, within the posting budget
+        spans = sorted((int(self._bucket_offsets[gram + 1]) - int(self._bucket_offsets[gram]),
+                        int(self._bucket_offsets[gram])) for gram in grams)
+        lists = []
+        used = 0
+        for size, begin in spans:
+            if size == 0:
+                continue
+            if lists and used + size > self.posting_budget:
+                break
+            lists.append(self._postings[begin:begin + size])
+            used += size
+        
+        suggestions = []
+        if lists:
+            candidates, shared = np.unique(np.concatenate(lists), return_counts=True)
+            if len(candidates) > self.shortlist:
+                partial = shared / (len(grams) + self._counts[candidates].astype(np.float32))
+                candidates = candidates[np.argpartition(-partial, self.shortlist - 1)[:self.shortlist]]
+            
+            # Exact Dice similarity over every trigram of the shortlist
+            for number in candidates:
+                title = self.title(int(number))
+                title_grams = title_trigrams(title, self.buckets)
+                score = 2.0 * len(grams & title_grams) / (len(grams) + len(title_grams))
+                if score >= min_score:
+                    suggestions.append((title, score))
+            suggestions.sort(key=lambda suggestion: -suggestion[1])
+            del suggestions[limit:]
+        
+        self.latencies.append(time.perf_counter() - start)
+        return suggestions
+    
+    def latency_report(self) -> Dict[str, float]:
+        """
+        Summarize suggestion latency so far
+        
+        Returns:
+            Dictionary with count and p50/p95/max in milliseconds
+        """
+        if not self.latencies:
+            return {'count': 0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        
+        ordered = np.sort(np.array(self.latencies)) * 1000
+        return {
+            'count': len(ordered),
+            'p50_ms': float(np.percentile(ordered, 50)),
+            'p95_ms': float(np.percentile(ordered, 95)),
+            'max_ms': float(ordered[-1]),
+        }
+
+
+def titles_from_cache(cache_dir: str) -> Iterator[str]:
+    """
+    Titles seen in Wikipedia answers cached by web_cache.TTLCache
+    
+    Yields:
+        Article titles from cached summaries and searches
+    """
+    for path in glob.glob(os.path.join(cache_dir, '*.json')):
+        try:
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                value = json.load(cache_file).get('value')
+        except (OSError, ValueError):
+            continue
+        
+        if isinstance(value, dict) and value.get('title'):
+            yield value['title']
+        elif isinstance(value, list):
+            yield from (title for title in value if isinstance(title, str))
+
+
+def misspell(title: str, seed: int) -> str:
+    """Swap two neighbouring letters and drop one, roughly as a bad transcript would"""
+    letters = list(title)
+    if len(letters) > 4:
+        position = 1 + seed % (len(letters) - 3)
+        letters[position], letters[position + 1] = letters[position + 1], letters[position]
+        del letters[(seed * 7) % len(letters)]
+    return "".join(letters)
+
+
+if __name__ == "__main__":
+    # Build and query trigram indexes
+    usage = [
+        "  python fuzzy_titles.py build --from-index data/wikipedia.idx data/wikipedia_titles.idx",
+        "  python fuzzy_titles.py build --from-cache cache/wikipedia data/wikipedia_titles.idx",
+        "  python fuzzy_titles.py suggest data/wikipedia_titles.idx \"alan turnig\"",
+        "  python fuzzy_titles.py bench data/wikipedia_titles.idx [queries]",
+    ]
+    arguments = sys.argv[1:]
+    if len(arguments) < (2 if arguments[:1] == ['bench'] else 3) or arguments[0] not in ('build', 'suggest', 'bench'):
+        print("Usage:")
+        print("\n".join(usage))
+        sys.exit(1)
+    
+    action = arguments[0]
+    if action == 'build':
+        if arguments[1] not in ('--from-index', '--from-cache') or len(arguments) < 4:
+            print("Usage:")
+            print("\n".join(usage))
+            sys.exit(1)
+        
+        if arguments[1] == '--from-index':
+            from wiki_index import WikiIndex
+            source = WikiIndex(arguments[2])
+            titles = source.titles()
+        else:
+            titles = titles_from_cache(arguments[2])
+        
+        start = time.perf_counter()
+        count = build_trigram_index(titles, arguments[3])
+        print(f"✅ Indexed {count:,} titles into {arguments[3]} "
+              f"({os.path.getsize(arguments[3]) / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s")
+    
+    elif action == 'suggest':
+        with TrigramIndex(arguments[1]) as index:
+            for title, score in index.suggest(" ".join(arguments[2:])):
+                print(f"  {score:.2f}  {title}")
+            print(f"⚡ {index.latencies[-1] * 1000:.2f} ms")
+    
+    else:
+        with TrigramIndex(arguments[1]) as index:
+            queries = int(arguments[2]) if len(arguments) > 2 else 1000
+            step = max(1, index.count // queries)
+            found = 0
+            for seed, number in enumerate(range(0, index.count, step)):
+                title = index.title(number)
+                found += any(suggestion == title for suggestion, _ in index.suggest(misspell(title, seed)))
+            
+            report = index.latency_report()
+            print(f"📚 {index.count:,} titles, {report['count']:,} misspelled queries, "
+                  f"{found / report['count']:.0%} found the intended title")
+            print(f"⚡ p50 {report['p50_ms']:.2f} ms, p95 {report['p95_ms']:.2f} ms, max {report['max_ms']:.2f} ms")
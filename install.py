@@ -89,7 +89,6 @@ def test_imports():
         'speech_recognition',
         'pyttsx3',
         'pywhatkit',
-        'wikipedia',
         'requests',
         'PIL',
         'pyautogui',
@@ -0,0 +1,470 @@
+"""
+Intent Matcher Module for Nova AI Assistant
+Compiles a command pattern table into a single regex automaton
+"""
+
+import re
+import warnings
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
+# The regex parser is private in Python 3.11+, where the public sre_* names
+# are deprecated aliases; without either, every command takes the plain ladder
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            import sre_parse
+            import sre_constants
+    except ImportError:
+        sre_parse = None
+        sre_constants = None
+
+
+# Commands are split into tokens the same way \b sees word boundaries
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Named groups and their backreferences, renamed per branch in the combined regex
+NAMED_GROUP_PATTERN = re.compile(r"\(\?P([<=])(\w+)")
+
+# Compiled automata kept per candidate set
+AUTOMATON_CACHE_SIZE = 256
+
+# Limits on spelling out a pattern when looking for its anchor words
+MAX_PATTERN_VARIANTS = 64
+MAX_CHARSET_EXPANSION = 8
+
+
+class IntentMatcher:
+    """Matches commands against a pattern table with one combined regex"""
+    
+    def __init__(self, command_patterns: Dict[str, List[str]],
+                 parameter_groups: Optional[Dict[str, Union[int, str]]] = None):
+        """
+        Compile the pattern table
+        
+        Args:
+            command_patterns: Ordered mapping of intent -> regex patterns.
+                Intents earlier in the mapping win over later ones.
+            parameter_groups: Mapping of intent -> capture group holding the
+                command parameter: a number (1-based, within the matching
+                pattern) or a group name, looked up in each pattern
+        """
+        self.command_patterns = command_patterns
+        self.parameter_groups = parameter_groups or {}
+        
+        # Flattened (intent, pattern, parameter group) list in priority order
+        self._alternatives: List[Tuple[str, str, Optional[Union[int, str]]]] = [
+            (intent, pattern, self.parameter_groups.get(intent))
+            for intent, patterns in self.command_patterns.items()
+            for pattern in patterns
+        ]
+        # Alternatives whose matches always begin at a word character
+        self._word_start_mask = 0
+        # Anchor token -> bitmask of alternatives that can only match when it is present
+        self.anchor_index: Dict[str, int] = {}
+        # Bitmask of alternatives with no anchor, tried for every command
+        self.fallback = 0
+        # Candidate bitmask -> compiled automaton, least recently used first
+        self._automata: "OrderedDict[int, Tuple[re.Pattern, Dict[int, Tuple[int, Optional[int]]]]]" = OrderedDict()
+        
+        # Set when the table cannot be indexed or combined, so that every
+        # command is matched one pattern at a time instead
+        self.ladder = sre_parse is None
+        if not self.ladder:
+            try:
+                for index, (_, pattern, _) in enumerate(self._alternatives):
+                    if _starts_with_word(pattern):
+                        self._word_start_mask |= 1 << index
+                self._build_anchor_index()
+            except Exception as e:
+                print(f"Warning: Could not index command patterns, matching them one by one: {e}")
+                self.ladder = True
+    
+    def _build_anchor_index(self):
+        """Index every alternative under the literal words it cannot match without"""
+        spellings = [_spelling_words(pattern) for _, pattern, _ in self._alternatives]
+        
+        # Words used by many patterns, like "me" or "what", let through many
+        # commands, so anchors are chosen among the rarer ones
+        usage: Dict[str, int] = {}
+        for words in spellings:
+            for word in set().union(*words) if words else ():
+                usage[word] = usage.get(word, 0) + 1
+        
+        for index, words in enumerate(spellings):
+            if words is None:
+                self.fallback |= 1 << index
+                continue
+            for word in _anchor_words(words, usage):
+                self.anchor_index[word] = self.anchor_index.get(word, 0) | 1 << index
+    
+    def candidates(self, command: str) -> int:
+        """
+        Get the alternatives worth running the regex for
+        
+        Args:
+            command: Lowercased command text
+        
+        Returns:
+            Bitmask of alternative indices
+        """
+        if not self.anchor_index:
+            return self.fallback
+        
+        found = self.fallback
+        anchor_index = self.anchor_index
+        # Splitting on spaces is much cheaper than the token regex, and
+        # gives the same tokens for words without punctuation; isalnum()
+        # is exactly \w apart from the underscore
+        for token in command.split():
+            bits = anchor_index.get(token)
+            if bits is not None:
+                found |= bits
+            elif not token.isalnum():
+                # e.g. "what's", which \b splits in two
+                for part in TOKEN_PATTERN.findall(token):
+                    found |= anchor_index.get(part, 0)
+        return found
+    
+    def _automaton(self, alternatives: int) -> Tuple[re.Pattern, Dict[int, Tuple[int, Optional[int]]]]:
+        """
+        Get the combined regex over a set of alternatives
+        
+        Every pattern becomes one branch of a single alternation, followed by
+        an empty marker group. The marker closes last, so match.lastindex
+        tells which branch matched without walking the groups.
+        
+        When every alternative is anchored, there are only a few, and each
+        branch is a lookahead searching the whole command. The branches are
+        tried in priority order at its start, so the first pattern found
+        anywhere wins in one regex call. Anchorless alternatives can be
+        many, and rescanning the command for each would cost more than
+        finding the leftmost match and settling priority afterwards.
+        
+        Args:
+            alternatives: Bitmask of alternative indices
+        
+        Returns:
+            Tuple of (compiled regex, marker group -> (alternative index,
+            absolute parameter group or None))
+        """
+        cached = self._automata.get(alternatives)
+        if cached is not None:
+            self._automata.move_to_end(alternatives)
+            return cached
+        
+        in_order = not alternatives & self.fallback
+        branches = []
+        markers = {}
+        group_index = 0
+        
+        for index, (intent, pattern, parameter_group) in enumerate(self._alternatives):
+            if not alternatives >> index & 1:
+                continue
+            
+            compiled = re.compile(pattern)
+            inner_groups = compiled.groups
+            marker_index = group_index + inner_groups + 1
+            
+            if isinstance(parameter_group, str):
+                # Patterns without the named group take no parameter
+                parameter_group = compiled.groupindex.get(parameter_group)
+            if parameter_group is not None and parameter_group <= inner_groups:
+                markers[marker_index] = (index, group_index + parameter_group)
+            else:
+                markers[marker_index] = (index, None)
+            
+            # Group names must be unique across the whole alternation
+            pattern = NAMED_GROUP_PATTERN.sub(rf"(?P\1b{index}_\2", pattern)
+            branches.append(f"(?=.*?(?:{pattern})())" if in_order else f"{pattern}()")
+            group_index = marker_index
+        
+        if in_order:
+            automaton = re.compile("(?s:" + "|".join(branches) + ")")
+        elif alternatives & ~self._word_start_mask == 0:
+            # Lets the engine skip straight to word starts
+            automaton = re.compile(r"(?=\w)(?:" + "|".join(branches) + ")")
+        else:
+            automaton = re.compile("|".join(branches))
+        
+        self._automata[alternatives] = (automaton, markers)
+        if len(self._automata) > AUTOMATON_CACHE_SIZE:
+            self._automata.popitem(last=False)
+        return automaton, markers
+    
+    def match(self, command: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve a command to an intent and its parameter
+        
+        Only alternatives whose anchor words occur in the command (plus the
+        anchorless fallback) go into the regex. With anchorless ones among
+        them, it finds the leftmost match, which may belong to a lower
+        priority intent than one matching further right. Re-running it
+        restricted to higher priority branches, from just past that match,
+        settles it; once only anchored ones are left, a single run in
+        priority order does.
+        
+        Args:
+            command: Lowercased command text
+        
+        Returns:
+            Tuple of (intent, parameter); intent is None for unknown commands
+            and parameter is None when the intent takes none or it is missing
+        """
+        if self.ladder:
+            return self._match_ladder(command)
+        
+        alternatives = self.candidates(command)
+        position = 0
+        best = None
+        
+        while alternatives:
+            try:
+                automaton, markers = self._automaton(alternatives)
+            except (re.error, RecursionError) as e:
+                # e.g. a global flag like (?i), only allowed at the start of a regex
+                print(f"Warning: Could not combine command patterns, matching them one by one: {e}")
+                self.ladder = True
+                return self._match_ladder(command)
+            if not alternatives & self.fallback:
+                # Tried in priority order from here on, see _automaton()
+                match = automaton.match(command, position)
+                if match is not None:
+                    best = (*markers[match.lastindex], match)
+                break
+            
+            match = automaton.search(command, position)
+            if match is None:
+                break
+            
+            # Nothing matched further left, and no higher priority
+            # branch matched at this position either
+            index, parameter_index = markers[match.lastindex]
+            best = (index, parameter_index, match)
+            alternatives &= (1 << index) - 1
+            position = match.start() + 1
+        
+        if best is None:
+            return None, None
+        
+        index, parameter_index, match = best
+        intent = self._alternatives[index][0]
+        if parameter_index is None:
+            return intent, None
+        
+        parameter = match.group(parameter_index)
+        if parameter is None:
+            return intent, None
+        
+        return intent, parameter.strip()
+    
+    def _match_ladder(self, command: str) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve a command by searching each pattern in priority order"""
+        for intent, pattern, parameter_group in self._alternatives:
+            match = re.search(pattern, command)
+            if match is None:
+                continue
+            
+            if isinstance(parameter_group, str):
+                parameter = match.groupdict().get(parameter_group)
+            elif parameter_group is not None and parameter_group <= len(match.groups()):
+                parameter = match.group(parameter_group)
+            else:
+                parameter = None
+            return intent, parameter.strip() if parameter is not None else None
+        
+        return None, None
+
+
+def _starts_with_word(pattern: str) -> bool:
+    """Check whether every match of a pattern begins with a word character"""
+    try:
+        return _first_is_word(list(sre_parse.parse(pattern)))
+    except Exception:
+        return False
+
+
+def _first_is_word(items: list) -> bool:
+    """Walk the leading items of a parsed pattern looking at its first character"""
+    for op, value in items:
+        if op is sre_constants.AT and value is sre_constants.AT_BOUNDARY:
+            # Zero-width, look at what follows
+            continue
+        if op is sre_constants.LITERAL:
+            return bool(re.match(r"\w", chr(value)))
+        if op is sre_constants.SUBPATTERN:
+            return _first_is_word(list(value[-1]))
+        if op is sre_constants.BRANCH:
+            return all(_first_is_word(list(branch)) for branch in value[1])
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            minimum, _, repeated = value
+            if not _first_is_word(list(repeated)):
+                return False
+            if minimum == 0:
+                # Optional, so whatever follows may come first
+                continue
+            return True
+        return False
+    return False
+
+
+def _spelling_words(pattern: str) -> Optional[List[set]]:
+    """
+    Find the whole words each spelling of a pattern cannot match without
+    
+    The pattern is expanded into its alternative spellings (groups,
+    branches and optional parts inlined). In each spelling, a run of
+    literal word characters with a separator on both sides is a whole
+    token of any command it matches.
+    
+    Returns:
+        One set of words per spelling, or None if some spelling has none or
+        the pattern could not be expanded
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+    
+    if parsed.state.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    
+    variants = _expand(list(parsed))
+    if variants is None:
+        return None
+    
+    spellings = []
+    for variant in variants:
+        words = _bounded_words(variant)
+        if not words:
+            return None
+        spellings.append(words)
+    return spellings
+
+
+def _anchor_words(spellings: List[set], usage: Dict[str, int]) -> FrozenSet[str]:
+    """
+    Pick a few words covering every spelling of a pattern
+    
+    Args:
+        spellings: The pattern's _spelling_words()
+        usage: Word -> number of patterns in the table using it
+    
+    Returns:
+        Set of words such that every match contains at least one of them as
+        a whole \\w+ token
+    """
+    # Greedy weighted hitting set: the word covering most spellings for
+    # how common it is across the table, longest first
+    remaining = list(spellings)
+    anchors = set()
+    while remaining:
+        counts: Dict[str, int] = {}
+        for words in remaining:
+            for word in words:
+                counts[word] = counts.get(word, 0) + 1
+        best = max(counts, key=lambda word: (counts[word] / usage.get(word, 1), len(word), word))
+        anchors.add(best)
+        remaining = [words for words in remaining if best not in words]
+    
+    # Drop anchors the others already cover, most common first
+    for word in sorted(anchors, key=lambda word: (-usage.get(word, 1), len(word), word)):
+        rest = anchors - {word}
+        if all(words & rest for words in spellings):
+            anchors = rest
+    
+    return frozenset(anchors)
+
+
+def _alternatives_of(op, value) -> Optional[list]:
+    """Get the item sequences a grouping item can stand for, or None if it is not one"""
+    if op is sre_constants.SUBPATTERN and not (value[1] or value[2]):
+        return [list(value[-1])]
+    if op is sre_constants.BRANCH:
+        return [list(branch) for branch in value[1]]
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        minimum, maximum, repeated = value
+        if minimum == 0 and maximum == 1:
+            return [[], list(repeated)]
+    if op is sre_constants.IN and len(value) <= MAX_CHARSET_EXPANSION:
+        if all(member_op is sre_constants.LITERAL for member_op, _ in value):
+            return [[(sre_constants.LITERAL, member_value)] for _, member_value in value]
+    return None
+
+
+def _expand(items: list) -> Optional[List[list]]:
+    """
+    Inline every group, branch and optional item of a parsed sequence
+    
+    Returns:
+        Flat item sequences, one per spelling, or None if there are too many
+    """
+    variants: List[list] = [[]]
+    
+    for op, value in items:
+        if _is_separator(op, value):
+            choices = [[(op, value)]]
+        else:
+            alternatives = _alternatives_of(op, value)
+            if alternatives is None:
+                choices = [[(op, value)]]
+            else:
+                choices = []
+                for alternative in alternatives:
+                    expanded = _expand(alternative)
+                    if expanded is None:
+                        return None
+                    choices.extend(expanded)
+        
+        variants = [variant + choice for variant in variants for choice in choices]
+        if len(variants) > MAX_PATTERN_VARIANTS:
+            return None
+    
+    return variants
+
+
+def _is_separator(op, value) -> bool:
+    """Check whether an item guarantees a word boundary at its position"""
+    if op is sre_constants.AT:
+        return value in (
+            sre_constants.AT_BOUNDARY, sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING,
+            sre_constants.AT_END, sre_constants.AT_END_STRING)
+    if op is sre_constants.LITERAL:
+        return not re.match(r"\w", chr(value))
+    if op is sre_constants.IN:
+        return all(
+            (member_op is sre_constants.CATEGORY and member_value in (
+                sre_constants.CATEGORY_SPACE, sre_constants.CATEGORY_NOT_WORD))
+            or (member_op is sre_constants.LITERAL and not re.match(r"\w", chr(member_value)))
+            for member_op, member_value in value
+        )
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        minimum, _, repeated = value
+        return minimum >= 1 and len(repeated) == 1 and _is_separator(*repeated[0])
+    return False
+
+
+def _bounded_words(variant: list) -> set:
+    """Find literal words with a separator on both sides in a flat item sequence"""
+    words = set()
+    word = []
+    # The start of a pattern is not a boundary: it can match mid-word
+    bounded = False
+    
+    for op, value in variant:
+        if _is_separator(op, value):
+            if word and bounded:
+                words.add("".join(word))
+            word = []
+            bounded = True
+        elif op is sre_constants.LITERAL:
+            word.append(chr(value))
+        else:
+            word = []
+            bounded = False
+    
+    return words
@@ -0,0 +1,404 @@
+"""
+Lexicon Module for Nova AI Assistant
+Offline word definitions from a memory-mapped sorted index, with prefix lookup
+"""
+
+import bisect
+import glob
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from wiki_index import normalize_title as normalize_word
+
+
+MAGIC = b'NOVALEXI'
+VERSION = 1
+
+# magic, version, senses kept per word, count, then the offset of each
+# section: key offsets, keys, record offsets, records
+HEADER = struct.Struct('<8sIIQQQQQ')
+
+# Separators inside a record: word, then senses, each a part of speech and a definition
+_WORD_END = '\x00'
+_SENSE_END = '\x1e'
+_POS_END = '\x1f'
+
+# Definitions answered without a dictionary file
+SAMPLE_DEFINITIONS: List[Tuple[str, str, str]] = [
+    ("artificial intelligence", "noun", "The simulation of human intelligence in machines that are programmed to think and learn like humans."),
+    ("machine learning", "noun", "A subset of artificial intelligence that enables systems to automatically learn and improve from experience."),
+    ("python", "noun", "A high-level, interpreted programming language known for its simplicity and readability."),
+    ("algorithm", "noun", "A set of rules or instructions designed to solve a specific problem or perform a particular task."),
+    ("database", "noun", "An organized collection of structured information or data, typically stored electronically in a computer system."),
+]
+
+
+class Lexicon:
+    """Read-only dictionary built by build_lexicon()"""
+    
+    def __init__(self, path: str):
+        """
+        Map a dictionary index
+        
+        Args:
+            path: File written by build_lexicon()
+        
+        Raises:
+            ValueError: The file is not a dictionary index
+        """
+        self.path = path
+        with open(path, 'rb') as index_file:
+            try:
+                self._map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path} is empty")
+        
+        magic, version, _, count, key_offsets, keys, record_offsets, records = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a Nova dictionary index")
+        
+        self.count = count
+        self._view = memoryview(self._map)
+        self._key_offsets = self._view[key_offsets:key_offsets + 8 * (count + 1)].cast('Q')
+        self._keys_start = keys
+        self._record_offsets = self._view[record_offsets:record_offsets + 8 * (count + 1)].cast('Q')
+        self._records_start = records
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __getitem__(self, position: int) -> bytes:
+        # Sorted keys as a sequence, so bisect can search the mapped file
+        start = self._keys_start + self._key_offsets[position]
+        return self._map[start:self._keys_start + self._key_offsets[position + 1]]
+    
+    def __enter__(self) -> "Lexicon":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """Unmap the file"""
+        # The map can only close once every view of it is released
+        for view in (self._key_offsets, self._record_offsets, self._view):
+            view.release()
+        self._map.close()
+    
+    def find(self, word: str) -> int:
+        """
+        Binary search for a word
+        
+        Returns:
+            Its sorted position, or -1 if it is not in the dictionary
+        """
+        key = normalize_word(word).encode('utf-8')
+        position = bisect.bisect_left(self, key)
+        if position < self.count and self[position] == key:
+            return position
+        return -1
+    
+    def entry(self, position: int) -> Dict:
+        """
+        Get the entry at a sorted position
+        
+        Returns:
+            Dictionary with word and senses, a list of {'pos', 'definition'}
+        """
+        start = self._records_start + self._record_offsets[position]
+        end = self._records_start + self._record_offsets[position + 1]
+        word, _, senses = self._map[start:end].decode('utf-8').partition(_WORD_END)
+        return {
+            'word': word,
+            'senses': [dict(zip(('pos', 'definition'), sense.split(_POS_END, 1)))
+                       for sense in senses.split(_SENSE_END)],
+        }
+    
+    def get(self, word: str) -> Optional[Dict]:
+        """
+        Look a word up, ignoring case
+        
+        Returns:
+            Dictionary with word and senses, or None if it is not in the dictionary
+        """
+        position = self.find(word)
+        return self.entry(position) if position >= 0 else None
+    
+    def prefix(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Words starting with a prefix, in sorted order
+        
+        Args:
+            prefix: Start of the word, ignoring case
+            limit: Most words to return
+        """
+        key = normalize_word(prefix).encode('utf-8')
+        words = []
+        position = bisect.bisect_left(self, key)
+        while position < self.count and len(words) < limit and self[position].startswith(key):
+            words.append(self.entry(position)['word'])
+            position += 1
+        return words
+
+
+def build_lexicon(senses: Iterable[Tuple[str, str, str]], path: str, max_senses: int = 8) -> int:
+    """
+    Write a dictionary index
+    
+    Senses are streamed to a temporary file as they arrive and grouped by
+    word after sorting, so only keys and positions are held in memory.
+    
+    Args:
+        senses: (word, part of speech, definition) tuples, in any order
+        path: Index file to write
+        max_senses: Most senses kept per word, first come first kept
+    
+    Returns:
+        Number of words indexed
+    """
+    # (key, arrival number, offset, length) of every sense
+    entries = []
+    directory = os.path.dirname(os.path.abspath(path))
+    
+    with tempfile.TemporaryFile(dir=directory) as sense_file:
+        offset = 0
+        for number, (word, pos, definition) in enumerate(senses):
+            key = normalize_word(word).encode('utf-8')
+            definition = " ".join(definition.split())
+            if not key or not definition:
+                continue
+            record = f"{word}{_WORD_END}{pos}{_POS_END}{definition}".encode('utf-8')
+            sense_file.write(record)
+            entries.append((key, number, offset, len(record)))
+            offset += len(record)
+        entries.sort()
+        
+        key_offsets = array('Q', [0])
+        record_offsets = array('Q', [0])
+        keys = []
+        with tempfile.TemporaryFile(dir=directory) as record_file:
+            index = 0
+            while index < len(entries):
+                key = entries[index][0]
+                group_end = index
+                while group_end < len(entries) and entries[group_end][0] == key:
+                    group_end += 1
+                
+                word = None
+                parts = []
+                for _, _, start, length in entries[index:min(group_end, index + max_senses)]:
+                    sense_file.seek(start)
+                    sense_word, _, sense = sense_file.read(length).decode('utf-8').partition(_WORD_END)
+                    word = word or sense_word
+                    parts.append(sense)
+                record = f"{word}{_WORD_END}{_SENSE_END.join(parts)}".encode('utf-8')
+                record_file.write(record)
+                
+                keys.append(key)
+                key_offsets.append(key_offsets[-1] + len(key))
+                record_offsets.append(record_offsets[-1] + len(record))
+                index = group_end
+            del entries
+            
+            count = len(keys)
+            key_offsets_at = HEADER.size
+            keys_at = key_offsets_at + 8 * (count + 1)
+            record_offsets_at = keys_at + key_offsets[-1]
+            # Keep the second offset table 8-byte aligned
+            record_offsets_at += -record_offsets_at % 8
+            records_at = record_offsets_at + 8 * (count + 1)
+            
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'wb') as index_file:
+                index_file.write(HEADER.pack(MAGIC, VERSION, max_senses, count, key_offsets_at, keys_at,
+                                             record_offsets_at, records_at))
+                key_offsets.tofile(index_file)
+                for key in keys:
+                    index_file.write(key)
+                index_file.write(b'\x00' * (record_offsets_at - index_file.tell()))
+                record_offsets.tofile(index_file)
+                
+                record_file.seek(0)
+                while True:
+                    block = record_file.read(1 << 20)
+                    if not block:
+                        break
+                    index_file.write(block)
+            os.replace(temp_path, path)
+    
+    return count
+
+
+# WordNet synset types -> parts of speech
+_WORDNET_POS = {'n': 'noun', 'v': 'verb', 'a': 'adjective', 's': 'adjective', 'r': 'adverb'}
+
+
+def read_wordnet(dict_dir: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream senses from WordNet's data.noun, data.verb, data.adj and data.adv
+    
+    Yields:
+        (word, part of speech, definition) tuples; examples are left out
+    """
+    for data_path in sorted(glob.glob(os.path.join(dict_dir, 'data.*'))):
+        with open(data_path, 'r', encoding='utf-8', errors='replace') as data_file:
+            for line in data_file:
+                if line.startswith('  '):
+                    # License header
+                    continue
+                fields, _, gloss = line.partition('| ')
+                fields = fields.split()
+                if len(fields) < 5:
+                    continue
+                
+                pos = _WORDNET_POS.get(fields[2], fields[2])
+                # Definition first, then quoted examples after semicolons
+                definition = re.split(r';\s*"', gloss.strip(), 1)[0].strip()
+                for index in range(int(fields[3], 16)):
+                    word = re.sub(r'\(\w+\)$', '', fields[4 + 2 * index]).replace('_', ' ')
+                    yield word, pos, definition
+
+
+def read_wiktionary(jsonl_path: str, language: str = 'English') -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream senses from a Wiktionary extract in kaikki.org JSON lines
+    
+    Yields:
+        (word, part of speech, definition) tuples
+    """
+    with open(jsonl_path, 'r', encoding='utf-8') as jsonl_file:
+        for line in jsonl_file:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get('lang', language) != language or not entry.get('word'):
+                continue
+            for sense in entry.get('senses', []):
+                glosses = sense.get('glosses')
+                if glosses:
+                    yield entry['word'], entry.get('pos', ''), glosses[0]
+
+
+def read_tsv(tsv_path: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream senses from a word<TAB>part of speech<TAB>definition file
+    
+    Yields:
+        (word, part of speech, definition) tuples
+    """
+    with open(tsv_path, 'r', encoding='utf-8') as tsv_file:
+        for line in tsv_file:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) == 3:
+                yield fields[0], fields[1], fields[2]
+
+
+def synthetic_senses(count: int) -> Iterator[Tuple[str, str, str]]:
+    """
+    Made-up senses for benchmarking at WordNet scale
+    
+    Yields:
+        (word, part of speech, definition) tuples, about 1.4 senses per word
+    """
+    syllables = "ka lo mi nu sa te ri vo pe da zu fi go ba ne".split()
+    for number in range(count):
+        word = "".join(syllables[(number // 15 ** position) % 15] for position in range(5))
+        yield word, 'noun', f"A made-up thing numbered {number}, used to measure lookups."
+        if number % 3 == 0:
+            yield word, 'verb', f"To do what made-up thing {number} does."
+
+
+def memory_rss() -> Optional[int]:
+    """Resident memory of this process in bytes, None if it cannot be read"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except (ImportError, AttributeError, OSError):
+        pass
+    try:
+        import resource
+        # Peak, in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+if __name__ == "__main__":
+    # Build, query and benchmark dictionary indexes
+    usage = [
+        "  python lexicon.py build wordnet /usr/share/wordnet data/dictionary.idx",
+        "  python lexicon.py build wiktionary kaikki.org-dictionary-English.jsonl data/dictionary.idx",
+        "  python lexicon.py build tsv words.tsv data/dictionary.idx",
+        "  python lexicon.py build synthetic 150000 synthetic.idx",
+        "  python lexicon.py define data/dictionary.idx serendipity",
+        "  python lexicon.py prefix data/dictionary.idx seren",
+        "  python lexicon.py bench data/dictionary.idx [lookups]",
+    ]
+    arguments = sys.argv[1:]
+    if len(arguments) < (2 if arguments[:1] == ['bench'] else 3) or arguments[0] not in ('build', 'define', 'prefix', 'bench'):
+        print("Usage:")
+        print("\n".join(usage))
+        sys.exit(1)
+    
+    action = arguments[0]
+    if action == 'build':
+        readers = {'wordnet': read_wordnet, 'wiktionary': read_wiktionary, 'tsv': read_tsv,
+                   'synthetic': lambda count: synthetic_senses(int(count))}
+        if arguments[1] not in readers or len(arguments) < 4:
+            print("Usage:")
+            print("\n".join(usage))
+            sys.exit(1)
+        
+        start = time.perf_counter()
+        count = build_lexicon(readers[arguments[1]](arguments[2]), arguments[3])
+        print(f"✅ Indexed {count:,} words into {arguments[3]} "
+              f"({os.path.getsize(arguments[3]) / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s")
+    
+    elif action in ('define', 'prefix'):
+        with Lexicon(arguments[1]) as lexicon:
+            query = " ".join(arguments[2:])
+            start = time.perf_counter()
+            found = lexicon.get(query) if action == 'define' else lexicon.prefix(query)
+            elapsed = time.perf_counter() - start
+            if not found:
+                print(f"❓ Nothing found ({elapsed * 1e6:.1f} µs)")
+            elif action == 'define':
+                print(f"📖 {found['word']} ({elapsed * 1e6:.1f} µs)")
+                for sense in found['senses']:
+                    print(f"  ({sense['pos']}) {sense['definition']}")
+            else:
+                print(f"🔤 {', '.join(found)} ({elapsed * 1e6:.1f} µs)")
+    
+    else:
+        before = memory_rss()
+        start = time.perf_counter()
+        lexicon = Lexicon(arguments[1])
+        opened = time.perf_counter() - start
+        after = memory_rss()
+        
+        lookups = int(arguments[2]) if len(arguments) > 2 else 100000
+        step = max(1, lexicon.count // lookups)
+        words = [lexicon.entry(position)['word'] for position in range(0, lexicon.count, step)][:lookups]
+        timings = []
+        for word in words:
+            began = time.perf_counter()
+            lexicon.get(word)
+            timings.append(time.perf_counter() - began)
+        timings.sort()
+        
+        print(f"📚 {lexicon.count:,} words, opened in {opened * 1000:.2f} ms")
+        if before is not None and after is not None:
+            print(f"🧠 Resident memory {after / 1e6:.1f} MB, {(after - before) / 1e6:+.2f} MB for opening")
+        print(f"⚡ {len(timings):,} lookups: p50 {timings[len(timings) // 2] * 1e6:.1f} µs, "
+              f"p99 {timings[int(len(timings) * 0.99)] * 1e6:.1f} µs, max {timings[-1] * 1e6:.1f} µs")
+        lexicon.close()
@@ -0,0 +1,463 @@
+"""
+Local Servers Module for Nova AI Assistant
+Stand-in HTTP services so network-backed features can be run and measured offline
+"""
+
+import itertools
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Type
+from urllib.parse import parse_qs, unquote, urlparse
+from xml.sax.saxutils import escape
+
+
+class LocalServer:
+    """Runs an HTTP request handler on a background thread on localhost"""
+    
+    def __init__(self, handler_class: Type[BaseHTTPRequestHandler], host: str = '127.0.0.1',
+                 port: int = 0, **context):
+        """
+        Initialize the server
+        
+        Args:
+            handler_class: Request handler; it can read settings from
+                self.server.context
+            host: Interface to bind
+            port: Port to bind, 0 picks a free one
+            **context: Settings shared with the handler
+        """
+        self.handler_class = handler_class
+        self.host = host
+        self.port = port
+        self.context = context
+        
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        return f"http://{self.host}:{self.port}"
+    
+    def start(self) -> str:
+        """
+        Start serving in the background
+        
+        Returns:
+            Base URL of the server
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), self.handler_class)
+        self._server.daemon_threads = True
+        self._server.context = self.context
+        self.port = self._server.server_address[1]
+        
+        self._thread = threading.Thread(target=self._server.serve_forever, name="nova-local-server", daemon=True)
+        self._thread.start()
+        return self.url
+    
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+    
+    def __enter__(self) -> "LocalServer":
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """Request handler with JSON helpers and quiet logging"""
+    
+    def send_json(self, payload, status: int = 200) -> None:
+        """Send a JSON response"""
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def read_body(self) -> bytes:
+        """Read the request body"""
+        length = int(self.headers.get('Content-Length', 0))
+        return self.rfile.read(length) if length else b""
+    
+    def log_message(self, format, *args):
+        # Keep benchmark output readable
+        pass
+
+
+class STTStandInHandler(JSONHandler):
+    """
+    Speech-to-text stand-in
+    
+    POST /recognize with WAV audio answers {"transcript": ...} after the
+    configured latency, replaying the canned transcripts in order.
+    """
+    
+    def do_POST(self):
+        if self.path.split('?')[0] != '/recognize':
+            self.send_json({'error': 'not found'}, 404)
+            return
+        
+        context = self.server.context
+        self.read_body()
+        time.sleep(context.get('latency', 0.0))
+        
+        with context['lock']:
+            transcript = next(context['transcripts'])
+        self.send_json({'transcript': transcript})
+
+
+def stt_stand_in(transcripts: Optional[List[str]] = None, latency: float = 0.1,
+                 port: int = 0) -> LocalServer:
+    """
+    Create a speech-to-text stand-in server
+    
+    Args:
+        transcripts: Transcripts to replay in a loop
+        latency: Seconds to wait before answering each request
+        port: Port to bind, 0 picks a free one
+    
+    Returns:
+        Unstarted LocalServer
+    """
+    transcripts = transcripts or ["what time is it", "open chrome", "volume up"]
+    return LocalServer(STTStandInHandler, port=port, latency=latency,
+                       transcripts=itertools.cycle(transcripts), lock=threading.Lock())
+
+
+# Articles the Wikipedia stand-in knows by default; None marks a disambiguation page
+SAMPLE_ARTICLES = {
+    'Artificial intelligence': "Artificial intelligence (AI) is the capability of computational systems "
+                               "to perform tasks typically associated with human intelligence. It is a field "
+                               "of research in computer science. Its goals include learning, reasoning and perception.",
+    'Alan Turing': "Alan Mathison Turing was an English mathematician, computer scientist, logician and "
+                   "philosopher. He was highly influential in the development of theoretical computer science. "
+                   "Turing is widely considered to be the father of theoretical computer science.",
+    'Python (programming language)': "Python is a high-level, general-purpose programming language. Its "
+                                     "design philosophy emphasizes code readability. Python is dynamically typed "
+                                     "and garbage-collected.",
+    'Machine learning': "Machine learning is a field of study in artificial intelligence concerned with "
+                        "statistical algorithms that learn from data. Advances in deep learning have allowed "
+                        "neural networks to surpass many previous approaches in performance.",
+    'Mercury': None,
+    'Mercury (planet)': "Mercury is the first planet from the Sun and the smallest in the Solar System. "
+                        "It is a rocky planet with a trace atmosphere.",
+    'Mercury (element)': "Mercury is a chemical element; it has symbol Hg and atomic number 80. "
+                         "It is the only metallic element that is liquid at standard temperature and pressure.",
+}
+
+
+class WikipediaStandInHandler(JSONHandler):
+    """
+    Wikipedia REST API stand-in
+    
+    Serves GET /api/rest_v1/page/summary/<title> and
+    GET /w/rest.php/v1/search/title?q=...&limit=... from a dictionary of
+    articles, after the configured latency.
+    """
+    
+    def do_GET(self):
+        context = self.server.context
+        url = urlparse(self.path)
+        time.sleep(context.get('latency', 0.0))
+        with context['lock']:
+            context['requests'] += 1
+        
+        articles = context['articles']
+        if url.path.startswith('/api/rest_v1/page/summary/'):
+            wanted = unquote(url.path.rsplit('/', 1)[1]).replace('_', ' ').lower()
+            for title, extract in articles.items():
+                if title.lower() == wanted:
+                    slug = title.replace(' ', '_')
+                    self.send_json({
+                        'type': 'disambiguation' if extract is None else 'standard',
+                        'title': title,
+                        'extract': extract or f"{title} may refer to:",
+                        'description': '',
+                        'content_urls': {'desktop': {'page': f"https://en.wikipedia.org/wiki/{slug}"}},
+                    })
+                    return
+            self.send_json({'type': 'https://mediawiki.org/wiki/HyperSwitch/errors/not_found',
+                            'title': 'Not found.'}, 404)
+            return
+        
+        if url.path == '/w/rest.php/v1/search/title':
+            query = parse_qs(url.query)
+            words = query.get('q', [''])[0].lower().split()
+            limit = int(query.get('limit', ['5'])[0])
+            matches = [title for title in articles if any(word in title.lower() for word in words)]
+            self.send_json({'pages': [{'title': title, 'key': title.replace(' ', '_')}
+                                      for title in matches[:limit]]})
+            return
+        
+        self.send_json({'error': 'not found'}, 404)
+
+
+def wikipedia_stand_in(articles: Optional[Dict[str, Optional[str]]] = None, latency: float = 0.15,
+                       port: int = 0) -> LocalServer:
+    """
+    Create a Wikipedia REST API stand-in server
+    
+    Args:
+        articles: Title -> extract, None for a disambiguation page;
+            defaults to SAMPLE_ARTICLES
+        latency: Seconds to wait before answering each request, roughly a
+            round trip to Wikipedia
+        port: Port to bind, 0 picks a free one
+    
+    Returns:
+        Unstarted LocalServer; server.context['requests'] counts requests
+    """
+    return LocalServer(WikipediaStandInHandler, port=port, latency=latency,
+                       articles=articles if articles is not None else SAMPLE_ARTICLES,
+                       requests=0, lock=threading.Lock())
+
+
+# City -> (condition id, description, °C, humidity %, wind m/s, country)
+SAMPLE_WEATHER: Dict[str, tuple] = {
+    'London': (803, 'broken clouds', 14.2, 81, 4.1, 'GB'),
+    'New York': (800, 'clear sky', 22.5, 55, 3.6, 'US'),
+    'Seattle': (500, 'light rain', 11.8, 88, 2.9, 'US'),
+    'Oslo': (601, 'snow', -3.4, 92, 5.2, 'NO'),
+    'Tokyo': (801, 'few clouds', 24.1, 63, 2.4, 'JP'),
+    'Mumbai': (211, 'thunderstorm', 29.6, 84, 6.7, 'IN'),
+}
+
+
+class WeatherStandInHandler(JSONHandler):
+    """
+    OpenWeatherMap current-weather stand-in
+    
+    Serves GET /data/2.5/weather?q=<city>&units=metric|imperial from a
+    dictionary of canned reports, after the configured latency. Any API
+    key is accepted.
+    """
+    
+    def do_GET(self):
+        context = self.server.context
+        url = urlparse(self.path)
+        time.sleep(context.get('latency', 0.0))
+        with context['lock']:
+            context['requests'] += 1
+        
+        if url.path != '/data/2.5/weather':
+            self.send_json({'cod': 404, 'message': 'Internal error'}, 404)
+            return
+        
+        query = parse_qs(url.query)
+        wanted = query.get('q', [''])[0].split(',')[0].strip().lower()
+        imperial = query.get('units', ['standard'])[0] == 'imperial'
+        for city, (condition_id, description, celsius, humidity, wind, country) in context['cities'].items():
+            if city.lower() == wanted:
+                self.send_json({
+                    'weather': [{'id': condition_id, 'main': description.split()[-1].title(),
+                                 'description': description}],
+                    'main': {'temp': celsius * 9 / 5 + 32 if imperial else celsius, 'humidity': humidity},
+                    'wind': {'speed': wind * 2.237 if imperial else wind},
+                    'sys': {'country': country},
+                    'name': city,
+                    'cod': 200,
+                })
+                return
+        self.send_json({'cod': '404', 'message': 'city not found'}, 404)
+
+
+def weather_stand_in(cities: Optional[Dict[str, tuple]] = None, latency: float = 0.2,
+                     port: int = 0) -> LocalServer:
+    """
+    Create an OpenWeatherMap stand-in server
+    
+    Args:
+        cities: City -> (condition id, description, °C, humidity %,
+            wind m/s, country); defaults to SAMPLE_WEATHER
+        latency: Seconds to wait before answering each request
+        port: Port to bind, 0 picks a free one
+    
+    Returns:
+        Unstarted LocalServer; server.context['requests'] counts requests
+    """
+    return LocalServer(WeatherStandInHandler, port=port, latency=latency,
+                       cities=cities if cities is not None else SAMPLE_WEATHER,
+                       requests=0, lock=threading.Lock())
+
+
+# Category -> headlines, newest first
+SAMPLE_HEADLINES: Dict[str, List[str]] = {
+    'general': [
+        "City Council Approves New Transit Plan",
+        "Record Turnout Expected for Weekend Marathon",
+        "Museum Reopens After Two-Year Renovation",
+    ],
+    'technology': [
+        "Python 3.13 Brings a Faster Interpreter",
+        "Chip Makers Race to Build Smaller Transistors",
+        "Open Source Project Reaches One Million Contributors",
+    ],
+    'science': [
+        "Telescope Captures Most Distant Galaxy Yet",
+        "Researchers Map the Fruit Fly Brain in Full",
+        "New Battery Chemistry Doubles Storage Capacity",
+    ],
+}
+
+
+class FeedStandInHandler(JSONHandler):
+    """
+    News feed stand-in
+    
+    Serves the headlines of each category as RSS at /rss/<category>.xml,
+    as Atom at /atom/<category>.xml and NewsAPI-style at
+    /v2/top-headlines?category=<category>, after the configured latency.
+    Changing server.context['headlines'] changes what is served.
+    """
+    
+    def send_xml(self, text: str, content_type: str) -> None:
+        """Send an XML document"""
+        body = text.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        context = self.server.context
+        url = urlparse(self.path)
+        time.sleep(context.get('latency', 0.0))
+        with context['lock']:
+            context['requests'] += 1
+        
+        if url.path == '/v2/top-headlines':
+            category = parse_qs(url.query).get('category', ['general'])[0]
+            articles = [{'title': title, 'url': f"https://news.example.com/{category}/{number}",
+                         'source': {'name': 'Stand-in News'}, 'publishedAt': ''}
+                        for number, title in enumerate(context['headlines'].get(category, []))]
+            self.send_json({'status': 'ok', 'totalResults': len(articles), 'articles': articles})
+            return
+        
+        kind, _, name = url.path.strip('/').partition('/')
+        headlines = context['headlines'].get(name[:-len('.xml')]) if name.endswith('.xml') else None
+        if kind not in ('rss', 'atom') or headlines is None:
+            self.send_json({'status': 'error', 'message': 'not found'}, 404)
+            return
+        
+        category = name[:-len('.xml')]
+        links = [f"https://news.example.com/{category}/{number}" for number in range(len(headlines))]
+        if kind == 'rss':
+            items = "".join(f"<item><title>{escape(title)}</title><link>{link}</link></item>"
+                            for title, link in zip(headlines, links))
+            self.send_xml(f'<?xml version="1.0"?><rss version="2.0"><channel>'
+                          f'<title>{category}</title>{items}</channel></rss>', 'application/rss+xml')
+        else:
+            entries = "".join(f'<entry><title>{escape(title)}</title><link href="{link}"/></entry>'
+                              for title, link in zip(headlines, links))
+            self.send_xml(f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+                          f'<title>{category}</title>{entries}</feed>', 'application/atom+xml')
+
+
+def feed_stand_in(headlines: Optional[Dict[str, List[str]]] = None, latency: float = 0.1,
+                  port: int = 0) -> LocalServer:
+    """
+    Create a news feed stand-in server
+    
+    Args:
+        headlines: Category -> headlines, newest first; defaults to a copy
+            of SAMPLE_HEADLINES
+        latency: Seconds to wait before answering each request
+        port: Port to bind, 0 picks a free one
+    
+    Returns:
+        Unstarted LocalServer; server.context['requests'] counts requests
+    """
+    if headlines is None:
+        headlines = {category: list(titles) for category, titles in SAMPLE_HEADLINES.items()}
+    return LocalServer(FeedStandInHandler, port=port, latency=latency, headlines=headlines,
+                       requests=0, lock=threading.Lock())
+
+
+class TranslationStandInHandler(JSONHandler):
+    """
+    LibreTranslate stand-in
+    
+    Answers POST /translate with {"translatedText": ...}, after the
+    configured latency. Phrases it does not know come back tagged with the
+    target language, so every request gets an answer.
+    """
+    
+    def do_POST(self):
+        context = self.server.context
+        time.sleep(context.get('latency', 0.0))
+        with context['lock']:
+            context['requests'] += 1
+        
+        if urlparse(self.path).path != '/translate':
+            self.send_json({'error': 'not found'}, 404)
+            return
+        try:
+            request = json.loads(self.read_body() or b'{}')
+        except ValueError:
+            self.send_json({'error': 'invalid JSON'}, 400)
+            return
+        
+        text, target = request.get('q', ''), request.get('target', '')
+        translated = context['phrases'].get(target, {}).get(text.strip().lower(), f"[{target}] {text}")
+        self.send_json({'translatedText': translated})
+
+
+def translation_stand_in(phrases: Optional[Dict[str, Dict[str, str]]] = None, latency: float = 0.2,
+                         port: int = 0) -> LocalServer:
+    """
+    Create a LibreTranslate stand-in server
+    
+    Args:
+        phrases: Target language -> phrase -> translation
+        latency: Seconds to wait before answering each request
+        port: Port to bind, 0 picks a free one
+    
+    Returns:
+        Unstarted LocalServer; server.context['requests'] counts requests
+    """
+    if phrases is None:
+        phrases = {'es': {'good night': 'buenas noches', 'see you later': 'hasta luego'},
+                   'fr': {'good night': 'bonne nuit', 'see you later': 'à plus tard'}}
+    return LocalServer(TranslationStandInHandler, port=port, latency=latency, phrases=phrases,
+                       requests=0, lock=threading.Lock())
+
+
+# Stand-ins runnable from the command line, by name
+STAND_INS: Dict[str, callable] = {
+    'stt': stt_stand_in,
+    'wikipedia': wikipedia_stand_in,
+    'weather': weather_stand_in,
+    'news': feed_stand_in,
+    'translation': translation_stand_in,
+}
+
+
+if __name__ == "__main__":
+    # Run a stand-in in the foreground, e.g. python local_servers.py stt 8765
+    if len(sys.argv) < 2 or sys.argv[1] not in STAND_INS:
+        print(f"Usage: python local_servers.py [{'|'.join(STAND_INS)}] [port]")
+        sys.exit(1)
+    
+    server = STAND_INS[sys.argv[1]](port=int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    print(f"🛰️ {sys.argv[1]} stand-in listening on {server.start()}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+        print("\n🛑 Stand-in stopped")
@@ -14,8 +14,11 @@ import os
 # Import Nova's modules
 from voice_interface import VoiceInterface
 from system_controls import SystemControls
-from web_tools import WebTools
+from web_tools import WebTools, weather_city
 from utilities import Utilities
+from command_router import CommandRouter, get_router, normalize_command
+from tts_cache import phrases_from_pools
+from config import CUSTOM_RESPONSES, FEATURE_FLAGS, SYSTEM_SETTINGS, WEATHER_SETTINGS
 
 
 class NovaAI:
@@ -31,6 +34,15 @@ class NovaAI:
         self.web = WebTools()
         self.utils = Utilities()
         
+        # Headlines are fetched in the background so news answers never wait
+        if FEATURE_FLAGS.get('news_headlines', True):
+            self.web.start_news_feed()
+        # Likewise installed applications, so "open X" never scans directories
+        if FEATURE_FLAGS.get('app_launcher', True) and SYSTEM_SETTINGS.get('app_watcher', True):
+            self.system.start_app_watcher()
+        # And system metrics, so status answers come from a ready snapshot
+        self.system.start_telemetry()
+        
         # Nova's personality traits
         self.name = "Nova"
         self.personality = {
@@ -41,7 +53,8 @@ class NovaAI:
         }
         
         # Command patterns and responses
-        self.command_patterns = self._setup_command_patterns()
+        self.router = get_router('nova', self._setup_router)
+        self.command_patterns = self.router.command_patterns
         self.personality_responses = self._setup_personality_responses()
         
         # Session data
@@ -49,6 +62,9 @@ class NovaAI:
         self.command_count = 0
         self.user_name = "Sir"  # Default, can be personalized
         
+        # Fixed replies are worth rendering once and replaying
+        self.voice.prewarm_phrases(phrases_from_pools([self.personality_responses, CUSTOM_RESPONSES], user=self.user_name))
+        
         print("✅ Nova AI Assistant initialized successfully!")
     
     def _setup_command_patterns(self) -> Dict:
@@ -93,13 +109,19 @@ class NovaAI:
                 r'\bsearch\s+the\s+web\s+for\s+(.+?)\b'
             ],
             
+            # Dictionary commands
+            'define': [
+                r'\bdefine\s+(.+)',
+                r'\bwhat\s+does\s+(.+?)\s+mean\b',
+                r'\b(?:meaning|definition)\s+of\s+(.+)'
+            ],
+            
             # Wikipedia commands
             'wikipedia': [
-                r'\b(wikipedia|wiki)\s+(.+?)\b',
-                r'\btell\s+me\s+about\s+(.+?)\b',
-                r'\bwhat\s+is\s+(.+?)\b',
-                r'\bwho\s+is\s+(.+?)\b',
-                r'\bdefine\s+(.+?)\b'
+                r'\b(wikipedia|wiki)\s+(?P<query>.+?)\W*$',
+                r'\btell\s+me\s+about\s+(?P<query>.+?)\W*$',
+                r'\bwhat\s+is\s+(?P<query>.+?)\W*$',
+                r'\bwho\s+is\s+(?P<query>.+?)\W*$'
             ],
             
             # System control commands
@@ -167,6 +189,49 @@ class NovaAI:
             ]
         }
     
+    def _setup_parameter_groups(self) -> Dict:
+        """Setup which capture group, by number or name, holds each command's parameter"""
+        return {
+            'open_app': 1,
+            'web_search': 2,
+            'define': 1,
+            'wikipedia': 'query',
+            'youtube': 2,
+            'volume': 2
+        }
+    
+    def _setup_router(self, router: CommandRouter):
+        """Register Nova's commands with the shared command router"""
+        handlers = {
+            'time': lambda nova, command, parameter: nova._handle_time_command(),
+            'date': lambda nova, command, parameter: nova._handle_date_command(),
+            'datetime': lambda nova, command, parameter: nova._handle_datetime_command(),
+            'weather': lambda nova, command, parameter: nova._handle_weather_command(command),
+            'open_app': lambda nova, command, parameter: nova._handle_open_app_command(parameter),
+            'web_search': lambda nova, command, parameter: nova._handle_web_search_command(parameter),
+            'define': lambda nova, command, parameter: nova._handle_define_command(parameter),
+            'wikipedia': lambda nova, command, parameter: nova._handle_wikipedia_command(parameter),
+            'screenshot': lambda nova, command, parameter: nova._handle_screenshot_command(),
+            'volume': lambda nova, command, parameter: nova._handle_volume_command(command),
+            'shutdown': lambda nova, command, parameter: nova._handle_shutdown_command(),
+            'restart': lambda nova, command, parameter: nova._handle_restart_command(),
+            'lock': lambda nova, command, parameter: nova._handle_lock_command(),
+            'quote': lambda nova, command, parameter: nova._handle_quote_command(),
+            'fact': lambda nova, command, parameter: nova._handle_fact_command(),
+            'status': lambda nova, command, parameter: nova._handle_status_command(),
+            'youtube': lambda nova, command, parameter: nova._handle_youtube_command(parameter),
+            'news': lambda nova, command, parameter: nova._handle_news_command(),
+            'help': lambda nova, command, parameter: nova._handle_help_command(),
+            'exit': lambda nova, command, parameter: nova._handle_exit_command()
+        }
+        parameter_groups = self._setup_parameter_groups()
+        
+        # Registration order is match priority
+        for intent, patterns in self._setup_command_patterns().items():
+            router.register(intent, patterns, handlers[intent], parameter_groups.get(intent))
+        
+        router.set_fallback(lambda nova, command, parameter: nova._handle_unknown_command(command))
+    
     def _setup_personality_responses(self) -> Dict:
         """Setup Nova's personality responses"""
         return {
@@ -237,101 +302,11 @@ class NovaAI:
     def process_command(self, command: str) -> str:
         """Process user command and return response"""
         self.command_count += 1
-        command = command.lower().strip()
+        command = normalize_command(command)
         
         print(f"\n🎯 Processing command: {command}")
         
-        # Check for time-related commands
-        if self._match_pattern(command, 'time'):
-            return self._handle_time_command()
-        elif self._match_pattern(command, 'date'):
-            return self._handle_date_command()
-        elif self._match_pattern(command, 'datetime'):
-            return self._handle_datetime_command()
-        
-        # Check for weather commands
-        elif self._match_pattern(command, 'weather'):
-            return self._handle_weather_command()
-        
-        # Check for application commands
-        elif self._match_pattern(command, 'open_app'):
-            return self._handle_open_app_command(command)
-        
-        # Check for web search commands
-        elif self._match_pattern(command, 'web_search'):
-            return self._handle_web_search_command(command)
-        
-        # Check for Wikipedia commands
-        elif self._match_pattern(command, 'wikipedia'):
-            return self._handle_wikipedia_command(command)
-        
-        # Check for system control commands
-        elif self._match_pattern(command, 'screenshot'):
-            return self._handle_screenshot_command()
-        elif self._match_pattern(command, 'volume'):
-            return self._handle_volume_command(command)
-        elif self._match_pattern(command, 'shutdown'):
-            return self._handle_shutdown_command()
-        elif self._match_pattern(command, 'restart'):
-            return self._handle_restart_command()
-        elif self._match_pattern(command, 'lock'):
-            return self._handle_lock_command()
-        
-        # Check for utility commands
-        elif self._match_pattern(command, 'quote'):
-            return self._handle_quote_command()
-        elif self._match_pattern(command, 'fact'):
-            return self._handle_fact_command()
-        elif self._match_pattern(command, 'status'):
-            return self._handle_status_command()
-        
-        # Check for YouTube search
-        elif self._match_pattern(command, 'youtube'):
-            return self._handle_youtube_command(command)
-        
-        # Check for news
-        elif self._match_pattern(command, 'news'):
-            return self._handle_news_command()
-        
-        # Check for help
-        elif self._match_pattern(command, 'help'):
-            return self._handle_help_command()
-        
-        # Check for exit
-        elif self._match_pattern(command, 'exit'):
-            return self._handle_exit_command()
-        
-        # Unknown command
-        else:
-            return self._handle_unknown_command(command)
-    
-    def _match_pattern(self, command: str, pattern_type: str) -> bool:
-        """Check if command matches a specific pattern"""
-        patterns = self.command_patterns.get(pattern_type, [])
-        for pattern in patterns:
-            if re.search(pattern, command):
-                return True
-        return False
-    
-    def _extract_parameter(self, command: str, pattern_type: str) -> Optional[str]:
-        """Extract parameter from command using patterns"""
-        patterns = self.command_patterns.get(pattern_type, [])
-        for pattern in patterns:
-            match = re.search(pattern, command)
-            if match:
-                # Extract the parameter based on pattern type
-                if pattern_type == 'open_app':
-                    return match.group(1).strip()
-                elif pattern_type == 'web_search':
-                    return match.group(2).strip()
-                elif pattern_type == 'wikipedia':
-                    return match.group(2).strip()
-                elif pattern_type == 'youtube':
-                    return match.group(2).strip()
-                elif pattern_type == 'volume':
-                    if len(match.groups()) >= 2:
-                        return match.group(2)
-        return None
+        return self.router.dispatch(self, command)
     
     def _handle_time_command(self) -> str:
         """Handle time-related commands"""
@@ -357,18 +332,17 @@ class NovaAI:
         else:
             return self.get_personality_response('error', user=self.user_name)
     
-    def _handle_weather_command(self) -> str:
+    def _handle_weather_command(self, command: str) -> str:
         """Handle weather-related commands"""
-        # For demo, use mock weather
-        weather_type = random.choice(['sunny', 'cloudy', 'rainy', 'snowy'])
-        city = "your area"
+        result = self.web.get_weather_info(weather_city(command) or WEATHER_SETTINGS.get('default_city'))
+        if not result['success']:
+            return result['message']
         
-        response = self.utils.get_weather_personality(weather_type, city)
-        return response
+        response = self.utils.get_weather_personality(result['category'], result['city'])
+        return f"{result['message']}. {response}"
     
-    def _handle_open_app_command(self, command: str) -> str:
+    def _handle_open_app_command(self, app_name: Optional[str]) -> str:
         """Handle application opening commands"""
-        app_name = self._extract_parameter(command, 'open_app')
         if app_name:
             thinking = self.get_personality_response('thinking')
             print(f"💭 {thinking}")
@@ -381,9 +355,8 @@ class NovaAI:
         else:
             return self.get_personality_response('clarification', user=self.user_name)
     
-    def _handle_web_search_command(self, command: str) -> str:
+    def _handle_web_search_command(self, query: Optional[str]) -> str:
         """Handle web search commands"""
-        query = self._extract_parameter(command, 'web_search')
         if query:
             thinking = self.get_personality_response('thinking')
             print(f"💭 {thinking}")
@@ -396,9 +369,8 @@ class NovaAI:
         else:
             return self.get_personality_response('clarification', user=self.user_name)
     
-    def _handle_wikipedia_command(self, command: str) -> str:
+    def _handle_wikipedia_command(self, query: Optional[str]) -> str:
         """Handle Wikipedia commands"""
-        query = self._extract_parameter(command, 'wikipedia')
         if query:
             thinking = self.get_personality_response('thinking')
             print(f"💭 {thinking}")
@@ -416,6 +388,14 @@ class NovaAI:
         else:
             return self.get_personality_response('clarification', user=self.user_name)
     
+    def _handle_define_command(self, word: Optional[str]) -> str:
+        """Handle dictionary commands"""
+        if not word:
+            return self.get_personality_response('clarification', user=self.user_name)
+        
+        # Answered from the local dictionary, no network involved
+        return self.web.get_definition(word)['message']
+    
     def _handle_screenshot_command(self) -> str:
         """Handle screenshot commands"""
         thinking = self.get_personality_response('thinking')
@@ -498,15 +478,15 @@ class NovaAI:
     
     def _handle_status_command(self) -> str:
         """Handle status commands"""
-        result = self.utils.get_system_status()
+        # Answered from the telemetry snapshot, which never waits on the system
+        result = self.utils.get_system_status(self.system.get_system_info())
         if result['success']:
             return result['message']
         else:
             return self.get_personality_response('error', user=self.user_name)
     
-    def _handle_youtube_command(self, command: str) -> str:
+    def _handle_youtube_command(self, query: Optional[str]) -> str:
         """Handle YouTube search commands"""
-        query = self._extract_parameter(command, 'youtube')
         if query:
             thinking = self.get_personality_response('thinking')
             print(f"💭 {thinking}")
@@ -544,8 +524,9 @@ Here's what I can do for you, {self.user_name}:
 • "What's the time and date?" - Get both
 
 🌤️ **Weather & Information**
-• "What's the weather like?" - Get weather info
+• "What's the weather in London?" - Get weather info
 • "Tell me about [topic]" - Wikipedia search
+• "Define [word]" - Dictionary definitions
 • "Search for [query]" - Web search
 • "YouTube [query]" - Search YouTube
 
@@ -588,8 +569,8 @@ Just say "Nova" followed by your command, and I'll handle the rest!
             print("🚪 Say 'Nova, exit' to close the assistant")
             print("="*60)
             
-            # Start listening loop
-            self.voice.start_listening_loop(self._process_voice_command)
+            # Start listening loop; the next command is heard while Nova is still answering
+            self.voice.start_pipeline_loop(self._respond)
             
         except KeyboardInterrupt:
             print("\n\n🛑 Nova interrupted by user")
@@ -598,28 +579,35 @@ Just say "Nova" followed by your command, and I'll handle the rest!
             print(f"\n❌ Error in Nova: {e}")
             self.shutdown()
     
-    def _process_voice_command(self, command: str):
-        """Process voice command and respond"""
+    def _respond(self, command: str) -> str:
+        """Process a voice command and return the response to speak"""
         try:
             # Process the command
             response = self.process_command(command)
             
-            # Speak the response
             print(f"\n🤖 Nova: {response}")
-            self.voice.speak(response)
+            return response
             
         except Exception as e:
             error_msg = f"Sorry, {self.user_name}, I encountered an error: {str(e)}"
             print(f"\n❌ {error_msg}")
-            self.voice.speak(error_msg)
+            return error_msg
     
     def shutdown(self):
         """Shutdown Nova AI Assistant"""
         print("\n🔄 Shutting down Nova AI Assistant...")
         
-        # Stop voice interface
+        # Stop voice interface and background refreshes
         if hasattr(self, 'voice'):
             self.voice.stop_listening()
+        if hasattr(self, 'web'):
+            self.web.stop_news_feed()
+            self.web.close()
+        if hasattr(self, 'system'):
+            self.system.stop_app_watcher()
+            self.system.stop_process_monitor()
+            self.system.stop_telemetry()
+            self.system.stop_volume_control()
         
         # Calculate session stats
         session_duration = time.time() - self.session_start
@@ -0,0 +1,253 @@
+"""
+News Feed Module for Nova AI Assistant
+Polls RSS/Atom feeds or NewsAPI in the background into a bounded in-memory store
+"""
+
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from collections import deque
+from functools import partial
+from typing import IO, Deque, Dict, Iterator, List, Optional, Set
+
+import requests
+
+
+def _local_name(tag: str) -> str:
+    """Tag without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def headline_key(title: str) -> str:
+    """Form of a headline used to spot duplicates: case-folded, single spaces"""
+    return " ".join(title.casefold().split())
+
+
+def parse_feed(stream: IO[bytes], source: str = '') -> Iterator[Dict[str, str]]:
+    """
+    Stream headlines out of an RSS or Atom document
+    
+    Each item is discarded as soon as it has been read, so a large feed
+    never sits in memory as a whole tree.
+    
+    Args:
+        stream: File-like object with the feed's bytes
+        source: Name to report as each headline's source
+    
+    Yields:
+        Dictionaries with title, link, published and source
+    """
+    for _, element in ElementTree.iterparse(stream, events=('end',)):
+        name = _local_name(element.tag)
+        if name not in ('item', 'entry'):
+            continue
+        
+        title = link = published = ''
+        for child in element:
+            child_name = _local_name(child.tag)
+            if child_name == 'title':
+                title = "".join(child.itertext()).strip()
+            elif child_name == 'link' and not link:
+                # RSS puts the URL in the text, Atom in href
+                link = (child.get('href') or child.text or '').strip()
+            elif child_name in ('pubDate', 'published', 'updated') and not published:
+                published = (child.text or '').strip()
+        element.clear()
+        
+        if title:
+            yield {'title': title, 'link': link, 'published': published, 'source': source}
+
+
+def parse_newsapi(data: Dict) -> List[Dict[str, str]]:
+    """Headlines from a NewsAPI top-headlines response"""
+    headlines = []
+    for article in data.get('articles', []):
+        title = (article.get('title') or '').strip()
+        if title:
+            headlines.append({
+                'title': title,
+                'link': article.get('url') or '',
+                'published': article.get('publishedAt') or '',
+                'source': (article.get('source') or {}).get('name') or 'NewsAPI',
+            })
+    return headlines
+
+
+class HeadlineStore:
+    """Latest headlines per category, deduplicated and bounded in size"""
+    
+    def __init__(self, per_category: int = 50):
+        """
+        Initialize the store
+        
+        Args:
+            per_category: Most headlines kept per category; the oldest go first
+        """
+        self.per_category = per_category
+        self._headlines: Dict[str, Deque[Dict[str, str]]] = {}
+        self._keys: Dict[str, Set[str]] = {}
+        self._updated: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def add(self, category: str, headlines: List[Dict[str, str]]) -> int:
+        """
+        Add headlines, newest first, skipping ones already stored
+        
+        Returns:
+            Number of new headlines
+        """
+        added = 0
+        with self._lock:
+            stored = self._headlines.setdefault(category, deque())
+            keys = self._keys.setdefault(category, set())
+            # Oldest first, so the newest ends up at the front
+            for headline in reversed(headlines):
+                key = headline_key(headline['title'])
+                if key in keys:
+                    continue
+                if len(stored) >= self.per_category:
+                    keys.discard(headline_key(stored.pop()['title']))
+                stored.appendleft(headline)
+                keys.add(key)
+                added += 1
+            self._updated[category] = time.time()
+        return added
+    
+    def latest(self, category: str, count: int = 5) -> List[Dict[str, str]]:
+        """Newest headlines of a category; empty until it has been fetched"""
+        with self._lock:
+            stored = self._headlines.get(category)
+            if not stored:
+                return []
+            return [stored[index] for index in range(min(count, len(stored)))]
+    
+    def updated_at(self, category: str) -> Optional[float]:
+        """When a category was last refreshed, None if never"""
+        return self._updated.get(category)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get store statistics
+        
+        Returns:
+            Category -> number of headlines stored
+        """
+        with self._lock:
+            return {category: len(stored) for category, stored in self._headlines.items()}
+
+
+class NewsFeed:
+    """Refreshes a HeadlineStore from configured sources on a background thread"""
+    
+    def __init__(self, feeds: Dict[str, List[str]], session: Optional[requests.Session] = None,
+                 store: Optional[HeadlineStore] = None, interval: float = 900,
+                 newsapi_key: Optional[str] = None, newsapi_url: str = 'https://newsapi.org',
+                 timeout: float = 5.0):
+        """
+        Initialize the feed poller
+        
+        Args:
+            feeds: Category -> RSS/Atom feed URLs
+            session: Shared HTTP session
+            store: Where headlines go; a new one is created if not given
+            interval: Seconds between refreshes
+            newsapi_key: NewsAPI key; when set, categories are fetched from
+                NewsAPI instead of the feeds
+            newsapi_url: NewsAPI, or a local stand-in
+            timeout: Seconds to wait for each request
+        """
+        self.feeds = feeds
+        self.session = session if session is not None else requests.Session()
+        self.store = store if store is not None else HeadlineStore()
+        self.interval = interval
+        self.newsapi_key = newsapi_key
+        self.newsapi_url = newsapi_url.rstrip('/')
+        self.timeout = timeout
+        
+        # Completed refreshes and sources that failed, for measuring
+        self.refreshes = 0
+        self.errors = 0
+        
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the background refresh is running"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start refreshing in the background, beginning right away"""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nova-news", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop refreshing"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
+    
+    def refresh(self, category: Optional[str] = None) -> int:
+        """
+        Fetch every source of one or all categories now
+        
+        Returns:
+            Number of new headlines
+        """
+        categories = [category] if category else list(self.feeds)
+        added = 0
+        for name in categories:
+            if self._stop.is_set():
+                break
+            if self.newsapi_key:
+                sources = [partial(self._fetch_newsapi, name)]
+            else:
+                sources = [partial(self._fetch_feed, url) for url in self.feeds.get(name, [])]
+            
+            for fetch in sources:
+                try:
+                    added += self.store.add(name, fetch())
+                except (requests.RequestException, ElementTree.ParseError, ValueError) as e:
+                    self.errors += 1
+                    print(f"Warning: Could not refresh {name} news: {e}")
+        self.refreshes += 1
+        return added
+    
+    def _fetch_feed(self, url: str) -> List[Dict[str, str]]:
+        """Download and parse an RSS/Atom feed as it streams in"""
+        with self.session.get(url, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return list(parse_feed(response.raw, source=url))
+    
+    def _fetch_newsapi(self, category: str) -> List[Dict[str, str]]:
+        """Ask NewsAPI for a category's top headlines"""
+        response = self.session.get(f"{self.newsapi_url}/v2/top-headlines",
+                                    params={'category': category, 'country': 'us', 'apiKey': self.newsapi_key},
+                                    timeout=self.timeout)
+        response.raise_for_status()
+        return parse_newsapi(response.json())
+
+
+if __name__ == "__main__":
+    # Fetch feeds once and print the headlines, e.g. python news_feed.py https://example.com/rss.xml
+    if len(sys.argv) < 2:
+        print("Usage: python news_feed.py FEED_URL [FEED_URL...]")
+        sys.exit(1)
+    
+    feed = NewsFeed({'general': sys.argv[1:]})
+    start = time.perf_counter()
+    added = feed.refresh()
+    print(f"📰 {added} headline(s) in {time.perf_counter() - start:.2f}s")
+    for number, headline in enumerate(feed.store.latest('general', 20), 1):
+        print(f"  {number}. {headline['title']}")
@@ -5,8 +5,6 @@ With browser control, animations, and improved command handling
 
 import time
 import random
-import re
-import threading
 import webbrowser
 import subprocess
 import os
@@ -16,8 +14,11 @@ import sys
 # Import Nova's modules
 from voice_interface import VoiceInterface
 from system_controls import SystemControls
-from web_tools import WebTools
+from web_tools import WebTools, weather_city
 from utilities import Utilities
+from command_router import CommandRouter, get_router, normalize_command
+from tts_cache import phrases_from_pools
+from config import BROWSER_SITES, CUSTOM_RESPONSES, WEATHER_SETTINGS
 
 
 class NovaEnhanced:
@@ -44,38 +45,21 @@ class NovaEnhanced:
         self.current_animation = None
         
         # Enhanced command patterns
-        self.command_patterns = self._setup_enhanced_patterns()
+        self.router = get_router('enhanced', self._setup_router)
+        self.command_patterns = self.router.command_patterns
         self.personality_responses = self._setup_enhanced_personality()
         
         # Browser control
-        self.browser_commands = {
-            'google': 'https://www.google.com',
-            'youtube': 'https://www.youtube.com',
-            'github': 'https://github.com',
-            'stackoverflow': 'https://stackoverflow.com',
-            'reddit': 'https://www.reddit.com',
-            'twitter': 'https://twitter.com',
-            'linkedin': 'https://linkedin.com',
-            'facebook': 'https://facebook.com',
-            'instagram': 'https://instagram.com',
-            'netflix': 'https://netflix.com',
-            'spotify': 'https://open.spotify.com',
-            'amazon': 'https://amazon.com',
-            'wikipedia': 'https://wikipedia.org',
-            'news': 'https://news.google.com',
-            'weather': 'https://weather.com',
-            'maps': 'https://maps.google.com',
-            'gmail': 'https://gmail.com',
-            'drive': 'https://drive.google.com',
-            'calendar': 'https://calendar.google.com',
-            'translate': 'https://translate.google.com'
-        }
+        self.browser_commands = BROWSER_SITES
         
         # Session data
         self.session_start = time.time()
         self.command_count = 0
         self.conversation_history = []
         
+        # Fixed replies are worth rendering once and replaying
+        self.voice.prewarm_phrases(phrases_from_pools([self.personality_responses, CUSTOM_RESPONSES], user=self.user_name))
+        
         print("✅ Enhanced Nova AI Assistant initialized successfully!")
     
     def _setup_enhanced_patterns(self) -> Dict:
@@ -173,6 +157,36 @@ class NovaEnhanced:
             ]
         }
     
+    def _setup_router(self, router: CommandRouter):
+        """Register Enhanced Nova's commands with the shared command router"""
+        handlers = {
+            'open_website': lambda nova, command, parameter: nova._handle_open_website_command(parameter),
+            'search_web': lambda nova, command, parameter: nova._handle_search_web_command(parameter),
+            'open_app': lambda nova, command, parameter: nova._handle_open_app_command(parameter),
+            'time': lambda nova, command, parameter: nova._handle_time_command(),
+            'date': lambda nova, command, parameter: nova._handle_date_command(),
+            'weather': lambda nova, command, parameter: nova._handle_weather_command(command),
+            'screenshot': lambda nova, command, parameter: nova._handle_screenshot_command(),
+            'volume': lambda nova, command, parameter: nova._handle_volume_command(command),
+            'quote': lambda nova, command, parameter: nova._handle_quote_command(),
+            'fact': lambda nova, command, parameter: nova._handle_fact_command(),
+            'help': lambda nova, command, parameter: nova._get_enhanced_help(),
+            'exit': lambda nova, command, parameter: f"Goodbye, {nova.user_name}! It's been a pleasure serving you. Nova signing off! 👋",
+            'greeting': lambda nova, command, parameter: random.choice(nova.personality_responses['greetings']).format(user=nova.user_name),
+            'thanks': lambda nova, command, parameter: f"You're welcome, {nova.user_name}! I'm here to help. 😊"
+        }
+        parameter_groups = {
+            'open_website': 2,
+            'search_web': 2,
+            'open_app': 1
+        }
+        
+        # Registration order is match priority
+        for intent, patterns in self._setup_enhanced_patterns().items():
+            router.register(intent, patterns, handlers[intent], parameter_groups.get(intent))
+        
+        router.set_fallback(lambda nova, command, parameter: f"I'm not sure how to handle '{command}', {nova.user_name}. Try saying 'help' to see what I can do! 🤔")
+    
     def _setup_enhanced_personality(self) -> Dict:
         """Setup enhanced personality responses"""
         return {
@@ -283,155 +297,116 @@ class NovaEnhanced:
     def process_enhanced_command(self, command: str) -> str:
         """Process commands with enhanced recognition"""
         self.command_count += 1
-        command = command.lower().strip()
+        command = normalize_command(command)
         
         print(f"\n🎯 Processing command: {command}")
         
         # Add to conversation history
         self.conversation_history.append(f"User: {command}")
         
-        # Check for website opening
-        if self._match_pattern(command, 'open_website'):
-            site = self._extract_parameter(command, 'open_website')
-            if site:
-                self.show_animation("processing", f"Opening {site}...")
-                response = self.open_website(site)
-                self.show_animation("success", "Website opened!")
-                return response
-        
-        # Check for web search
-        elif self._match_pattern(command, 'search_web'):
-            query = self._extract_parameter(command, 'search_web')
-            if query:
-                self.show_animation("processing", f"Searching for '{query}'...")
-                response = self.search_web(query)
-                self.show_animation("success", "Search completed!")
-                return response
-        
-        # Check for app opening
-        elif self._match_pattern(command, 'open_app'):
-            app = self._extract_parameter(command, 'open_app')
-            if app:
-                self.show_animation("processing", f"Opening {app}...")
-                success = self.system.open_application(app)
-                if success:
-                    self.show_animation("success", f"{app} opened!")
-                    return f"Opening {app} for you, {self.user_name}! 🚀"
-                else:
-                    self.show_animation("error", f"Couldn't open {app}")
-                    return f"Sorry, {self.user_name}, I couldn't find or open {app}."
-        
-        # Check for time commands
-        elif self._match_pattern(command, 'time'):
-            self.show_animation("processing", "Getting current time...")
-            result = self.utils.get_current_time()
-            if result['success']:
-                self.show_animation("success", "Time retrieved!")
-                return result['message']
-        
-        # Check for date commands
-        elif self._match_pattern(command, 'date'):
-            self.show_animation("processing", "Getting current date...")
-            result = self.utils.get_current_date()
-            if result['success']:
-                self.show_animation("success", "Date retrieved!")
-                return result['message']
-        
-        # Check for weather commands
-        elif self._match_pattern(command, 'weather'):
-            self.show_animation("processing", "Checking weather...")
-            weather_type = random.choice(['sunny', 'cloudy', 'rainy', 'snowy'])
-            response = self.utils.get_weather_personality(weather_type, "your area")
-            self.show_animation("success", "Weather checked!")
+        return self.router.dispatch(self, command)
+    
+    def _handle_open_website_command(self, site: Optional[str]) -> Optional[str]:
+        """Handle website opening commands"""
+        if site:
+            self.show_animation("processing", f"Opening {site}...")
+            response = self.open_website(site)
+            self.show_animation("success", "Website opened!")
             return response
-        
-        # Check for screenshot commands
-        elif self._match_pattern(command, 'screenshot'):
-            self.show_animation("processing", "Taking screenshot...")
-            result = self.system.take_screenshot()
-            if result:
-                self.show_animation("success", "Screenshot captured!")
-                return f"Screenshot captured and saved, {self.user_name}! 📸"
+    
+    def _handle_search_web_command(self, query: Optional[str]) -> Optional[str]:
+        """Handle web search commands"""
+        if query:
+            self.show_animation("processing", f"Searching for '{query}'...")
+            response = self.search_web(query)
+            self.show_animation("success", "Search completed!")
+            return response
+    
+    def _handle_open_app_command(self, app: Optional[str]) -> Optional[str]:
+        """Handle application opening commands"""
+        if app:
+            self.show_animation("processing", f"Opening {app}...")
+            success = self.system.open_application(app)
+            if success:
+                self.show_animation("success", f"{app} opened!")
+                return f"Opening {app} for you, {self.user_name}! 🚀"
             else:
-                self.show_animation("error", "Screenshot failed")
-                return f"Sorry, {self.user_name}, the screenshot failed."
-        
-        # Check for volume commands
-        elif self._match_pattern(command, 'volume'):
-            self.show_animation("processing", "Adjusting volume...")
-            if 'up' in command:
-                success = self.system.adjust_volume(10)
-                if success:
-                    self.show_animation("success", "Volume increased!")
-                    return f"Volume increased, {self.user_name}! 🔊"
-            elif 'down' in command:
-                success = self.system.adjust_volume(-10)
-                if success:
-                    self.show_animation("success", "Volume decreased!")
-                    return f"Volume decreased, {self.user_name}! 🔉"
-            elif 'mute' in command:
-                success = self.system.set_volume(0)
-                if success:
-                    self.show_animation("success", "Audio muted!")
-                    return f"Audio muted, {self.user_name}! 🔇"
-        
-        # Check for quote commands
-        elif self._match_pattern(command, 'quote'):
-            self.show_animation("processing", "Finding inspiration...")
-            result = self.utils.get_random_quote()
-            if result['success']:
-                self.show_animation("success", "Quote found!")
-                return result['message']
-        
-        # Check for fact commands
-        elif self._match_pattern(command, 'fact'):
-            self.show_animation("processing", "Finding interesting facts...")
-            result = self.utils.get_random_fact()
-            if result['success']:
-                self.show_animation("success", "Fact found!")
-                return result['message']
-        
-        # Check for greeting commands
-        elif self._match_pattern(command, 'greeting'):
-            return random.choice(self.personality_responses['greetings']).format(user=self.user_name)
-        
-        # Check for thanks commands
-        elif self._match_pattern(command, 'thanks'):
-            return f"You're welcome, {self.user_name}! I'm here to help. 😊"
-        
-        # Check for help commands
-        elif self._match_pattern(command, 'help'):
-            return self._get_enhanced_help()
-        
-        # Check for exit commands
-        elif self._match_pattern(command, 'exit'):
-            return f"Goodbye, {self.user_name}! It's been a pleasure serving you. Nova signing off! 👋"
+                self.show_animation("error", f"Couldn't open {app}")
+                return f"Sorry, {self.user_name}, I couldn't find or open {app}."
+    
+    def _handle_time_command(self) -> Optional[str]:
+        """Handle time commands"""
+        self.show_animation("processing", "Getting current time...")
+        result = self.utils.get_current_time()
+        if result['success']:
+            self.show_animation("success", "Time retrieved!")
+            return result['message']
+    
+    def _handle_date_command(self) -> Optional[str]:
+        """Handle date commands"""
+        self.show_animation("processing", "Getting current date...")
+        result = self.utils.get_current_date()
+        if result['success']:
+            self.show_animation("success", "Date retrieved!")
+            return result['message']
+    
+    def _handle_weather_command(self, command: str) -> str:
+        """Handle weather commands"""
+        self.show_animation("processing", "Checking weather...")
+        result = self.web.get_weather_info(weather_city(command) or WEATHER_SETTINGS.get('default_city'))
+        if not result['success']:
+            self.show_animation("error", "Weather unavailable")
+            return result['message']
         
-        # Unknown command
+        response = self.utils.get_weather_personality(result['category'], result['city'])
+        self.show_animation("success", "Weather checked!")
+        return f"{result['message']}. {response}"
+    
+    def _handle_screenshot_command(self) -> str:
+        """Handle screenshot commands"""
+        self.show_animation("processing", "Taking screenshot...")
+        result = self.system.take_screenshot()
+        if result:
+            self.show_animation("success", "Screenshot captured!")
+            return f"Screenshot captured and saved, {self.user_name}! 📸"
         else:
-            return f"I'm not sure how to handle '{command}', {self.user_name}. Try saying 'help' to see what I can do! 🤔"
+            self.show_animation("error", "Screenshot failed")
+            return f"Sorry, {self.user_name}, the screenshot failed."
+    
+    def _handle_volume_command(self, command: str) -> Optional[str]:
+        """Handle volume commands"""
+        self.show_animation("processing", "Adjusting volume...")
+        if 'up' in command:
+            success = self.system.adjust_volume(10)
+            if success:
+                self.show_animation("success", "Volume increased!")
+                return f"Volume increased, {self.user_name}! 🔊"
+        elif 'down' in command:
+            success = self.system.adjust_volume(-10)
+            if success:
+                self.show_animation("success", "Volume decreased!")
+                return f"Volume decreased, {self.user_name}! 🔉"
+        elif 'mute' in command:
+            success = self.system.set_volume(0)
+            if success:
+                self.show_animation("success", "Audio muted!")
+                return f"Audio muted, {self.user_name}! 🔇"
     
-    def _match_pattern(self, command: str, pattern_type: str) -> bool:
-        """Check if command matches a specific pattern"""
-        patterns = self.command_patterns.get(pattern_type, [])
-        for pattern in patterns:
-            if re.search(pattern, command):
-                return True
-        return False
+    def _handle_quote_command(self) -> Optional[str]:
+        """Handle quote commands"""
+        self.show_animation("processing", "Finding inspiration...")
+        result = self.utils.get_random_quote()
+        if result['success']:
+            self.show_animation("success", "Quote found!")
+            return result['message']
     
-    def _extract_parameter(self, command: str, pattern_type: str) -> Optional[str]:
-        """Extract parameter from command using patterns"""
-        patterns = self.command_patterns.get(pattern_type, [])
-        for pattern in patterns:
-            match = re.search(pattern, command)
-            if match:
-                if pattern_type == 'open_website':
-                    return match.group(2).strip()
-                elif pattern_type == 'search_web':
-                    return match.group(2).strip()
-                elif pattern_type == 'open_app':
-                    return match.group(1).strip()
-        return None
+    def _handle_fact_command(self) -> Optional[str]:
+        """Handle fact commands"""
+        self.show_animation("processing", "Finding interesting facts...")
+        result = self.utils.get_random_fact()
+        if result['success']:
+            self.show_animation("success", "Fact found!")
+            return result['message']
     
     def _get_enhanced_help(self) -> str:
         """Get enhanced help information"""
@@ -452,7 +427,7 @@ class NovaEnhanced:
 
 🕐 **Information & Utilities**
 • "What time is it?" - Get current time
-• "What's the weather like?" - Weather info
+• "What's the weather in London?" - Weather info
 • "Give me a quote" - Motivational quotes
 • "Tell me a fact" - Interesting facts
 
@@ -484,8 +459,8 @@ Example: "Nova, open Google"
             print("🚪 Say 'Nova, exit' to close the assistant")
             print("="*60)
             
-            # Start listening loop
-            self.voice.start_listening_loop(self._process_enhanced_voice_command)
+            # Start listening loop; the next command is heard while Nova is still answering
+            self.voice.start_pipeline_loop(self._respond)
             
         except KeyboardInterrupt:
             print("\n\n🛑 Enhanced Nova interrupted by user")
@@ -494,8 +469,8 @@ Example: "Nova, open Google"
             print(f"\n❌ Error in Enhanced Nova: {e}")
             self.shutdown()
     
-    def _process_enhanced_voice_command(self, command: str):
-        """Process voice command with enhanced features"""
+    def _respond(self, command: str) -> str:
+        """Process a voice command and return the response to speak"""
         try:
             # Process the command
             response = self.process_enhanced_command(command)
@@ -503,22 +478,23 @@ Example: "Nova, open Google"
             # Add to conversation history
             self.conversation_history.append(f"Nova: {response}")
             
-            # Speak the response
             print(f"\n🤖 Nova: {response}")
-            self.voice.speak(response)
+            return response
             
         except Exception as e:
             error_msg = f"Sorry, {self.user_name}, I encountered an error: {str(e)}"
             print(f"\n❌ {error_msg}")
-            self.voice.speak(error_msg)
+            return error_msg
     
     def shutdown(self):
         """Shutdown Enhanced Nova"""
         print("\n🔄 Shutting down Enhanced Nova AI Assistant...")
         
-        # Stop voice interface
+        # Stop voice interface and web connections
         if hasattr(self, 'voice'):
             self.voice.stop_listening()
+        if hasattr(self, 'web'):
+            self.web.close()
         
         # Calculate session stats
         session_duration = time.time() - self.session_start
@@ -8,6 +8,7 @@ from tkinter import ttk, scrolledtext
 import threading
 import time
 import random
+import re
 import webbrowser
 from datetime import datetime
 
@@ -16,6 +17,8 @@ from voice_interface import VoiceInterface
 from system_controls import SystemControls
 from web_tools import WebTools
 from utilities import Utilities
+from command_router import CommandRouter, get_router, normalize_command
+from config import BROWSER_SITES
 
 
 class NovaGUI:
@@ -33,6 +36,7 @@ class NovaGUI:
         self.system = SystemControls()
         self.web = WebTools()
         self.utils = Utilities()
+        self.router = get_router('gui', self._setup_router)
         
         # GUI state
         self.is_listening = False
@@ -250,12 +254,13 @@ class NovaGUI:
         try:
             while self.is_listening:
                 # Listen for wake word
-                command = self.voice.listen(timeout=3, phrase_time_limit=5)
-                if command and "nova" in command.lower():
+                heard, actual_command = self.voice.wait_for_wake_word("nova", timeout=3, phrase_time_limit=5)
+                if heard:
                     self.root.after(0, lambda: self.update_status("🎯 Processing command...", "#00aaff"))
                     
                     # Listen for actual command
-                    actual_command = self.voice.listen(timeout=5, phrase_time_limit=15)
+                    if not actual_command:
+                        actual_command = self.voice.listen(timeout=5, phrase_time_limit=15, resume=True)
                     if actual_command:
                         # Remove wake word and process
                         clean_command = actual_command.replace("nova", "").strip()
@@ -284,106 +289,107 @@ class NovaGUI:
         # Update status
         self.update_status("🎤 Listening for commands...", "#ffaa00")
     
+    def _setup_command_keywords(self) -> dict:
+        """Setup the keywords that trigger each command"""
+        return {
+            'open_website': ['open', 'go to', 'visit'],
+            'search_web': ['search', 'find', 'look up'],
+            'time': ['time', 'clock'],
+            'date': ['date', 'day'],
+            'weather': ['weather', 'temperature'],
+            'screenshot': ['screenshot', 'screen shot'],
+            'quote': ['quote', 'inspiration'],
+            'fact': ['fact', 'interesting'],
+            'help': ['help'],
+            'greeting': ['hello', 'hi', 'hey']
+        }
+    
+    def _setup_router(self, router: CommandRouter):
+        """Register the GUI's commands with the shared command router"""
+        handlers = {
+            'open_website': lambda gui, command, parameter: gui._handle_open_website_command(command),
+            'search_web': lambda gui, command, parameter: gui._handle_search_web_command(command),
+            'time': lambda gui, command, parameter: gui._handle_time_command(),
+            'date': lambda gui, command, parameter: gui._handle_date_command(),
+            'weather': lambda gui, command, parameter: gui._handle_weather_command(),
+            'screenshot': lambda gui, command, parameter: gui._handle_screenshot_command(),
+            'quote': lambda gui, command, parameter: gui._handle_quote_command(),
+            'fact': lambda gui, command, parameter: gui._handle_fact_command(),
+            'help': lambda gui, command, parameter: "I can help you with: opening websites, searching the web, getting time/date, weather, screenshots, quotes, and facts! Just ask!",
+            'greeting': lambda gui, command, parameter: "Hello! How can I assist you today? 😊"
+        }
+        
+        # Keywords match anywhere in the command, like a substring check
+        for intent, keywords in self._setup_command_keywords().items():
+            router.register(intent, [re.escape(keyword) for keyword in keywords], handlers[intent])
+        
+        router.set_fallback(lambda gui, command, parameter: f"I'm not sure how to handle '{command}'. Try saying 'help' to see what I can do!")
+    
     def process_command(self, command: str) -> str:
         """Process text command and return response"""
-        command = command.lower().strip()
-        
-        # Website opening
-        if any(word in command for word in ['open', 'go to', 'visit']):
-            for word in ['open', 'go to', 'visit']:
-                if word in command:
-                    site = command.replace(word, '').strip()
-                    return self.open_website(site)
-        
-        # Web search
-        elif any(word in command for word in ['search', 'find', 'look up']):
-            for word in ['search', 'find', 'look up']:
-                if word in command:
-                    query = command.replace(word, '').strip()
-                    if 'for' in query:
-                        query = query.replace('for', '').strip()
-                    return self.search_web(query)
-        
-        # Time
-        elif any(word in command for word in ['time', 'clock']):
-            result = self.utils.get_current_time()
-            if result['success']:
-                return result['message']
-        
-        # Date
-        elif any(word in command for word in ['date', 'day']):
-            result = self.utils.get_current_date()
-            if result['success']:
-                return result['message']
-        
-        # Weather
-        elif any(word in command for word in ['weather', 'temperature']):
-            weather_type = random.choice(['sunny', 'cloudy', 'rainy', 'snowy'])
-            return self.utils.get_weather_personality(weather_type, "your area")
-        
-        # Screenshot
-        elif any(word in command for word in ['screenshot', 'screen shot']):
-            result = self.system.take_screenshot()
-            if result:
-                return f"Screenshot captured and saved! 📸"
-            else:
-                return "Sorry, the screenshot failed."
-        
-        # Quote
-        elif any(word in command for word in ['quote', 'inspiration']):
-            result = self.utils.get_random_quote()
-            if result['success']:
-                return result['message']
-        
-        # Fact
-        elif any(word in command for word in ['fact', 'interesting']):
-            result = self.utils.get_random_fact()
-            if result['success']:
-                return result['message']
-        
-        # Help
-        elif 'help' in command:
-            return "I can help you with: opening websites, searching the web, getting time/date, weather, screenshots, quotes, and facts! Just ask!"
-        
-        # Greeting
-        elif any(word in command for word in ['hello', 'hi', 'hey']):
-            return "Hello! How can I assist you today? 😊"
-        
-        # Unknown command
+        command = normalize_command(command)
+        return self.router.dispatch(self, command)
+    
+    def _handle_open_website_command(self, command: str) -> str:
+        """Handle website opening commands"""
+        for word in ['open', 'go to', 'visit']:
+            if word in command:
+                site = command.replace(word, '').strip()
+                return self.open_website(site)
+    
+    def _handle_search_web_command(self, command: str) -> str:
+        """Handle web search commands"""
+        for word in ['search', 'find', 'look up']:
+            if word in command:
+                query = command.replace(word, '').strip()
+                if 'for' in query:
+                    query = query.replace('for', '').strip()
+                return self.search_web(query)
+    
+    def _handle_time_command(self) -> str:
+        """Handle time commands"""
+        result = self.utils.get_current_time()
+        if result['success']:
+            return result['message']
+    
+    def _handle_date_command(self) -> str:
+        """Handle date commands"""
+        result = self.utils.get_current_date()
+        if result['success']:
+            return result['message']
+    
+    def _handle_weather_command(self) -> str:
+        """Handle weather commands"""
+        weather_type = random.choice(['sunny', 'cloudy', 'rainy', 'snowy'])
+        return self.utils.get_weather_personality(weather_type, "your area")
+    
+    def _handle_screenshot_command(self) -> str:
+        """Handle screenshot commands"""
+        result = self.system.take_screenshot()
+        if result:
+            return f"Screenshot captured and saved! 📸"
         else:
-            return f"I'm not sure how to handle '{command}'. Try saying 'help' to see what I can do!"
+            return "Sorry, the screenshot failed."
+    
+    def _handle_quote_command(self) -> str:
+        """Handle quote commands"""
+        result = self.utils.get_random_quote()
+        if result['success']:
+            return result['message']
+    
+    def _handle_fact_command(self) -> str:
+        """Handle fact commands"""
+        result = self.utils.get_random_fact()
+        if result['success']:
+            return result['message']
     
     def open_website(self, site_name: str) -> str:
         """Open a website"""
         try:
             site_name = site_name.lower().strip()
             
-            # Known sites
-            known_sites = {
-                'google': 'https://www.google.com',
-                'youtube': 'https://www.youtube.com',
-                'github': 'https://github.com',
-                'stackoverflow': 'https://stackoverflow.com',
-                'reddit': 'https://reddit.com',
-                'twitter': 'https://twitter.com',
-                'linkedin': 'https://linkedin.com',
-                'facebook': 'https://facebook.com',
-                'instagram': 'https://instagram.com',
-                'netflix': 'https://netflix.com',
-                'spotify': 'https://open.spotify.com',
-                'amazon': 'https://amazon.com',
-                'wikipedia': 'https://wikipedia.org',
-                'news': 'https://news.google.com',
-                'weather': 'https://weather.com',
-                'maps': 'https://maps.google.com',
-                'gmail': 'https://gmail.com',
-                'drive': 'https://drive.google.com',
-                'calendar': 'https://calendar.google.com',
-                'translate': 'https://translate.google.com'
-            }
-            
-            if site_name in known_sites:
-                url = known_sites[site_name]
+            if site_name in BROWSER_SITES:
+                url = BROWSER_SITES[site_name]
                 webbrowser.open(url)
                 return f"Opening {site_name} in your browser! 🚀"
             else:
@@ -391,7 +397,7 @@ class NovaGUI:
                 url = f"https://www.{site_name}.com"
                 webbrowser.open(url)
                 return f"Opening {site_name} in your browser! 🌐"
-                
+        
         except Exception as e:
             return f"Sorry, I couldn't open {site_name}. Error: {str(e)}"
     
@@ -411,23 +417,21 @@ class NovaGUI:
             self.update_status("🗣️ Speaking...", "#ff00ff")
             self.start_speaking_animation()
             
-            # Speak in separate thread
-            threading.Thread(target=self._speak_thread, args=(response,), daemon=True).start()
+            # Queued on the voice interface's speech thread; never blocks Tk
+            self.voice.speak(response, wait=False, on_done=self._on_speech_done)
         except Exception as e:
             self.add_to_conversation("System", f"Speech error: {str(e)}")
             self.is_speaking = False
             self.update_status("🟢 Nova is ready!", "#00ff88")
     
-    def _speak_thread(self, response: str):
-        """Speech thread"""
-        try:
-            self.voice.speak(response)
+    def _on_speech_done(self, utterance):
+        """Called on the speech thread when a response has been spoken"""
+        if utterance.error is not None:
+            self.root.after(0, lambda: self.add_to_conversation("System", f"Speech error: {str(utterance.error)}"))
+        if not self.voice.speech.is_speaking and not self.voice.speech.pending:
+            self.is_speaking = False
             self.root.after(0, lambda: self.stop_speaking_animation())
             self.root.after(0, lambda: self.update_status("🟢 Nova is ready!", "#00ff88"))
-        except Exception as e:
-            self.root.after(0, lambda: self.add_to_conversation("System", f"Speech error: {str(e)}"))
-        finally:
-            self.is_speaking = False
     
     def test_command(self, command: str):
         """Test a command"""
@@ -526,6 +530,7 @@ def main():
     def on_closing():
         if app.is_listening:
             app.stop_voice_listening()
+        app.web.close()
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
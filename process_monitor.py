@@ -0,0 +1,317 @@
+"""
+Process Monitor Module for Nova AI Assistant
+Samples the process table in the background, with CPU usage measured between samples
+"""
+
+import heapq
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+
+class ProcessSnapshot:
+    """One sample of the process table, never changed once taken"""
+    
+    def __init__(self, processes: Dict[int, Dict], taken_at: float, top_size: int = 50):
+        """
+        Index a sample
+        
+        Args:
+            processes: PID -> {'pid', 'name', 'cpu_percent', 'memory_percent',
+                'create_time'}
+            taken_at: time.time() of the sample
+            top_size: Busiest processes kept ready for top()
+        """
+        self.processes = processes
+        self.taken_at = taken_at
+        
+        # Lower-case name -> PIDs
+        self.by_name: Dict[str, List[int]] = {}
+        for pid, process in processes.items():
+            self.by_name.setdefault((process['name'] or '').lower(), []).append(pid)
+        
+        # Busiest first; most callers ask for no more than this
+        self._top = heapq.nlargest(top_size, processes.values(),
+                                   key=lambda process: (process['cpu_percent'], process['memory_percent']))
+    
+    def __len__(self) -> int:
+        return len(self.processes)
+    
+    def top(self, limit: int = 20) -> List[Dict]:
+        """Busiest processes by CPU, then memory"""
+        if limit <= len(self._top):
+            return self._top[:limit]
+        return heapq.nlargest(limit, self.processes.values(),
+                              key=lambda process: (process['cpu_percent'], process['memory_percent']))
+    
+    def pids(self, name: str) -> List[int]:
+        """PIDs of processes with this name, ignoring case"""
+        return self.by_name.get(name.lower(), [])
+
+
+class ProcessMonitor:
+    """Keeps a ProcessSnapshot fresh on a background thread"""
+    
+    def __init__(self, interval: float = 2.0, top_size: int = 50):
+        """
+        Initialize the monitor
+        
+        Args:
+            interval: Seconds between samples; CPU usage is averaged over it
+            top_size: Busiest processes kept ready in each snapshot
+        """
+        self.interval = interval
+        self.top_size = top_size
+        
+        # PID -> (create_time, CPU seconds used) at the previous sample
+        self._cpu_times: Dict[int, Tuple[float, float]] = {}
+        self._sampled_at: Optional[float] = None
+        self._cpu_count = psutil.cpu_count() or 1
+        
+        self.snapshot: Optional[ProcessSnapshot] = None
+        # Samples taken and seconds the last one took, for measuring
+        self.samples = 0
+        self.last_sample_ms = 0.0
+        
+        # Held while sampling, which callers may also do between background samples
+        self._sample_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampler thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start sampling in the background"""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nova-processes", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop sampling"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run(self) -> None:
+        # The first sample only sets the baseline; CPU usage needs a second
+        self.sample()
+        self._stop.wait(min(self.interval, 0.5))
+        while not self._stop.is_set():
+            self.sample()
+            self._ready.set()
+            self._stop.wait(self.interval)
+    
+    def latest(self, timeout: float = 1.0) -> Optional[ProcessSnapshot]:
+        """
+        Get the newest snapshot
+        
+        Args:
+            timeout: Seconds to wait for the first snapshot with CPU usage,
+                right after start()
+        
+        Returns:
+            The snapshot, or None if there is none yet
+        """
+        self._ready.wait(timeout)
+        return self.snapshot
+    
+    def sample(self) -> ProcessSnapshot:
+        """
+        Read the process table now and publish it as the latest snapshot
+        
+        CPU usage is each process's CPU time since the previous sample over
+        the time between them, as a percentage of the whole machine.
+        """
+        with self._sample_lock:
+            return self._sample()
+    
+    def _sample(self) -> ProcessSnapshot:
+        start = time.perf_counter()
+        now = time.monotonic()
+        elapsed = now - self._sampled_at if self._sampled_at is not None else 0.0
+        total_memory = psutil.virtual_memory().total or 1
+        
+        previous = self._cpu_times
+        cpu_times: Dict[int, Tuple[float, float]] = {}
+        processes: Dict[int, Dict] = {}
+        for proc in psutil.process_iter(['name', 'cpu_times', 'memory_info', 'create_time']):
+            info = proc.info
+            times = info['cpu_times']
+            used = times.user + times.system if times is not None else 0.0
+            created = info['create_time'] or 0.0
+            cpu_times[proc.pid] = (created, used)
+            
+            cpu_percent = 0.0
+            before = previous.get(proc.pid)
+            # A different start time means the PID was reused
+            if elapsed > 0 and before is not None and before[0] == created:
+                cpu_percent = max(0.0, (used - before[1]) / elapsed * 100 / self._cpu_count)
+            memory = info['memory_info']
+            processes[proc.pid] = {
+                'pid': proc.pid,
+                'name': info['name'],
+                'cpu_percent': round(cpu_percent, 1),
+                'memory_percent': memory.rss / total_memory * 100 if memory is not None else 0.0,
+                'create_time': created,
+            }
+        
+        self._cpu_times = cpu_times
+        self._sampled_at = now
+        self.snapshot = ProcessSnapshot(processes, time.time(), self.top_size)
+        self.samples += 1
+        self.last_sample_ms = (time.perf_counter() - start) * 1000
+        return self.snapshot
+    
+    def find(self, name: str, limit: Optional[int] = None) -> List[psutil.Process]:
+        """
+        Running processes with this name, from the latest snapshot
+        
+        PIDs are checked against their start time so a reused PID is never
+        mistaken for the process that had it.
+        
+        Args:
+            name: Process name, ignoring case
+            limit: Stop after this many
+        
+        Returns:
+            Matching processes; empty if none were running at the last sample
+        """
+        snapshot = self.snapshot
+        if snapshot is None:
+            return []
+        found = []
+        for pid in snapshot.pids(name):
+            try:
+                proc = psutil.Process(pid)
+                if proc.create_time() == snapshot.processes[pid]['create_time']:
+                    found.append(proc)
+                    if limit is not None and len(found) >= limit:
+                        break
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return found
+
+
+def scan_processes(limit: int = 20) -> List[Dict]:
+    """The one-pass listing SystemControls used to do, for comparison"""
+    processes = []
+    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+        processes.append(proc.info)
+    processes.sort(key=lambda process: process['cpu_percent'] or 0, reverse=True)
+    return processes[:limit]
+
+
+def scan_for_name(name: str) -> Optional[psutil.Process]:
+    """The full scan SystemControls.kill_process used to do, for comparison"""
+    for proc in psutil.process_iter(['name']):
+        if (proc.info['name'] or '').lower() == name.lower():
+            return proc
+    return None
+
+
+def benchmark_monitor(processes: int = 2000, rounds: int = 20) -> Dict[str, float]:
+    """
+    Measure the monitor on a host with thousands of processes
+    
+    Idle `sleep` processes are started to reach the count, plus one busy
+    process the top-N ranking should find.
+    
+    Args:
+        processes: Extra processes to start
+        rounds: Queries to time
+    
+    Returns:
+        Dictionary with process counts, sample_ms, sampler_cpu_percent,
+        scan_ms and top_us, name_scan_ms and name_lookup_us, and whether
+        each ranking put the busy process first
+    """
+    children = [subprocess.Popen(['sleep', '600']) for _ in range(processes)]
+    busy = subprocess.Popen([sys.executable, '-c', 'while True: pass'])
+    try:
+        monitor = ProcessMonitor(interval=1.0)
+        monitor.sample()
+        sample_seconds = sample_cpu = 0.0
+        for _ in range(3):
+            time.sleep(monitor.interval)
+            cpu_start = time.process_time()
+            start = time.perf_counter()
+            monitor.sample()
+            sample_seconds += time.perf_counter() - start
+            sample_cpu += time.process_time() - cpu_start
+        sample_ms = sample_seconds / 3 * 1000
+        # Fraction of a core used at a 1s interval
+        sampler_cpu_percent = sample_cpu / 3 / monitor.interval * 100
+        
+        start = time.perf_counter()
+        legacy = scan_processes(20)
+        scan_ms = (time.perf_counter() - start) * 1000
+        
+        snapshot = monitor.snapshot
+        start = time.perf_counter()
+        for _ in range(rounds):
+            top = snapshot.top(20)
+        top_us = (time.perf_counter() - start) / rounds * 1e6
+        
+        start = time.perf_counter()
+        scan_for_name('no-such-process')
+        name_scan_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        for _ in range(rounds):
+            monitor.find('sleep', limit=1)
+        name_lookup_us = (time.perf_counter() - start) / rounds * 1e6
+        
+        return {
+            'processes': len(snapshot),
+            'sample_ms': sample_ms,
+            'sampler_cpu_percent': sampler_cpu_percent,
+            'scan_ms': scan_ms,
+            'top_us': top_us,
+            'name_scan_ms': name_scan_ms,
+            'name_lookup_us': name_lookup_us,
+            'busy_first_scan': bool(legacy) and legacy[0]['pid'] == busy.pid,
+            'busy_first_monitor': bool(top) and top[0]['pid'] == busy.pid,
+        }
+    finally:
+        for child in children + [busy]:
+            child.kill()
+        for child in children + [busy]:
+            child.wait()
+
+
+def print_benchmark(report: Dict[str, float]) -> None:
+    """Print a benchmark_monitor() report"""
+    print(f"  {report['processes']:,} processes")
+    print(f"  One-pass listing (old)      {report['scan_ms']:9.1f} ms, busiest process first: {report['busy_first_scan']}")
+    print(f"  Top 20 from the snapshot    {report['top_us']:9.1f} µs, busiest process first: {report['busy_first_monitor']}")
+    print(f"  Find by name, full scan     {report['name_scan_ms']:9.1f} ms")
+    print(f"  Find by name, index         {report['name_lookup_us']:9.1f} µs")
+    print(f"  Background sample           {report['sample_ms']:9.1f} ms "
+          f"({report['sampler_cpu_percent']:.1f}% of a core at a 1s interval)")
+
+
+if __name__ == "__main__":
+    # Show the busiest processes, or benchmark, e.g. python process_monitor.py bench 2000
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        print("🎯 Benchmarking the process monitor")
+        print_benchmark(benchmark_monitor(int(sys.argv[2]) if len(sys.argv) > 2 else 2000))
+        sys.exit(0)
+    
+    monitor = ProcessMonitor()
+    monitor.start()
+    snapshot = monitor.latest(timeout=2.0)
+    monitor.stop()
+    print(f"📊 {len(snapshot)} processes")
+    for process in snapshot.top(15):
+        print(f"  {process['pid']:>7}  {process['cpu_percent']:5.1f}%  {process['memory_percent']:5.1f}%  {process['name']}")
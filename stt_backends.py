@@ -0,0 +1,245 @@
+"""
+Speech-to-Text Backends Module for Nova AI Assistant
+Interchangeable recognition engines behind one interface
+"""
+
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+import requests
+import speech_recognition as sr
+
+from config import VOICE_SETTINGS
+
+
+class STTBackend:
+    """Base class for speech-to-text engines"""
+    
+    name = 'base'
+    
+    def __init__(self):
+        """Initialize latency tracking"""
+        # Seconds per recognize() call
+        self.latencies: List[float] = []
+    
+    def transcribe(self, audio: sr.AudioData) -> str:
+        """
+        Convert audio to text; implemented by each engine
+        
+        Raises:
+            sr.UnknownValueError: Speech was not understood
+            sr.RequestError: The engine could not be reached or loaded
+        """
+        raise NotImplementedError
+    
+    def recognize(self, audio: sr.AudioData) -> str:
+        """
+        Convert audio to text, recording how long it took
+        
+        Args:
+            audio: Recorded phrase
+        
+        Returns:
+            Recognized text
+        """
+        start = time.perf_counter()
+        try:
+            return self.transcribe(audio)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+    
+    def latency_report(self) -> Dict[str, float]:
+        """
+        Summarize recognition latency so far
+        
+        Returns:
+            Dictionary with count, mean_ms, p50_ms and max_ms
+        """
+        if not self.latencies:
+            return {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'max_ms': 0.0}
+        
+        ordered = sorted(self.latencies)
+        return {
+            'count': len(ordered),
+            'mean_ms': sum(ordered) / len(ordered) * 1000,
+            'p50_ms': ordered[len(ordered) // 2] * 1000,
+            'max_ms': ordered[-1] * 1000,
+        }
+
+
+class GoogleBackend(STTBackend):
+    """Google Web Speech API through speech_recognition"""
+    
+    name = 'google'
+    
+    def __init__(self, recognizer: Optional[sr.Recognizer] = None, language: str = 'en-US'):
+        super().__init__()
+        self.recognizer = recognizer or sr.Recognizer()
+        self.language = language
+    
+    def transcribe(self, audio: sr.AudioData) -> str:
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+
+class VoskBackend(STTBackend):
+    """Offline recognition on the CPU with a Vosk model"""
+    
+    name = 'vosk'
+    
+    def __init__(self, model_path: str):
+        """
+        Args:
+            model_path: Directory of an unpacked Vosk model, loaded on first use
+        """
+        super().__init__()
+        self.model_path = model_path
+        self._model = None
+    
+    def _get_model(self):
+        """Load the model once; it takes a few seconds"""
+        if self._model is None:
+            try:
+                import vosk
+            except ImportError:
+                raise sr.RequestError("offline recognition needs the vosk package (pip install vosk)")
+            
+            vosk.SetLogLevel(-1)
+            try:
+                self._model = vosk.Model(self.model_path)
+            except Exception as e:
+                raise sr.RequestError(f"could not load Vosk model from {self.model_path}: {e}")
+        return self._model
+    
+    def transcribe(self, audio: sr.AudioData) -> str:
+        model = self._get_model()
+        import vosk
+        
+        recognizer = vosk.KaldiRecognizer(model, audio.sample_rate)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_width=2))
+        text = json.loads(recognizer.FinalResult()).get('text', '')
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class HTTPBackend(STTBackend):
+    """Any server that takes WAV audio and answers {"transcript": ...}"""
+    
+    name = 'http'
+    
+    def __init__(self, url: str, timeout: float = 10.0):
+        """
+        Args:
+            url: Recognition endpoint, e.g. the local_servers.py stand-in
+            timeout: Seconds to wait for an answer
+        """
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+    
+    def transcribe(self, audio: sr.AudioData) -> str:
+        try:
+            response = self.session.post(
+                self.url,
+                data=audio.get_wav_data(),
+                headers={'Content-Type': 'audio/wav'},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            text = response.json().get('transcript', '')
+        except requests.RequestException as e:
+            raise sr.RequestError(f"recognition server error: {e}")
+        except ValueError as e:
+            raise sr.RequestError(f"recognition server sent an invalid reply: {e}")
+        
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+# Backend names accepted in VOICE_SETTINGS['stt_backend']
+BACKENDS = ['google', 'vosk', 'http']
+
+
+def create_backend(name: Optional[str] = None, recognizer: Optional[sr.Recognizer] = None,
+                   settings: Optional[Dict] = None) -> STTBackend:
+    """
+    Create the speech-to-text backend named in the settings
+    
+    Args:
+        name: Backend name, defaults to settings['stt_backend']
+        recognizer: Recognizer to reuse for the Google backend
+        settings: Voice settings, defaults to config.VOICE_SETTINGS
+    
+    Returns:
+        The backend
+    """
+    settings = settings if settings is not None else VOICE_SETTINGS
+    name = name or settings.get('stt_backend', 'google')
+    
+    if name == 'google':
+        return GoogleBackend(recognizer, settings.get('stt_language', 'en-US'))
+    if name == 'vosk':
+        return VoskBackend(settings.get('vosk_model_path', 'models/vosk-model-small-en-us'))
+    if name == 'http':
+        return HTTPBackend(settings.get('stt_server_url', 'http://127.0.0.1:8765/recognize'),
+                           settings.get('stt_timeout', 10.0))
+    raise ValueError(f"Unknown STT backend '{name}', expected one of: {', '.join(BACKENDS)}")
+
+
+def compare_backends(wav_paths: List[str], names: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """
+    Run recordings through several backends and compare their latency
+    
+    Args:
+        wav_paths: WAV recordings of single phrases
+        names: Backends to try, defaults to all of them
+    
+    Returns:
+        Mapping of backend name -> latency report with an errors count
+    """
+    reports = {}
+    for name in names or BACKENDS:
+        backend = create_backend(name)
+        errors = 0
+        print(f"\n🧠 {name}")
+        
+        for wav_path in wav_paths:
+            with sr.AudioFile(wav_path) as source:
+                audio = sr.Recognizer().record(source)
+            try:
+                text = backend.recognize(audio)
+                print(f"  ✅ {wav_path}: {text} ({backend.latencies[-1] * 1000:.0f} ms)")
+            except (sr.UnknownValueError, sr.RequestError) as e:
+                errors += 1
+                print(f"  ❌ {wav_path}: {e or 'not understood'}")
+        
+        report = backend.latency_report()
+        report['errors'] = errors
+        reports[name] = report
+        print(f"  ⏱️ mean {report['mean_ms']:.0f} ms, p50 {report['p50_ms']:.0f} ms, max {report['max_ms']:.0f} ms")
+    
+    return reports
+
+
+if __name__ == "__main__":
+    # Compare backends on recordings, e.g. python stt_backends.py hello.wav --backends vosk,http
+    usage = "Usage: python stt_backends.py recording.wav [more.wav ...] [--backends google,vosk,http]"
+    arguments = sys.argv[1:]
+    names = None
+    if '--backends' in arguments:
+        position = arguments.index('--backends')
+        if position + 1 >= len(arguments):
+            print(usage)
+            sys.exit(1)
+        names = arguments[position + 1].split(',')
+        del arguments[position:position + 2]
+    
+    if not arguments:
+        print(usage)
+        sys.exit(1)
+    
+    compare_backends(arguments, names)
@@ -4,6 +4,7 @@ Handles system operations like shutdown, restart, volume control, and screenshot
 """
 
 import os
+import shlex
 import subprocess
 import platform
 import pyautogui
@@ -11,9 +12,13 @@ import psutil
 from datetime import datetime
 from typing import Optional, Tuple
 import ctypes
-from ctypes import cast, POINTER
-from comtypes import CLSCTX_ALL
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+from app_index import AppIndex
+from app_watcher import AppWatcher
+from config import SYSTEM_SETTINGS
+from process_monitor import ProcessMonitor
+from telemetry import SystemTelemetry
+from volume_backend import VolumeController, create_volume_controller
 
 
 class SystemControls:
@@ -22,19 +27,31 @@ class SystemControls:
     def __init__(self):
         """Initialize system controls"""
         self.system = platform.system().lower()
+        # Opened on first use; False if no mixer is available
         self.volume_controller = None
-        self._setup_volume_control()
+        # Loaded on first use; False if it could not be
+        self.app_index = None
+        # Keeps the index current once start_app_watcher() is called
+        self.app_watcher = None
+        # Samples processes in the background from the first process query on
+        self.process_monitor = None
+        # System metrics, refreshed in the background from first use on
+        self.telemetry = None
     
-    def _setup_volume_control(self):
-        """Setup volume control for Windows"""
-        try:
-            if self.system == "windows":
-                devices = AudioUtilities.GetSpeakers()
-                interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                self.volume_controller = cast(interface, POINTER(IAudioEndpointVolume))
-        except Exception as e:
-            print(f"Warning: Could not setup volume control: {e}")
-            self.volume_controller = None
+    def _get_volume_controller(self) -> Optional[VolumeController]:
+        """Open the mixer named in SYSTEM_SETTINGS['volume_backend'] on first use"""
+        if self.volume_controller is None:
+            try:
+                self.volume_controller = create_volume_controller()
+            except (RuntimeError, ValueError) as e:
+                print(f"Warning: Could not setup volume control: {e}")
+                self.volume_controller = False
+        return self.volume_controller or None
+    
+    def stop_volume_control(self) -> None:
+        """Write any volume change still waiting and release the mixer"""
+        if self.volume_controller:
+            self.volume_controller.close()
     
     def open_application(self, app_name: str) -> bool:
         """
@@ -79,22 +96,18 @@ class SystemControls:
                 subprocess.Popen(executable, shell=True)
                 return True
             
-            # Try to find the app in common locations
-            common_paths = [
-                os.path.expanduser("~\\AppData\\Local\\Programs"),
-                os.path.expanduser("~\\AppData\\Roaming\\Microsoft\\Windows\\Start Menu\\Programs"),
-                "C:\\Program Files",
-                "C:\\Program Files (x86)"
-            ]
-            
-            for path in common_paths:
-                if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
-                        for file in files:
-                            if file.lower().startswith(app_name) and file.lower().endswith('.exe'):
-                                full_path = os.path.join(root, file)
-                                subprocess.Popen(full_path, shell=True)
-                                return True
+            # Look the app up in the installed application index
+            index = self._get_app_index()
+            if index is not None:
+                target = index.lookup(app_name)
+                watched = self.app_watcher is not None and self.app_watcher.is_running
+                if target is None and not watched and index.refresh():
+                    # Installed since the index was last refreshed
+                    index.save()
+                    target = index.lookup(app_name)
+                if target is not None:
+                    self._launch(target)
+                    return True
             
             # Try using start command for Windows
             if self.system == "windows":
@@ -107,6 +120,53 @@ class SystemControls:
         
         return False
     
+    def _get_app_index(self, refresh: bool = True) -> Optional[AppIndex]:
+        """
+        Load the application index on first use
+        
+        Args:
+            refresh: Also bring it up to date with what changed since it was
+                saved; the watcher does this in the background instead
+        """
+        if self.app_index is None:
+            try:
+                index = AppIndex.load(SYSTEM_SETTINGS.get('app_index_path', 'cache/app_index.json'),
+                                      max_depth=SYSTEM_SETTINGS.get('app_index_max_depth', 8))
+                if refresh and index.refresh():
+                    index.save()
+                self.app_index = index
+            except Exception as e:
+                print(f"Warning: Could not load the application index: {e}")
+                self.app_index = False
+        # An empty index is falsy too
+        return self.app_index if self.app_index is not False else None
+    
+    def start_app_watcher(self) -> None:
+        """Keep the application index current in the background, so opening apps never scans"""
+        if self.app_watcher is None:
+            index = self._get_app_index(refresh=False)
+            if index is None:
+                return
+            self.app_watcher = AppWatcher(index, SYSTEM_SETTINGS.get('app_watch_interval', 30),
+                                          SYSTEM_SETTINGS.get('app_watch_inotify', True))
+        self.app_watcher.start()
+    
+    def stop_app_watcher(self) -> None:
+        """Stop watching for installed applications"""
+        if self.app_watcher is not None:
+            self.app_watcher.stop()
+    
+    def _launch(self, target: str) -> None:
+        """Start an indexed application: a path on Windows and macOS, a command line elsewhere"""
+        if self.system == "windows":
+            # Also follows .lnk shortcuts
+            os.startfile(target)
+        elif target.endswith('.app'):
+            subprocess.Popen(['open', target])
+        else:
+            subprocess.Popen(shlex.split(target), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                             start_new_session=True)
+    
     def take_screenshot(self, save_path: Optional[str] = None) -> Optional[str]:
         """
         Take a screenshot of the current screen
@@ -141,34 +201,40 @@ class SystemControls:
         """
         Get basic system information
         
+        Answered from the telemetry snapshot: static facts are read once and
+        the rest is refreshed in the background, so a hung mount cannot
+        block this. Only the first call may wait, for the first refresh.
+        
         Returns:
             Dictionary containing system information
         """
         try:
+            telemetry = self._get_telemetry()
+            snapshot = telemetry.snapshot(timeout=telemetry.partition_timeout + 0.5)
+            
             info = {
-                'os': platform.system(),
-                'os_version': platform.version(),
-                'architecture': platform.architecture()[0],
-                'processor': platform.processor(),
-                'hostname': platform.node(),
-                'cpu_count': psutil.cpu_count(),
-                'memory_total': f"{psutil.virtual_memory().total / (1024**3):.1f} GB",
-                'memory_available': f"{psutil.virtual_memory().available / (1024**3):.1f} GB",
+                'os': snapshot['os'],
+                'os_version': snapshot['os_version'],
+                'architecture': snapshot['architecture'],
+                'processor': snapshot['processor'],
+                'hostname': snapshot['hostname'],
+                'cpu_count': snapshot['cpu_count'],
+                'memory_total': f"{snapshot['memory_total'] / (1024**3):.1f} GB",
+                'memory_available': (f"{snapshot['memory_available'] / (1024**3):.1f} GB"
+                                     if 'memory_available' in snapshot else 'unknown'),
+                'cpu_percent': snapshot.get('cpu_percent'),
+                'uptime_seconds': snapshot.get('uptime_seconds'),
                 'disk_usage': {}
             }
             
-            # Get disk usage for main drives
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    info['disk_usage'][partition.device] = {
-                        'total': f"{usage.total / (1024**3):.1f} GB",
-                        'used': f"{usage.used / (1024**3):.1f} GB",
-                        'free': f"{usage.free / (1024**3):.1f} GB",
-                        'percent': f"{usage.percent:.1f}%"
-                    }
-                except:
-                    continue
+            for device, usage in snapshot.get('disk_usage', {}).items():
+                info['disk_usage'][device] = {
+                    'total': f"{usage['total'] / (1024**3):.1f} GB",
+                    'used': f"{usage['used'] / (1024**3):.1f} GB",
+                    'free': f"{usage['free'] / (1024**3):.1f} GB",
+                    'percent': f"{usage['percent']:.1f}%",
+                    'stale': usage['stale']
+                }
             
             return info
             
@@ -176,6 +242,23 @@ class SystemControls:
             print(f"Error getting system info: {e}")
             return {}
     
+    def _get_telemetry(self) -> SystemTelemetry:
+        """Start refreshing system metrics in the background on first use"""
+        if self.telemetry is None:
+            self.telemetry = SystemTelemetry(SYSTEM_SETTINGS.get('telemetry_interval', 30),
+                                             SYSTEM_SETTINGS.get('telemetry_partition_timeout', 1.0))
+            self.telemetry.start()
+        return self.telemetry
+    
+    def start_telemetry(self) -> None:
+        """Start refreshing system metrics in the background"""
+        self._get_telemetry()
+    
+    def stop_telemetry(self) -> None:
+        """Stop refreshing system metrics"""
+        if self.telemetry is not None:
+            self.telemetry.stop()
+    
     def get_volume_level(self) -> Optional[int]:
         """
         Get current system volume level
@@ -184,17 +267,10 @@ class SystemControls:
             Volume level (0-100) or None if failed
         """
         try:
-            if self.volume_controller:
-                volume = self.volume_controller.GetMasterVolumeLevelScalar()
-                return int(volume * 100)
-            else:
-                # Fallback method using PowerShell
-                result = subprocess.run(
-                    ['powershell', '-Command', '(Get-AudioDevice -Playback).Volume'],
-                    capture_output=True, text=True, shell=True
-                )
-                if result.returncode == 0:
-                    return int(result.stdout.strip())
+            controller = self._get_volume_controller()
+            if controller is not None:
+                # Read from the mixer once, then kept up to date
+                return controller.level
         except Exception as e:
             print(f"Error getting volume level: {e}")
         
@@ -211,22 +287,13 @@ class SystemControls:
             True if successful, False otherwise
         """
         try:
-            # Ensure level is within bounds
-            level = max(0, min(100, level))
+            controller = self._get_volume_controller()
+            if controller is None:
+                return False
+            # Clamped to 0-100; slow mixers are written in the background
+            controller.set(level)
+            return True
             
-            if self.volume_controller:
-                # Convert percentage to scalar (0.0 to 1.0)
-                scalar = level / 100.0
-                self.volume_controller.SetMasterVolumeLevelScalar(scalar, None)
-                return True
-            else:
-                # Fallback method using PowerShell
-                result = subprocess.run(
-                    ['powershell', '-Command', f'(Get-AudioDevice -Playback).Volume = {level}'],
-                    shell=True
-                )
-                return result.returncode == 0
-                
         except Exception as e:
             print(f"Error setting volume: {e}")
             return False
@@ -242,11 +309,12 @@ class SystemControls:
             True if successful, False otherwise
         """
         try:
-            current_volume = self.get_volume_level()
-            if current_volume is not None:
-                new_volume = current_volume + change
-                return self.set_volume(new_volume)
-            return False
+            controller = self._get_volume_controller()
+            if controller is None:
+                return False
+            # From the cached level, so repeated presses never wait on the mixer
+            controller.adjust(change)
+            return True
         except Exception as e:
             print(f"Error adjusting volume: {e}")
             return False
@@ -354,21 +422,29 @@ class SystemControls:
             List of process information
         """
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort by CPU usage and return top processes
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
-            return processes[:limit]
+            # CPU usage is measured between background samples, so the first call waits for two
+            snapshot = self._get_process_monitor().latest(timeout=2.0)
+            if snapshot is None:
+                return []
+            return [dict(process) for process in snapshot.top(limit)]
             
         except Exception as e:
             print(f"Error getting running processes: {e}")
             return []
     
+    def _get_process_monitor(self) -> ProcessMonitor:
+        """Start sampling processes in the background on first use"""
+        if self.process_monitor is None:
+            self.process_monitor = ProcessMonitor(SYSTEM_SETTINGS.get('process_sample_interval', 2.0),
+                                                  SYSTEM_SETTINGS.get('process_top_size', 50))
+            self.process_monitor.start()
+        return self.process_monitor
+    
+    def stop_process_monitor(self) -> None:
+        """Stop sampling processes"""
+        if self.process_monitor is not None:
+            self.process_monitor.stop()
+    
     def kill_process(self, process_name: str) -> bool:
         """
         Kill a process by name
@@ -380,12 +456,19 @@ class SystemControls:
             True if successful, False otherwise
         """
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
+            monitor = self._get_process_monitor()
+            monitor.latest()
+            candidates = monitor.find(process_name)
+            if not candidates:
+                # Possibly started since the last sample
+                monitor.sample()
+                candidates = monitor.find(process_name)
+            
+            for proc in candidates:
                 try:
-                    if proc.info['name'].lower() == process_name.lower():
-                        proc.terminate()
-                        proc.wait(timeout=3)
-                        return True
+                    proc.terminate()
+                    proc.wait(timeout=3)
+                    return True
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
                     pass
             
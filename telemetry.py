@@ -0,0 +1,292 @@
+"""
+Telemetry Module for Nova AI Assistant
+Static system facts read once, dynamic metrics refreshed in the background
+"""
+
+import os
+import platform
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+import psutil
+
+
+def read_static_facts() -> Dict:
+    """
+    Facts that do not change while Nova runs
+    
+    Returns:
+        Dictionary with os, os_version, architecture, processor, hostname,
+        cpu_count, memory_total (bytes) and boot_time
+    """
+    return {
+        'os': platform.system(),
+        'os_version': platform.version(),
+        'architecture': platform.architecture()[0],
+        'processor': platform.processor(),
+        'hostname': platform.node(),
+        'cpu_count': psutil.cpu_count(),
+        'memory_total': psutil.virtual_memory().total,
+        'boot_time': psutil.boot_time(),
+    }
+
+
+class SystemTelemetry:
+    """Keeps a snapshot of system metrics fresh on a background thread"""
+    
+    def __init__(self, interval: float = 30.0, partition_timeout: float = 1.0, workers: int = 4,
+                 disk_usage: Optional[Callable[[str], object]] = None,
+                 disk_partitions: Optional[Callable[[], List]] = None):
+        """
+        Initialize telemetry; static facts are read here, once
+        
+        Args:
+            interval: Seconds between refreshes of the dynamic metrics
+            partition_timeout: Seconds each partition's usage may take; a
+                slower one, e.g. a hung network mount, keeps its last value
+            workers: Threads reading partition usage
+            disk_usage: Function reading one mount point's usage, defaults
+                to psutil.disk_usage
+            disk_partitions: Function listing partitions, defaults to
+                psutil.disk_partitions
+        """
+        self.interval = interval
+        self.partition_timeout = partition_timeout
+        self.disk_usage = disk_usage or psutil.disk_usage
+        self.disk_partitions = disk_partitions or psutil.disk_partitions
+        self.static = read_static_facts()
+        
+        # Latest dynamic metrics, replaced whole by each refresh
+        self.dynamic: Dict = {}
+        # Mount point -> its last usage, and reads still running
+        self._partitions: Dict[str, Dict] = {}
+        self._pending: Dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nova-disk")
+        
+        # Refreshes done and partition reads that timed out, for measuring
+        self.refreshes = 0
+        self.timeouts = 0
+        self.last_refresh_ms = 0.0
+        
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Sets the baseline for the first cpu_percent reading
+        psutil.cpu_percent(None)
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the background refresh is running"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start refreshing in the background, beginning right away"""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nova-telemetry", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop refreshing; reads stuck on a hung mount are abandoned"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
+    
+    def refresh(self) -> Dict:
+        """
+        Read the dynamic metrics now
+        
+        Every partition is read at once on the pool. One that does not
+        answer within partition_timeout keeps its previous value, marked
+        stale, and is not asked again until its read returns.
+        
+        Returns:
+            The new dynamic metrics
+        """
+        start = time.perf_counter()
+        memory = psutil.virtual_memory()
+        dynamic = {
+            'memory_available': memory.available,
+            'memory_percent': memory.percent,
+            'cpu_percent': psutil.cpu_percent(None),
+            'uptime_seconds': time.time() - self.static['boot_time'],
+        }
+        
+        try:
+            partitions = self.disk_partitions()
+        except OSError:
+            partitions = []
+        submitted: Dict[str, Future] = {}
+        devices = {}
+        for partition in partitions:
+            devices[partition.mountpoint] = partition.device
+            future = self._pending.get(partition.mountpoint)
+            if future is None or future.done():
+                try:
+                    future = self._executor.submit(self.disk_usage, partition.mountpoint)
+                except RuntimeError:
+                    # Stopped
+                    break
+                self._pending[partition.mountpoint] = future
+            submitted[partition.mountpoint] = future
+        if submitted:
+            wait(submitted.values(), timeout=self.partition_timeout)
+        
+        disk_usage = {}
+        for mountpoint, future in submitted.items():
+            if future.done():
+                del self._pending[mountpoint]
+                try:
+                    usage = future.result()
+                except Exception:
+                    # Unreadable, e.g. an empty drive; the old scan skipped these too
+                    self._partitions.pop(mountpoint, None)
+                    continue
+                self._partitions[mountpoint] = {
+                    'total': usage.total, 'used': usage.used, 'free': usage.free,
+                    'percent': usage.percent, 'stale': False,
+                }
+            else:
+                self.timeouts += 1
+                if mountpoint not in self._partitions:
+                    continue
+                # A copy, as earlier snapshots share the old one
+                self._partitions[mountpoint] = {**self._partitions[mountpoint], 'stale': True}
+            disk_usage[devices[mountpoint]] = self._partitions[mountpoint]
+        for mountpoint in [mountpoint for mountpoint in self._partitions if mountpoint not in devices]:
+            # Unmounted since the last refresh
+            del self._partitions[mountpoint]
+        
+        dynamic['disk_usage'] = disk_usage
+        dynamic['updated_at'] = time.time()
+        self.dynamic = dynamic
+        self.refreshes += 1
+        self.last_refresh_ms = (time.perf_counter() - start) * 1000
+        self._ready.set()
+        return dynamic
+    
+    def snapshot(self, timeout: float = 0.0) -> Dict:
+        """
+        Get the static facts and the latest dynamic metrics
+        
+        Args:
+            timeout: Seconds to wait for the first refresh, if there has
+                not been one yet; never waits once there has
+        
+        Returns:
+            Static facts merged with the dynamic metrics, plus age_seconds
+            since they were read (None before the first refresh)
+        """
+        if timeout and not self._ready.is_set():
+            self._ready.wait(timeout)
+        dynamic = self.dynamic
+        updated = dynamic.get('updated_at')
+        return {**self.static, **dynamic, 'age_seconds': time.time() - updated if updated else None}
+
+
+def benchmark_telemetry(partitions: int = 6, hung: int = 1, rounds: int = 1000) -> Dict[str, float]:
+    """
+    Measure system info calls with a hung mount among the partitions
+    
+    Partition reads are simulated: each takes 5 ms, except the hung ones,
+    which block for a minute.
+    
+    Args:
+        partitions: Simulated partitions
+        hung: How many of them never answer
+        rounds: Snapshots to time
+    
+    Returns:
+        Dictionary with scan_ms (the old one-at-a-time scan, which would
+        wait out every hung mount and is cut off after 2 s here),
+        refresh_ms, snapshot_us and timeouts
+    """
+    release = threading.Event()
+    Partition = namedtuple('Partition', 'device mountpoint')
+    mountpoints = [f"/mnt/disk{number}" for number in range(partitions)]
+    hung_mounts = set(mountpoints[:hung])
+    
+    def disk_usage(mountpoint: str):
+        if mountpoint in hung_mounts:
+            release.wait(60)
+        else:
+            time.sleep(0.005)
+        return psutil.disk_usage(os.path.abspath(os.sep))
+    
+    def disk_partitions():
+        return [Partition(mountpoint, mountpoint) for mountpoint in mountpoints]
+    
+    try:
+        # The old path: static facts and every partition, one after another
+        def old_scan():
+            info = read_static_facts()
+            info['memory_available'] = psutil.virtual_memory().available
+            for mountpoint in mountpoints:
+                disk_usage(mountpoint)
+            return info
+        
+        scan = threading.Thread(target=old_scan, daemon=True)
+        start = time.perf_counter()
+        scan.start()
+        scan.join(2.0)
+        scan_ms = (time.perf_counter() - start) * 1000
+        
+        telemetry = SystemTelemetry(interval=3600, partition_timeout=0.2, disk_usage=disk_usage,
+                                    disk_partitions=disk_partitions)
+        start = time.perf_counter()
+        telemetry.refresh()
+        refresh_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        for _ in range(rounds):
+            snapshot = telemetry.snapshot()
+        snapshot_us = (time.perf_counter() - start) / rounds * 1e6
+        
+        report = {
+            'partitions': partitions,
+            'hung': hung,
+            'scan_ms': scan_ms,
+            'refresh_ms': refresh_ms,
+            'snapshot_us': snapshot_us,
+            'partitions_reported': len(snapshot['disk_usage']),
+            'timeouts': telemetry.timeouts,
+        }
+        telemetry.stop()
+        return report
+    finally:
+        release.set()
+
+
+def print_benchmark(report: Dict[str, float]) -> None:
+    """Print a benchmark_telemetry() report"""
+    print(f"  {report['partitions']} partitions, {report['hung']} of them hung")
+    print(f"  One-at-a-time scan (old)  {report['scan_ms']:9.1f} ms (cut off; it waits on the hung mount)")
+    print(f"  Background refresh        {report['refresh_ms']:9.1f} ms "
+          f"({report['partitions_reported']} partitions reported, {report['timeouts']} timed out)")
+    print(f"  System info from snapshot {report['snapshot_us']:9.1f} µs")
+
+
+if __name__ == "__main__":
+    # Print a snapshot, or benchmark, e.g. python telemetry.py bench
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        print("🎯 Benchmarking system telemetry")
+        print_benchmark(benchmark_telemetry())
+        sys.exit(0)
+    
+    telemetry = SystemTelemetry()
+    telemetry.refresh()
+    for key, value in telemetry.snapshot().items():
+        print(f"  {key}: {value}")
+    telemetry.stop()
@@ -0,0 +1,202 @@
+"""
+Translation Module for Nova AI Assistant
+Interchangeable translation backends behind a phrase cache
+"""
+
+import sys
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from config import API_KEYS, WEB_SETTINGS
+from web_cache import TTLCache
+
+
+# Language names Nova understands -> ISO 639-1 codes
+LANGUAGE_CODES = {
+    'english': 'en', 'spanish': 'es', 'french': 'fr', 'german': 'de', 'italian': 'it',
+    'portuguese': 'pt', 'dutch': 'nl', 'russian': 'ru', 'japanese': 'ja', 'chinese': 'zh',
+    'korean': 'ko', 'arabic': 'ar', 'hindi': 'hi',
+}
+LANGUAGE_NAMES = {code: name.title() for name, code in LANGUAGE_CODES.items()}
+
+# Target language -> phrase -> translation, answered offline
+PHRASEBOOK: Dict[str, Dict[str, str]] = {
+    'es': {"hello": "hola", "goodbye": "adiós", "thank you": "gracias",
+           "how are you": "cómo estás", "good morning": "buenos días"},
+    'fr': {"hello": "bonjour", "goodbye": "au revoir", "thank you": "merci",
+           "how are you": "comment allez-vous", "good morning": "bonjour"},
+    'de': {"hello": "hallo", "goodbye": "auf Wiedersehen", "thank you": "danke",
+           "how are you": "wie geht es dir", "good morning": "guten Morgen"},
+}
+
+
+def language_code(language: str) -> str:
+    """ISO code for a language name or code, e.g. 'Spanish' -> 'es'"""
+    language = language.strip().lower()
+    return LANGUAGE_CODES.get(language, language)
+
+
+def normalize_phrase(text: str) -> str:
+    """Lookup form of a phrase: lower case, single spaces, no end punctuation"""
+    return " ".join(text.lower().split()).strip('.!?')
+
+
+class TranslationBackend:
+    """Base class for translation engines"""
+    
+    name = 'base'
+    
+    def translate(self, text: str, target: str, source: str = 'auto') -> Optional[str]:
+        """
+        Translate text; implemented by each engine
+        
+        Args:
+            text: Text to translate
+            target: Target language code
+            source: Source language code, or 'auto'
+        
+        Returns:
+            The translation, or None if the engine has none
+        
+        Raises:
+            requests.RequestException: The engine could not be reached
+        """
+        raise NotImplementedError
+
+
+class PhrasebookBackend(TranslationBackend):
+    """Fixed phrases, translated offline"""
+    
+    name = 'phrasebook'
+    
+    def __init__(self, phrases: Optional[Dict[str, Dict[str, str]]] = None):
+        """
+        Args:
+            phrases: Target language -> phrase -> translation, defaults to PHRASEBOOK
+        """
+        self.phrases = phrases if phrases is not None else PHRASEBOOK
+    
+    def translate(self, text: str, target: str, source: str = 'auto') -> Optional[str]:
+        return self.phrases.get(target, {}).get(normalize_phrase(text))
+
+
+class LibreTranslateBackend(TranslationBackend):
+    """A LibreTranslate server, self-hosted or public"""
+    
+    name = 'libretranslate'
+    
+    def __init__(self, url: str, api_key: Optional[str] = None,
+                 session: Optional[requests.Session] = None, timeout: float = 5.0):
+        """
+        Args:
+            url: Server address, e.g. the local_servers.py stand-in
+            api_key: Key, if the server asks for one
+            session: Shared HTTP session
+            timeout: Seconds to wait for an answer
+        """
+        self.url = url.rstrip('/')
+        self.api_key = api_key
+        self.session = session if session is not None else requests.Session()
+        self.timeout = timeout
+    
+    def translate(self, text: str, target: str, source: str = 'auto') -> Optional[str]:
+        payload = {'q': text, 'source': source, 'target': target, 'format': 'text'}
+        if self.api_key:
+            payload['api_key'] = self.api_key
+        response = self.session.post(f"{self.url}/translate", json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json().get('translatedText') or None
+
+
+class Translator:
+    """A translation backend with a phrase cache in front of it"""
+    
+    def __init__(self, backend: TranslationBackend, cache: Optional[TTLCache] = None):
+        """
+        Args:
+            backend: Engine asked on a cache miss
+            cache: Cache for translations, None to always ask the engine
+        """
+        self.backend = backend
+        self.cache = cache
+        
+        # Seconds per engine call, cache misses only
+        self.latencies: List[float] = []
+    
+    def translate(self, text: str, target: str, source: str = 'auto') -> Optional[str]:
+        """
+        Translate text, from the cache when it has been translated before
+        
+        Returns:
+            The translation, or None if the engine has none
+        """
+        key = f"{self.backend.name}:{source}:{target}:{normalize_phrase(text)}"
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached
+        
+        start = time.perf_counter()
+        try:
+            translation = self.backend.translate(text, target, source)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+        if translation is not None and self.cache is not None:
+            self.cache.set(key, translation)
+        return translation
+
+
+# Backend names accepted in WEB_SETTINGS['translation_backend']
+BACKENDS = ['phrasebook', 'libretranslate']
+
+
+def create_translator(name: Optional[str] = None, session: Optional[requests.Session] = None,
+                      settings: Optional[Dict] = None) -> Translator:
+    """
+    Create the translator named in the settings
+    
+    Args:
+        name: Backend name, defaults to settings['translation_backend']
+        session: Shared HTTP session for online backends
+        settings: Web settings, defaults to config.WEB_SETTINGS
+    
+    Returns:
+        The backend behind a phrase cache
+    """
+    settings = settings if settings is not None else WEB_SETTINGS
+    name = name or settings.get('translation_backend', 'phrasebook')
+    
+    if name == 'phrasebook':
+        backend = PhrasebookBackend()
+    elif name == 'libretranslate':
+        backend = LibreTranslateBackend(settings.get('translation_url', 'http://127.0.0.1:5000'),
+                                        API_KEYS.get('libretranslate'), session,
+                                        settings.get('request_timeout', 5.0))
+    else:
+        raise ValueError(f"Unknown translation backend '{name}', expected one of: {', '.join(BACKENDS)}")
+    
+    if isinstance(backend, PhrasebookBackend):
+        # Already an in-memory lookup
+        return Translator(backend)
+    cache = TTLCache(settings.get('translation_cache_dir'), settings.get('translation_cache_ttl', 30 * 24 * 3600),
+                     memory_entries=1024, disk_entries=settings.get('translation_cache_entries', 5000))
+    return Translator(backend, cache)
+
+
+if __name__ == "__main__":
+    # Translate from the command line, e.g. python translation.py spanish good morning
+    if len(sys.argv) < 3:
+        print(f"Usage: python translation.py LANGUAGE TEXT  (backend: {WEB_SETTINGS.get('translation_backend', 'phrasebook')})")
+        sys.exit(1)
+    
+    translator = create_translator()
+    target = language_code(sys.argv[1])
+    text = " ".join(sys.argv[2:])
+    start = time.perf_counter()
+    translation = translator.translate(text, target)
+    elapsed = time.perf_counter() - start
+    if translation is None:
+        print(f"❓ No {LANGUAGE_NAMES.get(target, target)} translation for '{text}' ({elapsed * 1000:.2f} ms)")
+    else:
+        print(f"🌍 {translation} ({elapsed * 1000:.2f} ms)")
@@ -0,0 +1,319 @@
+"""
+TTS Cache Module for Nova AI Assistant
+Renders fixed phrases to WAV once and plays them back from disk or memory
+"""
+
+import hashlib
+import io
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class PhraseAudioCache:
+    """Content-addressed WAV cache with a size cap and LRU eviction"""
+    
+    def __init__(self, directory: str, max_bytes: int = 50 * 1024 * 1024,
+                 memory_entries: int = 32):
+        """
+        Initialize the cache, indexing whatever is already on disk
+        
+        Args:
+            directory: Directory holding the rendered WAV files
+            max_bytes: Disk budget; least recently played files go first
+            memory_entries: Recently played clips kept in memory
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        
+        # Phrases worth caching; anything else is spoken live
+        self.phrases: Set[str] = set()
+        
+        self.hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        # key -> size on disk, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        self._load_index()
+    
+    def _load_index(self):
+        """Index cached files, oldest access first"""
+        os.makedirs(self.directory, exist_ok=True)
+        
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.wav'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total += size
+    
+    @staticmethod
+    def key(text: str, voice: str = '', rate: int = 0, volume: float = 0.0) -> str:
+        """Cache key for a phrase spoken with particular engine settings"""
+        identity = f"{text}\x00{voice}\x00{rate}\x00{volume:.3f}"
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+    
+    def path_for(self, key: str) -> str:
+        """File a rendered phrase lives in"""
+        return os.path.join(self.directory, f"{key}.wav")
+    
+    def register(self, phrases: Iterable[str]) -> None:
+        """Mark phrases as worth caching"""
+        self.phrases.update(phrase for phrase in phrases if phrase)
+    
+    def wants(self, text: str) -> bool:
+        """Whether a phrase should be played from the cache"""
+        return text in self.phrases
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a rendered phrase
+        
+        Returns:
+            WAV file contents, or None if the phrase is not cached
+        """
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self._index.move_to_end(key)
+                self.hits += 1
+                return audio
+            
+            if key not in self._index:
+                self.misses += 1
+                return None
+        
+        path = self.path_for(key)
+        try:
+            with open(path, 'rb') as wav_file:
+                audio = wav_file.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._total -= self._index.pop(key, 0)
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+            if key in self._index:
+                self._index.move_to_end(key)
+            self._remember(key, audio)
+        return audio
+    
+    def put(self, key: str, audio: bytes) -> None:
+        """Store a rendered phrase, evicting old ones past the size cap"""
+        path = self.path_for(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as wav_file:
+            wav_file.write(audio)
+        os.replace(temp_path, path)
+        
+        with self._lock:
+            self._total += len(audio) - self._index.pop(key, 0)
+            self._index[key] = len(audio)
+            self._remember(key, audio)
+            evicted = self._evict()
+        
+        for old_key in evicted:
+            try:
+                os.remove(self.path_for(old_key))
+            except OSError:
+                pass
+    
+    def _remember(self, key: str, audio: bytes):
+        """Keep a clip in memory; called with the lock held"""
+        self._memory[key] = audio
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+    
+    def _evict(self) -> List[str]:
+        """Drop least recently used entries over budget; called with the lock held"""
+        evicted = []
+        while self._total > self.max_bytes and len(self._index) > 1:
+            old_key, size = self._index.popitem(last=False)
+            self._memory.pop(old_key, None)
+            self._total -= size
+            evicted.append(old_key)
+        return evicted
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with hits, misses, entries, bytes and max_bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._index),
+                'bytes': self._total,
+                'max_bytes': self.max_bytes,
+            }
+
+
+def render_phrase(engine, text: str) -> Optional[bytes]:
+    """
+    Render a phrase to WAV with a pyttsx3 engine
+    
+    Must run on the thread that owns the engine.
+    
+    Returns:
+        WAV file contents, or None if the engine produced nothing a WAV
+        reader can play
+    """
+    handle, temp_path = tempfile.mkstemp(suffix='.wav')
+    os.close(handle)
+    try:
+        engine.save_to_file(text, temp_path)
+        engine.runAndWait()
+        with open(temp_path, 'rb') as wav_file:
+            audio = wav_file.read()
+        return audio if audio and wav_frames(audio) else None
+    finally:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def wav_frames(audio: bytes) -> int:
+    """Number of frames in WAV audio, 0 if it does not parse"""
+    try:
+        with wave.open(io.BytesIO(audio), 'rb') as wav_file:
+            return wav_file.getnframes()
+    except (wave.Error, EOFError):
+        return 0
+
+
+def wav_duration(audio: bytes) -> float:
+    """Length of WAV audio in seconds"""
+    with wave.open(io.BytesIO(audio), 'rb') as wav_file:
+        return wav_file.getnframes() / float(wav_file.getframerate())
+
+
+class WavPlayer:
+    """Plays WAV audio from memory where possible, stoppable from any thread"""
+    
+    def __init__(self):
+        self._stopped = threading.Event()
+        self._process: Optional[subprocess.Popen] = None
+        self._playback = None
+        
+        try:
+            import simpleaudio
+            self._simpleaudio = simpleaudio
+        except ImportError:
+            self._simpleaudio = None
+        
+        self._command = None
+        if platform.system() != "Windows":
+            for command in (['aplay', '-q'], ['paplay'], ['afplay']):
+                if shutil.which(command[0]):
+                    self._command = command
+                    break
+    
+    @property
+    def available(self) -> bool:
+        """Whether there is any way to play audio"""
+        return self._simpleaudio is not None or platform.system() == "Windows" or self._command is not None
+    
+    def play(self, audio: bytes, path: Optional[str] = None) -> bool:
+        """
+        Play WAV audio, blocking until it ends or stop() is called
+        
+        Args:
+            audio: WAV file contents
+            path: The same audio on disk, for players that need a file
+        
+        Returns:
+            True if it played to the end
+        """
+        self._stopped.clear()
+        
+        if self._simpleaudio is not None:
+            wave_object = self._simpleaudio.WaveObject.from_wave_read(wave.open(io.BytesIO(audio), 'rb'))
+            self._playback = wave_object.play()
+            while self._playback.is_playing():
+                if self._stopped.wait(0.02):
+                    self._playback.stop()
+                    return False
+            return True
+        
+        if platform.system() == "Windows":
+            import winsound
+            if path is None:
+                # Memory playback cannot be asynchronous, so it cannot be cut short
+                winsound.PlaySound(audio, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
+                return True
+            
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+            if self._stopped.wait(wav_duration(audio)):
+                winsound.PlaySound(None, 0)
+                return False
+            return True
+        
+        if self._command is None:
+            raise RuntimeError("No audio player found (install simpleaudio or aplay)")
+        
+        self._process = subprocess.Popen(self._command + ([path] if path else []),
+                                         stdin=None if path else subprocess.PIPE,
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if path is None:
+            self._process.stdin.write(audio)
+            self._process.stdin.close()
+        self._process.wait()
+        self._process = None
+        return not self._stopped.is_set()
+    
+    def stop(self) -> None:
+        """Stop playback started on another thread"""
+        self._stopped.set()
+        process = self._process
+        if process is not None:
+            process.terminate()
+
+
+def phrases_from_pools(pools: Iterable[Dict[str, List[str]]], **values) -> List[str]:
+    """
+    Spell out every response in some response pools
+    
+    Args:
+        pools: Mappings of response type -> response templates
+        **values: Placeholder values, e.g. user="Sir"; templates needing
+            anything else are skipped as they cannot be known in advance
+    
+    Returns:
+        Distinct finished phrases
+    """
+    phrases = []
+    for pool in pools:
+        for templates in pool.values():
+            for template in templates:
+                try:
+                    phrases.append(template.format(**values))
+                except (KeyError, IndexError):
+                    continue
+    return list(dict.fromkeys(phrases))
@@ -0,0 +1,472 @@
+"""
+TTS Worker Module for Nova AI Assistant
+One thread owns the speech engine and speaks queued utterances by priority
+"""
+
+import heapq
+import itertools
+import re
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from tts_cache import PhraseAudioCache, WavPlayer, render_phrase
+
+
+# Lower numbers are spoken first
+PRIORITY_URGENT = 0   # Prompts the user is waiting on, e.g. "I'm listening"
+PRIORITY_NORMAL = 5   # Command responses
+PRIORITY_LOW = 10     # Chatter that can wait
+PRIORITY_BACKGROUND = 20  # Cache warm-up, only when nothing else is queued
+
+# Sentence ends followed by the start of another sentence
+_SENTENCE_END = re.compile(r'(?<=[.!?…])\s+(?=[^a-z\s])|\s*\n\s*')
+# Places a long sentence can be broken without sounding odd
+_CLAUSE_END = re.compile(r'(?<=[,;:])\s+')
+
+
+def split_sentences(text: str, max_chars: int = 200, min_chars: int = 20) -> List[str]:
+    """
+    Split text into chunks that can be spoken one after another
+    
+    Args:
+        text: Text to speak
+        max_chars: Longer sentences are broken at commas and then spaces
+        min_chars: Shorter pieces are joined to the next, so "Hi, Sir!"
+            does not get a chunk of its own
+    
+    Returns:
+        Non-empty chunks in order
+    """
+    pieces = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        
+        for clause in _CLAUSE_END.split(sentence):
+            while len(clause) > max_chars:
+                cut = clause.rfind(' ', 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                pieces.append(clause[:cut])
+                clause = clause[cut:].lstrip()
+            if clause:
+                pieces.append(clause)
+    
+    chunks: List[str] = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) < min_chars and len(chunks[-1]) + len(piece) < max_chars:
+            chunks[-1] = f"{chunks[-1]} {piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+class Utterance:
+    """A queued piece of speech"""
+    
+    def __init__(self, text: str, priority: int, coalesce_key: Optional[str],
+                 on_done: Optional[Callable[["Utterance"], None]]):
+        self.text = text
+        self.priority = priority
+        self.coalesce_key = coalesce_key
+        self.on_done = on_done
+        
+        # Render into the phrase cache without playing
+        self.render_only = False
+        
+        # perf_counter() times: picked up by the worker, first audio started
+        self.started_at: Optional[float] = None
+        self.first_audio_at: Optional[float] = None
+        # Sentence chunks played so far
+        self.chunks_spoken = 0
+        
+        self.cancelled = False
+        self.spoken = False
+        self.error: Optional[Exception] = None
+        self._done = threading.Event()
+    
+    @property
+    def time_to_first_audio(self) -> Optional[float]:
+        """Seconds from the worker picking this up to its first audio, if it played"""
+        if self.started_at is None or self.first_audio_at is None:
+            return None
+        return self.first_audio_at - self.started_at
+    
+    @property
+    def done(self) -> bool:
+        """Whether the utterance was spoken, cancelled or failed"""
+        return self._done.is_set()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the utterance is finished
+        
+        Returns:
+            True if it finished within the timeout
+        """
+        return self._done.wait(timeout)
+    
+    def _finish(self):
+        self._done.set()
+        if self.on_done is not None:
+            try:
+                self.on_done(self)
+            except Exception as e:
+                print(f"Error in speech callback: {e}")
+
+
+class SpeechWorker:
+    """Single owner thread for a pyttsx3-style engine with a priority queue"""
+    
+    def __init__(self, engine, cache: Optional[PhraseAudioCache] = None,
+                 player: Optional[WavPlayer] = None, chunking: bool = True):
+        """
+        Initialize the worker; the thread starts with the first utterance
+        
+        Args:
+            engine: Speech engine with say(), runAndWait() and stop()
+            cache: Rendered audio for phrases the cache wants; played
+                instead of synthesizing them again
+            player: Plays cached audio; required for the cache to be used
+            chunking: Speak long text a sentence at a time, so audio starts
+                once the first sentence is synthesized and cancelling takes
+                effect between sentences
+        """
+        self.engine = engine
+        self.cache = cache if player is not None and player.available else None
+        self.player = player
+        self.chunking = chunking
+        
+        # Seconds to first audio, per utterance played
+        self.first_audio_latencies: List[float] = []
+        
+        # pyttsx3 reports when audio actually starts; otherwise it is
+        # assumed to start as runAndWait() is called
+        self._engine_reports_start = False
+        try:
+            engine.connect('started-utterance', self._on_started_utterance)
+            self._engine_reports_start = True
+        except Exception:
+            pass
+        
+        self._queue: List[Tuple[int, int, Utterance]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._current: Optional[Utterance] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        
+        # Utterances dropped because an identical one was already queued
+        self.coalesced = 0
+    
+    @property
+    def is_speaking(self) -> bool:
+        """Whether something is being spoken right now"""
+        return self._current is not None
+    
+    @property
+    def pending(self) -> int:
+        """Number of utterances waiting to be spoken"""
+        with self._condition:
+            return sum(1 for _, _, utterance in self._queue if not utterance.cancelled)
+    
+    def is_worker_thread(self) -> bool:
+        """Whether the caller is the thread that speaks, e.g. in an on_done callback"""
+        return self._thread is threading.current_thread()
+    
+    def _ensure_started(self):
+        """Start the owner thread; called with the condition held"""
+        # Also revives a worker a timed-out shutdown() left running, so it
+        # takes this work instead of exiting once it comes back
+        self._running = True
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="nova-tts", daemon=True)
+            self._thread.start()
+    
+    def speak(self, text: str, priority: int = PRIORITY_NORMAL, coalesce_key: Optional[str] = None,
+              on_done: Optional[Callable[[Utterance], None]] = None) -> Utterance:
+        """
+        Queue text to be spoken
+        
+        Args:
+            text: Text to speak
+            priority: PRIORITY_URGENT, PRIORITY_NORMAL or PRIORITY_LOW
+            coalesce_key: Utterances sharing a key are spoken at most once
+                while one of them is queued or playing
+            on_done: Called on the worker thread once the utterance is
+                spoken, cancelled or has failed
+        
+        Returns:
+            The queued utterance, which can be waited on or cancelled
+        """
+        utterance = Utterance(text, priority, coalesce_key, on_done)
+        
+        with self._condition:
+            if coalesce_key is not None and self._is_queued_or_playing(coalesce_key):
+                self.coalesced += 1
+                utterance.cancelled = True
+            else:
+                heapq.heappush(self._queue, (priority, next(self._sequence), utterance))
+                self._ensure_started()
+                self._condition.notify()
+        
+        if utterance.cancelled:
+            utterance._finish()
+        return utterance
+    
+    def _is_queued_or_playing(self, coalesce_key: str) -> bool:
+        """Check for a live utterance with this key; called with the condition held"""
+        current = self._current
+        if current is not None and current.coalesce_key == coalesce_key and not current.cancelled:
+            return True
+        return any(utterance.coalesce_key == coalesce_key and not utterance.cancelled
+                   for _, _, utterance in self._queue)
+    
+    def cancel(self, utterance: Utterance) -> None:
+        """Cancel one utterance, stopping it if it is playing"""
+        with self._condition:
+            utterance.cancelled = True
+            playing = utterance is self._current
+        if playing:
+            self._stop_engine()
+    
+    def cancel_all(self, below_priority: Optional[int] = None, renders: bool = True) -> int:
+        """
+        Cancel queued and playing speech
+        
+        Args:
+            below_priority: Only cancel utterances at this priority number
+                or higher (i.e. less urgent); None cancels everything
+            renders: Also cancel prewarm() render jobs
+        
+        Returns:
+            Number of utterances cancelled
+        """
+        cancelled = []
+        with self._condition:
+            candidates = [utterance for _, _, utterance in self._queue]
+            if self._current is not None:
+                candidates.append(self._current)
+            for utterance in candidates:
+                if utterance.cancelled or (utterance.render_only and not renders):
+                    continue
+                if below_priority is None or utterance.priority >= below_priority:
+                    utterance.cancelled = True
+                    cancelled.append(utterance)
+            playing = self._current in cancelled
+        
+        if playing:
+            self._stop_engine()
+        return len(cancelled)
+    
+    def barge_in(self, text: str, priority: int = PRIORITY_URGENT,
+                 coalesce_key: Optional[str] = None,
+                 on_done: Optional[Callable[[Utterance], None]] = None) -> Utterance:
+        """
+        Interrupt whatever is being said and speak this next
+        
+        Everything less urgent than the new utterance is cancelled, except
+        cache warm-up: queued render jobs already wait for all speech, and
+        one being rendered is stopped and queued again.
+        """
+        self.cancel_all(below_priority=priority, renders=False)
+        with self._condition:
+            rendering = self._current if self._current is not None and self._current.render_only else None
+        if rendering is not None and not rendering.cancelled:
+            self.cancel(rendering)
+            self._queue_render(rendering.text)
+        return self.speak(text, priority, coalesce_key, on_done)
+    
+    def prewarm(self, texts: Iterable[str]) -> int:
+        """
+        Render phrases into the cache in the background
+        
+        Args:
+            texts: Phrases to render; they are also registered with the cache
+        
+        Returns:
+            Number of render jobs queued
+        """
+        if self.cache is None:
+            return 0
+        
+        texts = list(texts)
+        self.cache.register(texts)
+        for text in texts:
+            self._queue_render(text)
+        return len(texts)
+    
+    def _queue_render(self, text: str) -> None:
+        """Queue a render-only job for the phrase cache"""
+        job = Utterance(text, PRIORITY_BACKGROUND, None, None)
+        job.render_only = True
+        with self._condition:
+            heapq.heappush(self._queue, (PRIORITY_BACKGROUND, next(self._sequence), job))
+            self._ensure_started()
+            self._condition.notify()
+    
+    def latency_report(self) -> Dict[str, float]:
+        """
+        Summarize time to first audio so far
+        
+        Returns:
+            Dictionary with count and p50/p95/max in milliseconds
+        """
+        if not self.first_audio_latencies:
+            return {'count': 0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        
+        ordered = sorted(self.first_audio_latencies)
+        count = len(ordered)
+        return {
+            'count': count,
+            'p50_ms': ordered[count // 2] * 1000,
+            'p95_ms': ordered[min(count - 1, int(count * 0.95))] * 1000,
+            'max_ms': ordered[-1] * 1000,
+        }
+    
+    def _mark_first_audio(self, utterance: Utterance) -> None:
+        """Record when an utterance's audio starts, once"""
+        if utterance.first_audio_at is None and not utterance.render_only:
+            utterance.first_audio_at = time.perf_counter()
+            self.first_audio_latencies.append(utterance.time_to_first_audio)
+    
+    def _on_started_utterance(self, name=None):
+        """pyttsx3 callback: the engine started producing audio"""
+        utterance = self._current
+        if utterance is not None:
+            self._mark_first_audio(utterance)
+    
+    def _stop_engine(self):
+        """Cut the playing utterance short"""
+        try:
+            self.engine.stop()
+            if self.player is not None:
+                self.player.stop()
+        except Exception as e:
+            print(f"Error stopping speech: {e}")
+    
+    def _cached_audio(self, utterance: Utterance) -> Tuple[Optional[str], Optional[bytes]]:
+        """Get a phrase's cache key and audio, rendering it on a miss"""
+        text = utterance.text
+        key = self.cache.key(
+            text,
+            str(self.engine.getProperty('voice')),
+            int(self.engine.getProperty('rate') or 0),
+            float(self.engine.getProperty('volume') or 0.0),
+        )
+        audio = self.cache.get(key)
+        if audio is None:
+            audio = render_phrase(self.engine, text)
+            # A render stopped part way, e.g. by a barge-in, is cut short
+            if audio and not utterance.cancelled:
+                self.cache.put(key, audio)
+        return key, audio
+    
+    def _say(self, utterance: Utterance) -> None:
+        """Speak an utterance on the worker thread"""
+        if self.cache is not None and (utterance.render_only or self.cache.wants(utterance.text)):
+            key, audio = self._cached_audio(utterance)
+            if utterance.render_only:
+                return
+            if audio and not utterance.cancelled:
+                self._mark_first_audio(utterance)
+                self.player.play(audio, self.cache.path_for(key))
+                utterance.chunks_spoken = 1
+                return
+        
+        chunks = split_sentences(utterance.text) if self.chunking else [utterance.text]
+        for chunk in chunks:
+            # Cancelling between sentences also covers a stop() that raced
+            # with the start of the next one
+            if utterance.cancelled:
+                return
+            
+            self.engine.say(chunk)
+            if not self._engine_reports_start:
+                self._mark_first_audio(utterance)
+            self.engine.runAndWait()
+            utterance.chunks_spoken += 1
+    
+    def _run(self):
+        """Speak queued utterances until shut down"""
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    # Cleared under the condition, so _ensure_started()
+                    # either keeps this thread running or starts another
+                    if self._thread is threading.current_thread():
+                        self._thread = None
+                    return
+                
+                _, _, utterance = heapq.heappop(self._queue)
+                if utterance.cancelled:
+                    finished = utterance
+                else:
+                    finished = None
+                    utterance.started_at = time.perf_counter()
+                    self._current = utterance
+            
+            if finished is not None:
+                finished._finish()
+                continue
+            
+            try:
+                self._say(utterance)
+                utterance.spoken = not utterance.cancelled and not utterance.render_only
+            except Exception as e:
+                utterance.error = e
+                print(f"Error in speech synthesis: {e}")
+            finally:
+                with self._condition:
+                    self._current = None
+                utterance._finish()
+    
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Cancel everything and stop the owner thread"""
+        self.cancel_all()
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        
+        # Release anyone still waiting on utterances that never ran
+        with self._condition:
+            leftover = [utterance for _, _, utterance in self._queue]
+            self._queue.clear()
+        for utterance in leftover:
+            utterance._finish()
+
+
+if __name__ == "__main__":
+    # Compare time to first audio with and without chunking on this machine's voice
+    import pyttsx3
+    
+    text = " ".join(sys.argv[1:]) or (
+        "Here's what I can do for you. I can tell the time and date, check the weather, "
+        "search Wikipedia and the web, open applications and websites, take screenshots "
+        "and control the volume. I also know a few jokes, quotes and facts. "
+        "Just say Nova followed by your command, and I'll handle the rest!"
+    )
+    print(f"🗣️ {len(split_sentences(text))} chunk(s): {split_sentences(text)}")
+    
+    for chunking in (False, True):
+        worker = SpeechWorker(pyttsx3.init(), chunking=chunking)
+        utterance = worker.speak(text)
+        utterance.wait()
+        worker.shutdown()
+        
+        first_audio = utterance.time_to_first_audio
+        label = "Chunked" if chunking else "Whole text"
+        if first_audio is None:
+            print(f"  {label}: no audio")
+        else:
+            print(f"  {label}: first audio after {first_audio * 1000:.0f} ms")
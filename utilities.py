@@ -407,10 +407,14 @@ class Utilities:
                 'message': "Sorry, my quote generator is malfunctioning. Time for some original wisdom!"
             }
     
-    def get_system_status(self) -> Dict:
+    def get_system_status(self, system_info: Optional[Dict] = None) -> Dict:
         """
         Get system status information
         
+        Args:
+            system_info: SystemControls.get_system_info() result for real
+                uptime and load; a demo uptime is made up without it
+        
         Returns:
             Dictionary with system status
         """
@@ -418,8 +422,10 @@ class Utilities:
             # Get current time
             now = datetime.datetime.now()
             
-            # Calculate uptime (mock for demo)
-            uptime_hours = random.randint(1, 72)  # Random uptime for demo
+            if system_info and system_info.get('uptime_seconds') is not None:
+                uptime_hours = int(system_info['uptime_seconds'] // 3600)
+            else:
+                uptime_hours = random.randint(1, 72)  # Random uptime for demo
             
             # Create personality response
             responses = [
@@ -430,6 +436,8 @@ class Utilities:
             ]
             
             response = random.choice(responses)
+            if system_info and system_info.get('cpu_percent') is not None:
+                response += f" CPU at {system_info['cpu_percent']:.0f}%, {system_info['memory_available']} of memory free."
             
             return {
                 'success': True,
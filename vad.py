@@ -0,0 +1,320 @@
+"""
+Voice Activity Detection Module for Nova AI Assistant
+Splits a stream of PCM audio into speech segments using frame energy and zero-crossing rate
+"""
+
+import sys
+import time
+import wave
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+class SpeechSegment:
+    """A stretch of speech found by the detector"""
+    
+    def __init__(self, start: float, end: float, samples: np.ndarray, sample_rate: int):
+        """
+        Args:
+            start: Seconds from the start of the stream to the first sample
+            end: Seconds from the start of the stream to just past the last sample
+            samples: 16-bit mono samples of the segment
+            sample_rate: Samples per second
+        """
+        self.start = start
+        self.end = end
+        self.samples = samples
+        self.sample_rate = sample_rate
+    
+    @property
+    def duration(self) -> float:
+        """Length of the segment in seconds"""
+        return self.end - self.start
+    
+    @property
+    def audio(self) -> bytes:
+        """Raw little-endian 16-bit PCM, as speech_recognition.AudioData expects"""
+        return self.samples.astype('<i2').tobytes()
+    
+    def __repr__(self) -> str:
+        return f"SpeechSegment({self.start:.2f}s-{self.end:.2f}s)"
+
+
+def frame_features(samples: np.ndarray, frame_length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-frame RMS energy and zero-crossing rate
+    
+    Args:
+        samples: Mono samples; trailing samples that do not fill a frame are ignored
+        frame_length: Samples per frame
+    
+    Returns:
+        Tuple of (energy, zero-crossing rate), one value per frame
+    """
+    count = len(samples) // frame_length
+    frames = samples[:count * frame_length].reshape(count, frame_length).astype(np.float32)
+    
+    energy = np.sqrt(np.mean(frames * frames, axis=1))
+    signs = np.signbit(frames)
+    crossings = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1)
+    return energy, crossings / float(frame_length - 1)
+
+
+class VoiceActivityDetector:
+    """Streaming energy/ZCR voice activity detector with an adaptive threshold"""
+    
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 20,
+                 threshold_ratio: float = 3.0, min_energy: float = 100.0,
+                 zcr_threshold: float = 0.25, hangover_ms: int = 300,
+                 min_speech_ms: int = 100, preroll_ms: int = 200,
+                 max_segment_seconds: Optional[float] = None,
+                 noise_adaptation: float = 0.05):
+        """
+        Initialize the detector
+        
+        Args:
+            sample_rate: Samples per second of the incoming audio
+            frame_ms: Analysis frame length in milliseconds
+            threshold_ratio: Multiple of the noise floor that counts as speech
+            min_energy: Lowest speech threshold, however quiet the room
+            zcr_threshold: Zero-crossing rate above which a quieter frame
+                (half the threshold) still counts as unvoiced speech
+            hangover_ms: Silence tolerated inside a segment before it ends
+            min_speech_ms: Speech needed before a segment starts
+            preroll_ms: Audio kept from before the detected start
+            max_segment_seconds: Cut segments at this length, None for no limit
+            noise_adaptation: How fast the noise floor follows quiet frames (0-1)
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = max(2, sample_rate * frame_ms // 1000)
+        self.threshold_ratio = threshold_ratio
+        self.min_energy = min_energy
+        self.zcr_threshold = zcr_threshold
+        self.hangover_frames = max(1, hangover_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.preroll_frames = preroll_ms // frame_ms
+        self.max_segment_seconds = max_segment_seconds
+        self.noise_adaptation = noise_adaptation
+        
+        self.noise_floor: Optional[float] = None
+        self.reset()
+    
+    def reset(self, keep_noise_floor: bool = True) -> None:
+        """
+        Forget any partial segment, e.g. between two listens
+        
+        Args:
+            keep_noise_floor: Keep the learned noise floor
+        """
+        if not keep_noise_floor:
+            self.noise_floor = None
+        
+        self._remainder = np.zeros(0, dtype=np.int16)
+        # Frames not yet emitted or discarded; _frames[0] is frame number _base
+        self._frames: List[np.ndarray] = []
+        self._base = 0
+        self._next_frame = 0
+        
+        self._speech_run = 0
+        self._silence_run = 0
+        self._segment_start: Optional[int] = None
+        self._last_speech = 0
+    
+    @property
+    def in_speech(self) -> bool:
+        """Whether a segment is currently open"""
+        return self._segment_start is not None
+    
+    @property
+    def threshold(self) -> float:
+        """Current speech energy threshold"""
+        if self.noise_floor is None:
+            return self.min_energy
+        return max(self.noise_floor * self.threshold_ratio, self.min_energy)
+    
+    def _classify(self, energy: np.ndarray, zcr: np.ndarray) -> np.ndarray:
+        """Mark speech frames and let the noise floor follow the quiet ones"""
+        if self.noise_floor is None and len(energy):
+            # Start from the quiet end of the first audio seen
+            self.noise_floor = float(np.percentile(energy, 20))
+        
+        threshold = self.threshold
+        is_speech = (energy > threshold) | ((energy > threshold / 2) & (zcr > self.zcr_threshold))
+        
+        quiet = energy[~is_speech]
+        if quiet.size:
+            self.noise_floor += self.noise_adaptation * (float(quiet.mean()) - self.noise_floor)
+        return is_speech
+    
+    def _emit(self, end: int) -> SpeechSegment:
+        """Close the open segment just before frame number end"""
+        start = self._segment_start
+        samples = np.concatenate(self._frames[start - self._base:end - self._base])
+        del self._frames[:end - self._base]
+        self._base = end
+        
+        self._segment_start = None
+        self._speech_run = 0
+        self._silence_run = 0
+        
+        return SpeechSegment(
+            start * self.frame_length / self.sample_rate,
+            end * self.frame_length / self.sample_rate,
+            samples,
+            self.sample_rate,
+        )
+    
+    def process(self, chunk: Union[bytes, np.ndarray]) -> List[SpeechSegment]:
+        """
+        Feed audio to the detector
+        
+        Args:
+            chunk: 16-bit mono PCM, as bytes or a NumPy array of any length
+        
+        Returns:
+            Segments that ended within this chunk
+        """
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = np.frombuffer(chunk, dtype='<i2')
+        samples = np.concatenate((self._remainder, chunk)) if self._remainder.size else chunk
+        
+        count = len(samples) // self.frame_length
+        self._remainder = samples[count * self.frame_length:]
+        if count == 0:
+            return []
+        
+        frames = samples[:count * self.frame_length].reshape(count, self.frame_length)
+        energy, zcr = frame_features(frames.reshape(-1), self.frame_length)
+        is_speech = self._classify(energy, zcr)
+        
+        self._frames.extend(frames)
+        max_frames = None
+        if self.max_segment_seconds:
+            max_frames = int(self.max_segment_seconds * self.sample_rate / self.frame_length)
+        
+        segments = []
+        for offset, speech in enumerate(is_speech.tolist()):
+            frame = self._next_frame + offset
+            
+            if self._segment_start is None:
+                if speech:
+                    self._speech_run += 1
+                    if self._speech_run >= self.min_speech_frames:
+                        first = frame - self._speech_run + 1
+                        self._segment_start = max(self._base, first - self.preroll_frames)
+                        self._last_speech = frame
+                        self._silence_run = 0
+                else:
+                    self._speech_run = 0
+                continue
+            
+            if speech:
+                self._last_speech = frame
+                self._silence_run = 0
+            else:
+                self._silence_run += 1
+            
+            if self._silence_run >= self.hangover_frames:
+                # Trailing silence is trimmed off the segment
+                segments.append(self._emit(self._last_speech + 1))
+            elif max_frames and frame + 1 - self._segment_start >= max_frames:
+                segments.append(self._emit(frame + 1))
+        
+        self._next_frame += count
+        
+        if self._segment_start is None:
+            # Only the preroll (and any speech run building up) is worth keeping
+            keep = self.preroll_frames + self._speech_run
+            drop = max(0, len(self._frames) - keep)
+            if drop:
+                del self._frames[:drop]
+                self._base += drop
+        
+        return segments
+    
+    def flush(self) -> Optional[SpeechSegment]:
+        """Close a segment left open at the end of the stream"""
+        if self._segment_start is None:
+            return None
+        return self._emit(self._last_speech + 1)
+    
+    def segments(self, chunks: Iterable[Union[bytes, np.ndarray]]) -> Iterator[SpeechSegment]:
+        """
+        Detect speech in a stream of audio chunks
+        
+        Args:
+            chunks: 16-bit mono PCM chunks, e.g. from a microphone or WAV file
+        
+        Yields:
+            Each speech segment as soon as it ends
+        """
+        for chunk in chunks:
+            for segment in self.process(chunk):
+                yield segment
+        
+        segment = self.flush()
+        if segment is not None:
+            yield segment
+
+
+def read_wav(path: str) -> Tuple[np.ndarray, int]:
+    """
+    Read a 16-bit PCM WAV file as mono samples
+    
+    Returns:
+        Tuple of (samples, sample rate)
+    """
+    with wave.open(path, 'rb') as wav_file:
+        if wav_file.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM is supported")
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype='<i2')
+    
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return samples, sample_rate
+
+
+def iter_chunks(samples: np.ndarray, chunk_size: int = 1024) -> Iterator[np.ndarray]:
+    """Split samples into microphone-sized chunks"""
+    for start in range(0, len(samples), chunk_size):
+        yield samples[start:start + chunk_size]
+
+
+def detect_wav(path: str, **settings) -> List[SpeechSegment]:
+    """
+    Find the speech segments in a WAV file
+    
+    Args:
+        path: 16-bit PCM WAV file
+        **settings: VoiceActivityDetector settings
+    
+    Returns:
+        List of speech segments
+    """
+    samples, sample_rate = read_wav(path)
+    detector = VoiceActivityDetector(sample_rate=sample_rate, **settings)
+    return list(detector.segments(iter_chunks(samples)))
+
+
+if __name__ == "__main__":
+    # Segment WAV files and report how much faster than real time it ran
+    if len(sys.argv) < 2:
+        print("Usage: python vad.py recording.wav [more.wav ...]")
+        sys.exit(1)
+    
+    for wav_path in sys.argv[1:]:
+        samples, sample_rate = read_wav(wav_path)
+        audio_seconds = len(samples) / sample_rate
+        
+        start = time.perf_counter()
+        detector = VoiceActivityDetector(sample_rate=sample_rate)
+        found = list(detector.segments(iter_chunks(samples)))
+        elapsed = time.perf_counter() - start
+        
+        print(f"🎧 {wav_path}: {audio_seconds:.1f}s of audio, {len(found)} speech segment(s)")
+        for segment in found:
+            print(f"  🗣️ {segment.start:6.2f}s - {segment.end:6.2f}s ({segment.duration:.2f}s)")
+        print(f"  ⚡ {audio_seconds / elapsed if elapsed else float('inf'):.0f}x real time")
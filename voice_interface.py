@@ -5,9 +5,23 @@ Handles Speech-to-Text (STT) and Text-to-Speech (TTS) operations
 
 import speech_recognition as sr
 import pyttsx3
+import os
 import time
-import threading
-from typing import Optional, Callable
+from typing import Any, Dict, Iterator, Optional, Callable, Tuple
+
+from audio_capture import CaptureStream
+from config import VOICE_SETTINGS
+from stt_backends import create_backend
+from tts_cache import PhraseAudioCache, WavPlayer
+from tts_worker import PRIORITY_NORMAL, PRIORITY_URGENT, SpeechWorker, Utterance
+from voice_pipeline import VoicePipeline
+
+
+# Fixed prompts of the listening loop
+VOICE_PROMPTS = {
+    'listening': "Yes, sir? I'm listening.",
+    'not_heard': "I didn't catch that. Could you repeat your command?",
+}
 
 
 class VoiceInterface:
@@ -16,10 +30,28 @@ class VoiceInterface:
     def __init__(self):
         """Initialize voice interface components"""
         self.recognizer = sr.Recognizer()
+        self.stt = create_backend(recognizer=self.recognizer)
         self.engine = pyttsx3.init()
+        # Only the worker thread touches the engine
+        self.speech = SpeechWorker(self.engine, *self._setup_phrase_cache(),
+                                   chunking=VOICE_SETTINGS.get('tts_sentence_chunking', True))
         self.is_listening = False
         self.callback = None
         
+        # One microphone stream shared by every listen, opened on first use
+        self.capture: Optional[CaptureStream] = None
+        self._capture_position: Optional[int] = None
+        
+        # Voice activity detector for the shared stream, created on first use
+        # (False once it turns out NumPy is missing)
+        self.vad = None
+        
+        # On-device wake word spotter, loaded on first use (False if unavailable)
+        self.wake_spotter = None
+        
+        # Staged capture/recognize/dispatch/speak loop, while it runs
+        self.pipeline: Optional[VoicePipeline] = None
+        
         # Configure TTS engine
         self._setup_tts()
         
@@ -43,10 +75,52 @@ class VoiceInterface:
             # Set speech rate and volume
             self.engine.setProperty('rate', 180)  # Words per minute
             self.engine.setProperty('volume', 0.9)  # Volume level (0.0 to 1.0)
-            
+        
         except Exception as e:
             print(f"Warning: Could not configure TTS engine: {e}")
     
+    def _setup_phrase_cache(self):
+        """Create the rendered phrase cache and its player, if enabled"""
+        if not VOICE_SETTINGS.get('tts_cache', True):
+            return None, None
+        
+        try:
+            cache = PhraseAudioCache(
+                VOICE_SETTINGS.get('tts_cache_dir', os.path.join('cache', 'tts')),
+                int(VOICE_SETTINGS.get('tts_cache_max_mb', 50) * 1024 * 1024),
+            )
+        except OSError as e:
+            print(f"Warning: Could not open the speech cache: {e}")
+            return None, None
+        
+        # Fixed prompts of the listening loop
+        cache.register(VOICE_PROMPTS.values())
+        return cache, WavPlayer()
+    
+    def prewarm_phrases(self, phrases, render: Optional[bool] = None) -> int:
+        """
+        Mark phrases for the speech cache, optionally rendering them now
+        
+        Args:
+            phrases: Finished phrases Nova is likely to say
+            render: Render them in the background right away, defaults to
+                VOICE_SETTINGS['tts_cache_prewarm']; otherwise each is
+                rendered the first time it is spoken
+        
+        Returns:
+            Number of phrases queued for rendering
+        """
+        if self.speech.cache is None:
+            return 0
+        
+        if render is None:
+            render = VOICE_SETTINGS.get('tts_cache_prewarm', False)
+        if render:
+            return self.speech.prewarm(phrases)
+        
+        self.speech.cache.register(phrases)
+        return 0
+    
     def _setup_stt(self):
         """Configure speech recognition"""
         try:
@@ -56,71 +130,182 @@ class VoiceInterface:
             self.recognizer.pause_threshold = 0.8  # Seconds of silence to mark end
             self.recognizer.phrase_threshold = 0.3  # Minimum seconds of speaking
             self.recognizer.non_speaking_duration = 0.5  # Seconds of non-speaking before stopping
-            
+        
         except Exception as e:
             print(f"Warning: Could not configure STT: {e}")
     
-    def speak(self, text: str, wait: bool = True) -> None:
+    def speak(self, text: str, wait: bool = True, priority: int = PRIORITY_NORMAL,
+              coalesce_key: Optional[str] = None,
+              on_done: Optional[Callable[[Utterance], None]] = None) -> Optional[Utterance]:
         """
         Convert text to speech
         
         Args:
             text: Text to speak
             wait: Whether to wait for speech to complete
+            priority: Queue priority, lower is spoken sooner
+            coalesce_key: Skip this if speech with the same key is already
+                queued or playing, e.g. repeated status prompts
+            on_done: Called on the speech thread when the text has been
+                spoken or cancelled
+        
+        Returns:
+            The queued utterance, or None if it could not be queued
         """
         try:
-            if wait:
-                self.engine.say(text)
-                self.engine.runAndWait()
-            else:
-                # Run in separate thread to avoid blocking
-                threading.Thread(target=self._speak_thread, args=(text,), daemon=True).start()
+            utterance = self.speech.speak(text, priority, coalesce_key, on_done)
+            if wait and not self.speech.is_worker_thread():
+                utterance.wait()
+            return utterance
         except Exception as e:
             print(f"Error in speech synthesis: {e}")
+            return None
+    
+    def interrupt(self, text: Optional[str] = None) -> None:
+        """
+        Barge in: stop whatever is being said, optionally saying something else
+        
+        Args:
+            text: Urgent text to speak instead
+        """
+        if text is None:
+            self.speech.cancel_all()
+        else:
+            self.speech.barge_in(text, PRIORITY_URGENT, coalesce_key=text)
+    
+    def _get_capture(self) -> Optional[CaptureStream]:
+        """Get the running capture stream, starting it on first use"""
+        if not VOICE_SETTINGS.get('persistent_microphone', True):
+            return None
+        
+        if self.capture is None:
+            self.capture = CaptureStream(buffer_seconds=VOICE_SETTINGS.get('capture_buffer_seconds', 30))
+        if not self.capture.is_running:
+            self._capture_position = None
+            if not self.capture.start():
+                return None
+        return self.capture
     
-    def _speak_thread(self, text: str):
-        """Internal method for non-blocking speech"""
+    def _record(self, timeout: int, phrase_time_limit: int, resume: bool) -> sr.AudioData:
+        """Record one phrase from the shared stream, or a fresh microphone if it is unavailable"""
+        capture = self._get_capture()
+        
+        if capture is None:
+            with sr.Microphone() as source:
+                print("🎤 Listening...")
+                
+                # Adjust for ambient noise
+                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                
+                return self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+        
+        # Resuming picks up right where the last phrase ended, so nothing
+        # said while it was being recognized is lost
+        source = capture.source(self._capture_position if resume else None)
+        print("🎤 Listening...")
+        
         try:
-            self.engine.say(text)
-            self.engine.runAndWait()
-        except Exception as e:
-            print(f"Error in speech thread: {e}")
+            detector = self._get_vad(capture.sample_rate)
+            if detector is not None:
+                return self._record_segment(detector, source, timeout, phrase_time_limit)
+            
+            # The noise floor is tracked in the background, no calibration pause
+            self.recognizer.energy_threshold = capture.energy_threshold(self.recognizer.dynamic_energy_ratio)
+            return self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+        finally:
+            self._capture_position = source.position
     
-    def listen(self, timeout: int = 5, phrase_time_limit: int = 10) -> Optional[str]:
+    def _get_vad(self, sample_rate: int):
+        """Get the voice activity detector, or None to let the recognizer find phrases"""
+        if VOICE_SETTINGS.get('vad', 'numpy') != 'numpy' or self.vad is False:
+            return None
+        
+        if self.vad is None or self.vad.sample_rate != sample_rate:
+            try:
+                from vad import VoiceActivityDetector
+            except ImportError as e:
+                print(f"Warning: Voice activity detection unavailable, using the recognizer: {e}")
+                self.vad = False
+                return None
+            
+            self.vad = VoiceActivityDetector(
+                sample_rate=sample_rate,
+                hangover_ms=VOICE_SETTINGS.get('vad_hangover_ms', 300),
+                threshold_ratio=VOICE_SETTINGS.get('vad_threshold_ratio', 3.0),
+            )
+        return self.vad
+    
+    def _record_segment(self, detector, source, timeout: int, phrase_time_limit: int) -> sr.AudioData:
+        """Record the first speech segment the detector finds in the shared stream"""
+        segment = self._next_segment(detector, source, timeout, phrase_time_limit)
+        return sr.AudioData(segment.audio, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+    
+    def _next_segment(self, detector, source, timeout: int, phrase_time_limit: int):
+        """Get the next speech segment from the shared stream"""
+        detector.reset()
+        detector.max_segment_seconds = phrase_time_limit
+        chunk_seconds = source.CHUNK / source.SAMPLE_RATE
+        
+        def chunks():
+            waited = 0.0
+            while True:
+                chunk = source.stream.read(source.CHUNK)
+                if not chunk:
+                    return
+                yield chunk
+                
+                if not detector.in_speech:
+                    waited += chunk_seconds
+                    if timeout and waited > timeout:
+                        raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+        
+        for segment in detector.segments(chunks()):
+            return segment
+        
+        raise sr.WaitTimeoutError("audio stream ended before a phrase was heard")
+    
+    def listen(self, timeout: int = 5, phrase_time_limit: int = 10, resume: bool = False) -> Optional[str]:
         """
         Listen for voice input and convert to text
         
         Args:
             timeout: Seconds to wait for speech to start
             phrase_time_limit: Maximum seconds for a single phrase
-            
+            resume: Continue from the end of the previous phrase instead of
+                the newest audio, e.g. for a command following the wake word
+        
         Returns:
             Recognized text or None if failed
         """
         try:
-            with sr.Microphone() as source:
-                print("🎤 Listening...")
-                
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                
-                # Listen for audio input
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=timeout, 
-                    phrase_time_limit=phrase_time_limit
-                )
-                
-                print("🔍 Processing speech...")
-                
-                # Use Google's speech recognition
-                text = self.recognizer.recognize_google(audio)
-                print(f"✅ Recognized: {text}")
-                return text.lower()
-                
+            audio = self._record(timeout, phrase_time_limit, resume)
         except sr.WaitTimeoutError:
             print("⏰ No speech detected within timeout")
             return None
+        except Exception as e:
+            print(f"❌ Error in speech recognition: {e}")
+            return None
+        
+        return self.recognize(audio)
+    
+    def recognize(self, audio: sr.AudioData) -> Optional[str]:
+        """
+        Convert recorded audio to text
+        
+        Args:
+            audio: Recorded phrase
+        
+        Returns:
+            Recognized text or None if failed
+        """
+        try:
+            print("🔍 Processing speech...")
+            
+            # Use the speech-to-text backend chosen in VOICE_SETTINGS
+            text = self.stt.recognize(audio)
+            print(f"✅ Recognized: {text}")
+            return text.lower()
+        
         except sr.UnknownValueError:
             print("❓ Could not understand audio")
             return None
@@ -131,6 +316,78 @@ class VoiceInterface:
             print(f"❌ Error in speech recognition: {e}")
             return None
     
+    def _get_wake_spotter(self):
+        """Get the on-device wake word spotter, or None if no templates are set up"""
+        model_path = VOICE_SETTINGS.get('wake_word_model')
+        if not model_path or self.wake_spotter is False:
+            return None
+        
+        if self.wake_spotter is None:
+            if not os.path.exists(model_path):
+                self.wake_spotter = False
+                return None
+            try:
+                from wake_word import WakeWordSpotter
+                self.wake_spotter = WakeWordSpotter.load(model_path)
+            except Exception as e:
+                print(f"Warning: Could not load wake word templates, using the recognizer: {e}")
+                self.wake_spotter = False
+                return None
+            
+            if VOICE_SETTINGS.get('wake_word_threshold') is not None:
+                self.wake_spotter.threshold = VOICE_SETTINGS['wake_word_threshold']
+        return self.wake_spotter
+    
+    def wait_for_wake_word(self, wake_word: str = "nova", timeout: int = 3,
+                           phrase_time_limit: int = 5) -> Tuple[bool, Optional[str]]:
+        """
+        Listen for one phrase and check whether it is the wake word
+        
+        With wake word templates (VOICE_SETTINGS['wake_word_model']) the check
+        runs on-device and only audio after a detected wake word is sent for
+        recognition. Otherwise the whole phrase is recognized and searched
+        for the wake word.
+        
+        Args:
+            wake_word: Word to listen for
+            timeout: Seconds to wait for speech to start
+            phrase_time_limit: Maximum seconds for the phrase
+        
+        Returns:
+            Tuple of (wake word heard, command spoken in the same breath or None)
+        """
+        spotter = self._get_wake_spotter()
+        capture = self._get_capture() if spotter is not None else None
+        detector = self._get_vad(capture.sample_rate) if capture is not None else None
+        
+        if detector is None or capture.sample_rate != spotter.sample_rate:
+            text = self.listen(timeout=timeout, phrase_time_limit=phrase_time_limit)
+            return bool(text and wake_word in text.lower()), None
+        
+        source = capture.source()
+        try:
+            segment = self._next_segment(detector, source, timeout, phrase_time_limit)
+        except sr.WaitTimeoutError:
+            return False, None
+        finally:
+            self._capture_position = source.position
+        
+        result = spotter.detect(segment.samples)
+        if not result['detected']:
+            return False, None
+        
+        print(f"✨ Wake word detected in {result['latency_ms']:.1f} ms")
+        
+        # Anything said right after the wake word is the command
+        rest = segment.samples[int(result['end'] * segment.sample_rate):]
+        if len(rest) < 0.5 * segment.sample_rate:
+            return True, None
+        
+        command = self.recognize(sr.AudioData(rest.astype('<i2').tobytes(), source.SAMPLE_RATE, source.SAMPLE_WIDTH))
+        if command:
+            command = command.replace(wake_word, "").strip()
+        return True, command or None
+    
     def start_listening_loop(self, callback: Callable[[str], None], 
                            wake_word: str = "nova") -> None:
         """
@@ -148,14 +405,15 @@ class VoiceInterface:
         while self.is_listening:
             try:
                 # Listen for wake word
-                text = self.listen(timeout=3, phrase_time_limit=5)
+                heard, command = self.wait_for_wake_word(wake_word, timeout=3, phrase_time_limit=5)
                 
-                if text and wake_word in text.lower():
-                    # Wake word detected, listen for command
-                    self.speak("Yes, sir? I'm listening.", wait=False)
-                    
-                    # Listen for actual command
-                    command = self.listen(timeout=5, phrase_time_limit=15)
+                if heard:
+                    if not command:
+                        # Wake word detected: cut off any older response and prompt
+                        self.interrupt(VOICE_PROMPTS['listening'])
+                        
+                        # Listen for actual command
+                        command = self.listen(timeout=5, phrase_time_limit=15, resume=True)
                     
                     if command:
                         # Remove wake word from command
@@ -163,8 +421,8 @@ class VoiceInterface:
                         if command:
                             callback(command)
                     else:
-                        self.speak("I didn't catch that. Could you repeat your command?")
-                        
+                        self.speak(VOICE_PROMPTS['not_heard'], priority=PRIORITY_URGENT, coalesce_key='not_heard')
+            
             except KeyboardInterrupt:
                 print("\n🛑 Listening stopped by user")
                 break
@@ -172,9 +430,98 @@ class VoiceInterface:
                 print(f"❌ Error in listening loop: {e}")
                 time.sleep(1)
     
+    def captured_commands(self, wake_word: str = "nova") -> Iterator[Any]:
+        """
+        Capture commands until listening stops
+        
+        Yields:
+            Audio of each command spoken after the wake word, or its text
+            when it was already recognized along with the wake word
+        """
+        while self.is_listening:
+            try:
+                heard, command = self.wait_for_wake_word(wake_word, timeout=3, phrase_time_limit=5)
+                if not heard:
+                    continue
+                if command:
+                    yield command
+                    continue
+                
+                # Wake word detected: cut off any older response and prompt
+                self.interrupt(VOICE_PROMPTS['listening'])
+                try:
+                    yield self._record(5, 15, resume=True)
+                except sr.WaitTimeoutError:
+                    print("⏰ No speech detected within timeout")
+                    self.speak(VOICE_PROMPTS['not_heard'], wait=False,
+                               priority=PRIORITY_URGENT, coalesce_key='not_heard')
+            
+            except Exception as e:
+                print(f"❌ Error in listening loop: {e}")
+                time.sleep(1)
+    
+    def _recognize_command(self, captured, wake_word: str) -> Optional[str]:
+        """Pipeline recognize stage: captured audio or text -> command text"""
+        command = captured if isinstance(captured, str) else self.recognize(captured)
+        if command:
+            command = command.replace(wake_word, "").strip()
+        if not command:
+            self.speak(VOICE_PROMPTS['not_heard'], wait=False,
+                       priority=PRIORITY_URGENT, coalesce_key='not_heard')
+            return None
+        return command
+    
+    def start_pipeline_loop(self, respond: Callable[[str], Optional[str]],
+                            wake_word: str = "nova") -> Optional[Dict]:
+        """
+        Listen, recognize, respond and speak as overlapping stages
+        
+        The next command is captured and recognized while the previous
+        response is still being worked out or spoken. Falls back to the
+        classic loop when VOICE_SETTINGS['voice_pipeline'] is off.
+        
+        Args:
+            respond: Turns a command into the response to speak
+            wake_word: Word to listen for to activate Nova
+        
+        Returns:
+            Pipeline report with per-stage latencies, or None for the classic loop
+        """
+        if not VOICE_SETTINGS.get('voice_pipeline', True):
+            self.start_listening_loop(lambda command: self.speak(respond(command)), wake_word)
+            return None
+        
+        self.is_listening = True
+        self.pipeline = VoicePipeline(
+            recognize=lambda captured: self._recognize_command(captured, wake_word),
+            dispatch=respond,
+            speak=self.speak,
+            queue_size=VOICE_SETTINGS.get('pipeline_queue_size', 2),
+        )
+        
+        print(f"🎧 Nova is listening for '{wake_word}'...")
+        try:
+            report = self.pipeline.run(self.captured_commands(wake_word))
+        except KeyboardInterrupt:
+            print("\n🛑 Listening stopped by user")
+            report = self.pipeline.report()
+        
+        self.is_listening = False
+        return report
+    
     def stop_listening(self) -> None:
         """Stop the listening loop"""
         self.is_listening = False
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        if self.capture is not None:
+            self.capture.stop()
+        self.speech.shutdown()
+        
+        report = self.speech.latency_report()
+        if report['count']:
+            print(f"⏱️ Time to first audio: p50 {report['p50_ms']:.0f} ms, "
+                  f"p95 {report['p95_ms']:.0f} ms over {report['count']} response(s)")
         print("🔇 Nova stopped listening")
     
     def test_microphone(self) -> bool:
@@ -0,0 +1,392 @@
+"""
+Voice Pipeline Module for Nova AI Assistant
+Runs capture, recognition, dispatch and speech as overlapping stages
+"""
+
+import io
+import math
+import queue
+import threading
+import time
+import wave
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import speech_recognition as sr
+
+
+# Stage names, in the order items flow through them
+STAGES = ['capture', 'recognize', 'dispatch', 'speak']
+
+# Marks the end of the input on every queue
+_END = object()
+
+
+class StageStats:
+    """Latency counters for one pipeline stage"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        # Seconds spent working on each item
+        self.latencies: List[float] = []
+        # Seconds each item waited in the stage's input queue
+        self.waits: List[float] = []
+        # Seconds spent blocked on a full output queue
+        self.blocked = 0.0
+        # Items the stage produced nothing for, e.g. speech not understood
+        self.dropped = 0
+        self.errors = 0
+    
+    def report(self) -> Dict[str, float]:
+        """
+        Summarize the stage
+        
+        Returns:
+            Dictionary with count, mean/p50/p95/max latency and mean queue
+            wait in milliseconds, blocked_ms, dropped and errors
+        """
+        ordered = sorted(self.latencies)
+        count = len(ordered)
+        return {
+            'count': count,
+            'mean_ms': sum(ordered) / count * 1000 if count else 0.0,
+            'p50_ms': ordered[count // 2] * 1000 if count else 0.0,
+            'p95_ms': ordered[min(count - 1, int(count * 0.95))] * 1000 if count else 0.0,
+            'max_ms': ordered[-1] * 1000 if count else 0.0,
+            'queue_wait_ms': sum(self.waits) / len(self.waits) * 1000 if self.waits else 0.0,
+            'blocked_ms': self.blocked * 1000,
+            'dropped': self.dropped,
+            'errors': self.errors,
+        }
+
+
+class _Item:
+    """A command on its way through the pipeline"""
+    
+    __slots__ = ('payload', 'captured', 'queued')
+    
+    def __init__(self, payload: Any, captured: float):
+        self.payload = payload
+        self.captured = captured
+        self.queued = captured
+
+
+class VoicePipeline:
+    """
+    Capture, recognize, dispatch and speak on one thread each
+    
+    Stages are connected by bounded queues. A stage that gets ahead blocks
+    on its full output queue instead of piling up work, so while a response
+    is being spoken the next command can already be captured and
+    recognized, but no more than queue_size commands wait at any point.
+    """
+    
+    def __init__(self, recognize: Callable[[Any], Optional[str]],
+                 dispatch: Callable[[str], Optional[str]],
+                 speak: Callable[[str], Any], queue_size: int = 2):
+        """
+        Initialize the pipeline
+        
+        Args:
+            recognize: Turns captured audio into command text; None drops it
+            dispatch: Turns command text into a response; None drops it
+            speak: Says a response, blocking until it has been said
+            queue_size: Items allowed to wait between two stages
+        """
+        self.functions = {'recognize': recognize, 'dispatch': dispatch, 'speak': speak}
+        self.queue_size = max(1, queue_size)
+        self.stats = {name: StageStats(name) for name in STAGES}
+        
+        # Seconds from the end of capture to the end of speech, per command
+        self.end_to_end: List[float] = []
+        
+        self._queues: Dict[str, queue.Queue] = {}
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self._started = 0.0
+        self._finished: Optional[float] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether any stage is still working"""
+        return any(thread.is_alive() for thread in self._threads)
+    
+    def start(self, source: Iterable[Any]) -> None:
+        """
+        Start every stage in the background
+        
+        Args:
+            source: Captured audio, one item per command; iterating it is
+                the capture stage, so it may block while listening
+        """
+        self._running = True
+        self._started = time.perf_counter()
+        self._finished = None
+        self.end_to_end = []
+        self.stats = {name: StageStats(name) for name in STAGES}
+        self._queues = {name: queue.Queue(self.queue_size) for name in STAGES[1:]}
+        
+        self._threads = [threading.Thread(target=self._capture, args=(iter(source),),
+                                          name="nova-capture", daemon=True)]
+        for position, name in enumerate(STAGES[1:], start=1):
+            output = STAGES[position + 1] if position + 1 < len(STAGES) else None
+            self._threads.append(threading.Thread(target=self._stage, args=(name, output),
+                                                  name=f"nova-{name}", daemon=True))
+        for thread in self._threads:
+            thread.start()
+    
+    def run(self, source: Iterable[Any]) -> Dict:
+        """
+        Push everything from a source through the pipeline and wait
+        
+        Returns:
+            The pipeline report
+        """
+        self.start(source)
+        try:
+            self.join()
+        except KeyboardInterrupt:
+            self.stop()
+            raise
+        return self.report()
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every stage to finish
+        
+        Returns:
+            True if they all finished within the timeout
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for thread in self._threads:
+            # Short joins keep Ctrl+C responsive
+            while thread.is_alive():
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return False
+                thread.join(0.2)
+        return True
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop taking new input; items already captured are dropped"""
+        self._running = False
+        self.join(timeout)
+    
+    def _put(self, name: str, stage: str, item) -> None:
+        """Hand an item to the next stage, blocking while its queue is full"""
+        if item is not _END:
+            item.queued = time.perf_counter()
+        
+        blocked_since = time.perf_counter()
+        while True:
+            try:
+                self._queues[name].put(item, timeout=0.1)
+                break
+            except queue.Full:
+                if not self._running and item is not _END:
+                    self.stats[stage].dropped += 1
+                    break
+                if not self._running:
+                    # Make room for the end marker so downstream can exit
+                    try:
+                        self._queues[name].get_nowait()
+                    except queue.Empty:
+                        pass
+        self.stats[stage].blocked += time.perf_counter() - blocked_since
+    
+    def _capture(self, source: Iterator[Any]) -> None:
+        """Capture stage: pull items from the source until it ends or the pipeline stops"""
+        stats = self.stats['capture']
+        try:
+            while self._running:
+                began = time.perf_counter()
+                try:
+                    payload = next(source)
+                except StopIteration:
+                    break
+                except Exception as e:
+                    stats.errors += 1
+                    print(f"❌ Error in capture stage: {e}")
+                    time.sleep(1)
+                    continue
+                
+                now = time.perf_counter()
+                stats.latencies.append(now - began)
+                if payload is None:
+                    stats.dropped += 1
+                    continue
+                self._put('recognize', 'capture', _Item(payload, now))
+        finally:
+            self._put('recognize', 'capture', _END)
+    
+    def _stage(self, name: str, output: Optional[str]) -> None:
+        """Run one processing stage until the end marker arrives"""
+        function = self.functions[name]
+        stats = self.stats[name]
+        
+        while True:
+            item = self._queues[name].get()
+            if item is _END:
+                break
+            if not self._running:
+                stats.dropped += 1
+                continue
+            
+            began = time.perf_counter()
+            stats.waits.append(began - item.queued)
+            try:
+                result = function(item.payload)
+            except Exception as e:
+                stats.errors += 1
+                print(f"❌ Error in {name} stage: {e}")
+                result = None
+            
+            finished = time.perf_counter()
+            stats.latencies.append(finished - began)
+            
+            if output is None:
+                self.end_to_end.append(finished - item.captured)
+                continue
+            if result is None:
+                stats.dropped += 1
+                continue
+            
+            item.payload = result
+            self._put(output, name, item)
+        
+        if output is not None:
+            self._put(output, name, _END)
+        else:
+            self._finished = time.perf_counter()
+    
+    def report(self) -> Dict:
+        """
+        Summarize the run so far
+        
+        Returns:
+            Dictionary with completed commands, seconds, commands_per_second,
+            end-to-end p50/max in milliseconds and a report per stage
+        """
+        seconds = (self._finished or time.perf_counter()) - self._started if self._started else 0.0
+        ordered = sorted(self.end_to_end)
+        return {
+            'completed': len(ordered),
+            'seconds': seconds,
+            'commands_per_second': len(ordered) / seconds if seconds else 0.0,
+            'end_to_end_p50_ms': ordered[len(ordered) // 2] * 1000 if ordered else 0.0,
+            'end_to_end_max_ms': ordered[-1] * 1000 if ordered else 0.0,
+            'stages': {name: stats.report() for name, stats in self.stats.items()},
+        }
+
+
+def run_sequential(source: Iterable[Any], recognize: Callable[[Any], Optional[str]],
+                   dispatch: Callable[[str], Optional[str]],
+                   speak: Callable[[str], Any]) -> Dict:
+    """
+    Run the same stages one after another, as the classic listening loop does
+    
+    Returns:
+        A report shaped like VoicePipeline.report()
+    """
+    pipeline = VoicePipeline(recognize, dispatch, speak)
+    functions = pipeline.functions
+    source = iter(source)
+    pipeline._started = time.perf_counter()
+    
+    while True:
+        began = time.perf_counter()
+        try:
+            payload = next(source)
+        except StopIteration:
+            break
+        captured = time.perf_counter()
+        pipeline.stats['capture'].latencies.append(captured - began)
+        
+        if payload is None:
+            pipeline.stats['capture'].dropped += 1
+            continue
+        
+        for name in STAGES[1:]:
+            began = time.perf_counter()
+            try:
+                payload = functions[name](payload)
+            except Exception as e:
+                pipeline.stats[name].errors += 1
+                print(f"❌ Error in {name} stage: {e}")
+                payload = None
+            pipeline.stats[name].latencies.append(time.perf_counter() - began)
+            
+            if name == 'speak':
+                pipeline.end_to_end.append(time.perf_counter() - captured)
+            elif payload is None:
+                pipeline.stats[name].dropped += 1
+                break
+    
+    pipeline._finished = time.perf_counter()
+    return pipeline.report()
+
+
+def wav_commands(wav_paths: List[str], repeat: int = 1, realtime: bool = True) -> Iterator[sr.AudioData]:
+    """
+    Headless capture: yield recorded commands from WAV files
+    
+    Args:
+        wav_paths: One spoken command per file
+        repeat: Times to go through the files
+        realtime: Take as long as the recording lasts, like a live speaker
+    
+    Yields:
+        Audio of each command
+    """
+    recordings = []
+    for wav_path in wav_paths:
+        with sr.AudioFile(wav_path) as source:
+            recordings.append(sr.Recognizer().record(source))
+    
+    for _ in range(repeat):
+        for audio in recordings:
+            if realtime:
+                time.sleep(len(audio.frame_data) / (audio.sample_rate * audio.sample_width))
+            yield audio
+
+
+def synthetic_command_wav(seconds: float = 1.5, sample_rate: int = 16000) -> bytes:
+    """
+    A WAV file with a tone burst standing in for a spoken command
+    
+    Returns:
+        WAV file contents
+    """
+    frames = bytearray()
+    for index in range(int(seconds * sample_rate)):
+        value = int(8000 * math.sin(2 * math.pi * 220 * index / sample_rate))
+        frames += value.to_bytes(2, 'little', signed=True)
+    
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(bytes(frames))
+    return buffer.getvalue()
+
+
+def simulated_speaker(words_per_minute: int = 180) -> Callable[[str], None]:
+    """
+    Headless speech: take as long as saying the text would
+    
+    Returns:
+        A speak function for the pipeline
+    """
+    def speak(text: str) -> None:
+        time.sleep(len(text.split()) * 60.0 / words_per_minute)
+    return speak
+
+
+def print_report(title: str, report: Dict) -> None:
+    """Print a pipeline report as a table"""
+    print(f"\n📊 {title}: {report['completed']} command(s) in {report['seconds']:.2f}s "
+          f"({report['commands_per_second']:.2f} commands/sec)")
+    print(f"  ⏱️ End to end: p50 {report['end_to_end_p50_ms']:.0f} ms, max {report['end_to_end_max_ms']:.0f} ms")
+    print(f"  {'stage':<11}{'count':>6}{'p50 ms':>9}{'p95 ms':>9}{'wait ms':>9}{'blocked ms':>12}{'dropped':>9}")
+    for name, stage in report['stages'].items():
+        print(f"  {name:<11}{stage['count']:>6}{stage['p50_ms']:>9.0f}{stage['p95_ms']:>9.0f}"
+              f"{stage['queue_wait_ms']:>9.0f}{stage['blocked_ms']:>12.0f}{stage['dropped']:>9}")
@@ -0,0 +1,470 @@
+"""
+Volume Backend Module for Nova AI Assistant
+Long-lived audio mixer controls behind a cached, coalescing volume controller
+"""
+
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from config import SYSTEM_SETTINGS
+
+
+_PERCENT = re.compile(r'(\d+)%')
+
+
+class VolumeBackend:
+    """Base class for mixers"""
+    
+    name = 'base'
+    
+    # Whether writes must stay on the thread that opened the mixer (COM)
+    thread_bound = False
+    
+    def read_level(self) -> int:
+        """
+        Read the output volume; implemented by each mixer
+        
+        Returns:
+            Volume level (0-100)
+        
+        Raises:
+            RuntimeError: The mixer could not be read
+        """
+        raise NotImplementedError
+    
+    def write_level(self, level: int) -> None:
+        """
+        Set the output volume; implemented by each mixer
+        
+        Raises:
+            RuntimeError: The mixer could not be written
+        """
+        raise NotImplementedError
+    
+    def watch(self, on_change: Callable[[int], None]) -> None:
+        """Report volume changes made outside Nova, where the mixer can"""
+    
+    def close(self) -> None:
+        """Release the mixer"""
+
+
+class PycawBackend(VolumeBackend):
+    """The Windows endpoint volume, through pycaw"""
+    
+    name = 'pycaw'
+    thread_bound = True
+    
+    def __init__(self):
+        """
+        Raises:
+            RuntimeError: pycaw is not installed or there are no speakers
+        """
+        try:
+            from ctypes import POINTER, cast
+            from comtypes import CLSCTX_ALL
+            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+        except ImportError as e:
+            raise RuntimeError(f"Windows volume control needs pycaw (pip install pycaw): {e}")
+        try:
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            self.endpoint = cast(interface, POINTER(IAudioEndpointVolume))
+        except Exception as e:
+            raise RuntimeError(f"could not open the speakers: {e}")
+    
+    def read_level(self) -> int:
+        return int(round(self.endpoint.GetMasterVolumeLevelScalar() * 100))
+    
+    def write_level(self, level: int) -> None:
+        self.endpoint.SetMasterVolumeLevelScalar(level / 100.0, None)
+
+
+class PulseBackend(VolumeBackend):
+    """The default sink of PulseAudio or PipeWire, through pactl"""
+    
+    name = 'pulse'
+    
+    def __init__(self, sink: str = '@DEFAULT_SINK@'):
+        """
+        Args:
+            sink: Sink to control
+        
+        Raises:
+            RuntimeError: pactl is not installed
+        """
+        self.pactl = shutil.which('pactl')
+        if self.pactl is None:
+            raise RuntimeError("pactl is not installed")
+        self.sink = sink
+        self._subscription: Optional[subprocess.Popen] = None
+    
+    def _run(self, *arguments: str) -> str:
+        try:
+            result = subprocess.run([self.pactl, *arguments], capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError) as e:
+            raise RuntimeError(f"pactl failed: {e}")
+        if result.returncode != 0:
+            raise RuntimeError(f"pactl failed: {result.stderr.strip()}")
+        return result.stdout
+    
+    def read_level(self) -> int:
+        match = _PERCENT.search(self._run('get-sink-volume', self.sink))
+        if match is None:
+            raise RuntimeError("pactl reported no volume")
+        return int(match.group(1))
+    
+    def write_level(self, level: int) -> None:
+        self._run('set-sink-volume', self.sink, f"{level}%")
+    
+    def watch(self, on_change: Callable[[int], None]) -> None:
+        """Follow sink changes over one long-lived `pactl subscribe`"""
+        if self._subscription is not None:
+            return
+        try:
+            self._subscription = subprocess.Popen([self.pactl, 'subscribe'], stdout=subprocess.PIPE,
+                                                  stderr=subprocess.DEVNULL, text=True)
+        except OSError as e:
+            print(f"Warning: Could not follow volume changes: {e}")
+            return
+        
+        def follow(stream):
+            for line in stream:
+                if "'change' on sink" in line:
+                    try:
+                        on_change(self.read_level())
+                    except RuntimeError:
+                        continue
+        
+        threading.Thread(target=follow, args=(self._subscription.stdout,), name="nova-volume-watch",
+                         daemon=True).start()
+    
+    def close(self) -> None:
+        if self._subscription is not None:
+            self._subscription.terminate()
+            self._subscription = None
+
+
+class AlsaBackend(VolumeBackend):
+    """An ALSA mixer control, written through one long-lived `amixer --stdin`"""
+    
+    name = 'alsa'
+    
+    def __init__(self, control: str = 'Master'):
+        """
+        Args:
+            control: Mixer control to set
+        
+        Raises:
+            RuntimeError: amixer is not installed
+        """
+        self.amixer = shutil.which('amixer')
+        if self.amixer is None:
+            raise RuntimeError("amixer is not installed")
+        self.control = control
+        self._mixer: Optional[subprocess.Popen] = None
+    
+    def read_level(self) -> int:
+        try:
+            output = subprocess.run([self.amixer, 'get', self.control], capture_output=True,
+                                    text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError) as e:
+            raise RuntimeError(f"amixer failed: {e}")
+        match = re.search(r'\[(\d+)%\]', output)
+        if match is None:
+            raise RuntimeError(f"amixer reported no volume for {self.control}")
+        return int(match.group(1))
+    
+    def write_level(self, level: int) -> None:
+        if self._mixer is None or self._mixer.poll() is not None:
+            try:
+                self._mixer = subprocess.Popen([self.amixer, '--quiet', '--stdin'], stdin=subprocess.PIPE,
+                                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True)
+            except OSError as e:
+                raise RuntimeError(f"amixer failed: {e}")
+        try:
+            self._mixer.stdin.write(f"sset {self.control} {level}%\n")
+            self._mixer.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self._mixer = None
+            raise RuntimeError(f"amixer exited: {e}")
+    
+    def close(self) -> None:
+        if self._mixer is not None:
+            try:
+                self._mixer.stdin.close()
+            except OSError:
+                pass
+            try:
+                self._mixer.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                # Stuck; shutdown must go on
+                self._mixer.kill()
+                self._mixer.wait()
+            self._mixer = None
+
+
+class FakeBackend(VolumeBackend):
+    """An in-memory mixer, for tests and benchmarks"""
+    
+    name = 'fake'
+    
+    def __init__(self, level: int = 50, write_delay: float = 0.0):
+        """
+        Args:
+            level: Starting volume
+            write_delay: Seconds each write takes, e.g. to stand in for a
+                process spawn
+        """
+        self.level = level
+        self.write_delay = write_delay
+        self.reads = 0
+        self.writes = 0
+    
+    def read_level(self) -> int:
+        self.reads += 1
+        return self.level
+    
+    def write_level(self, level: int) -> None:
+        if self.write_delay:
+            time.sleep(self.write_delay)
+        self.writes += 1
+        self.level = level
+
+
+class VolumeController:
+    """A mixer with its level cached and rapid changes coalesced"""
+    
+    def __init__(self, backend: VolumeBackend):
+        """
+        Args:
+            backend: Mixer to control; its level is read once, on first use
+        """
+        self.backend = backend
+        self._level: Optional[int] = None
+        # Level waiting to be written, and whether a write is under way
+        self._pending: Optional[int] = None
+        self._writing = False
+        self._condition = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        
+        # Changes asked for and writes made, for measuring
+        self.requests = 0
+        self.writes = 0
+        
+        backend.watch(self._changed_elsewhere)
+    
+    @property
+    def level(self) -> int:
+        """
+        Current volume (0-100), as last read or set
+        
+        Raises:
+            RuntimeError: The mixer could not be read
+        """
+        if self._level is None:
+            self._level = self.backend.read_level()
+        return self._level
+    
+    def set(self, level: int) -> int:
+        """
+        Set the volume
+        
+        The cached level changes at once. Slow mixers are written on a
+        background thread, and a change made while a write is under way
+        replaces any change still waiting, so only the latest is written.
+        
+        Returns:
+            The level set, clamped to 0-100
+        """
+        level = max(0, min(100, int(level)))
+        self.requests += 1
+        self._level = level
+        if self.backend.thread_bound:
+            self.backend.write_level(level)
+            self.writes += 1
+            return level
+        
+        with self._condition:
+            self._pending = level
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_pending, name="nova-volume", daemon=True)
+                self._writer.start()
+            self._condition.notify()
+        return level
+    
+    def adjust(self, change: int) -> int:
+        """
+        Change the volume by a relative amount, from the cached level
+        
+        Returns:
+            The new level
+        """
+        return self.set(self.level + change)
+    
+    def _write_pending(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    if not self._condition.wait(timeout=30):
+                        # Idle; a later set() starts a new writer
+                        self._writer = None
+                        return
+                level, self._pending = self._pending, None
+                self._writing = True
+            try:
+                self.backend.write_level(level)
+                self.writes += 1
+            except Exception as e:
+                print(f"Warning: Could not set the volume: {e}")
+                # Read the real level again next time
+                self._level = None
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+    
+    def _changed_elsewhere(self, level: int) -> None:
+        """Take a level changed outside Nova, unless one of ours is on its way"""
+        with self._condition:
+            if self._pending is None and not self._writing:
+                self._level = level
+    
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Wait for waiting changes to be written
+        
+        Returns:
+            True if everything was written in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._pending is not None or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+    
+    def close(self) -> None:
+        """Write what is waiting and release the mixer"""
+        self.flush()
+        self.backend.close()
+
+
+# Backend names accepted in SYSTEM_SETTINGS['volume_backend'], besides 'auto'
+BACKENDS = ['pycaw', 'pulse', 'alsa', 'fake']
+
+
+def create_volume_controller(name: Optional[str] = None, settings: Optional[Dict] = None) -> VolumeController:
+    """
+    Create a controller for the mixer named in the settings
+    
+    Args:
+        name: Backend name, defaults to settings['volume_backend']; 'auto'
+            picks pycaw on Windows, then pulse or alsa elsewhere
+        settings: System settings, defaults to config.SYSTEM_SETTINGS
+    
+    Returns:
+        The controller
+    
+    Raises:
+        RuntimeError: No mixer could be opened
+    """
+    settings = settings if settings is not None else SYSTEM_SETTINGS
+    name = name or settings.get('volume_backend', 'auto')
+    
+    if name == 'auto':
+        candidates = ['pycaw'] if platform.system().lower() == 'windows' else ['pulse', 'alsa']
+        errors = []
+        for candidate in candidates:
+            try:
+                return create_volume_controller(candidate, settings)
+            except RuntimeError as e:
+                errors.append(f"{candidate}: {e}")
+        raise RuntimeError(f"no volume control available ({'; '.join(errors)})")
+    
+    if name == 'pycaw':
+        backend = PycawBackend()
+    elif name == 'pulse':
+        backend = PulseBackend(settings.get('pulse_sink', '@DEFAULT_SINK@'))
+    elif name == 'alsa':
+        backend = AlsaBackend(settings.get('alsa_control', 'Master'))
+    elif name == 'fake':
+        backend = FakeBackend()
+    else:
+        raise ValueError(f"Unknown volume backend '{name}', expected one of: auto, {', '.join(BACKENDS)}")
+    return VolumeController(backend)
+
+
+def benchmark_volume(presses: int = 20) -> Dict[str, float]:
+    """
+    Compare spawning a process per volume change with the controller
+    
+    The controller runs on a fake mixer whose writes take as long as one
+    process spawn, measured here, so the comparison holds on any host.
+    
+    Args:
+        presses: "Volume up" commands in quick succession
+    
+    Returns:
+        Dictionary with spawn_ms (one process), spawn_adjust_ms (the old
+        adjust: one spawn to read, one to write), adjust_us, writes for
+        presses, and the final level
+    """
+    command = ['cmd', '/c', 'exit'] if platform.system().lower() == 'windows' else ['true']
+    start = time.perf_counter()
+    for _ in range(5):
+        subprocess.run(command)
+    spawn_seconds = (time.perf_counter() - start) / 5
+    
+    backend = FakeBackend(level=20, write_delay=spawn_seconds)
+    controller = VolumeController(backend)
+    controller.level
+    start = time.perf_counter()
+    for _ in range(presses):
+        controller.adjust(2)
+    adjust_seconds = (time.perf_counter() - start) / presses
+    controller.flush()
+    
+    return {
+        'spawn_ms': spawn_seconds * 1000,
+        'spawn_adjust_ms': spawn_seconds * 2 * 1000,
+        'adjust_us': adjust_seconds * 1e6,
+        'presses': presses,
+        'writes': backend.writes,
+        'reads': backend.reads,
+        'level': backend.level,
+    }
+
+
+def print_benchmark(report: Dict[str, float]) -> None:
+    """Print a benchmark_volume() report"""
+    print(f"  Process spawn                 {report['spawn_ms']:9.2f} ms")
+    print(f"  Volume up, spawning (old)     {report['spawn_adjust_ms']:9.2f} ms (read and write)")
+    print(f"  Volume up, controller         {report['adjust_us'] / 1000:9.4f} ms")
+    print(f"  {report['presses']} presses made {report['writes']} mixer write(s) and {report['reads']} read(s), "
+          f"ending at {report['level']}%")
+
+
+if __name__ == "__main__":
+    # Show or set the volume, or benchmark, e.g. python volume_backend.py 40
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        print("🎯 Benchmarking volume control")
+        print_benchmark(benchmark_volume())
+        sys.exit(0)
+    
+    try:
+        controller = create_volume_controller()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if len(sys.argv) > 1:
+        controller.set(int(sys.argv[1]))
+        controller.close()
+    print(f"🔊 {controller.level}% ({controller.backend.name})")
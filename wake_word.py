@@ -0,0 +1,302 @@
+"""
+Wake Word Module for Nova AI Assistant
+On-device wake word spotting with MFCC features and template matching
+"""
+
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from vad import VoiceActivityDetector, iter_chunks, read_wav
+
+
+class MFCCExtractor:
+    """Mel-frequency cepstral coefficients computed with NumPy"""
+    
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 25, step_ms: int = 10,
+                 filters: int = 26, coefficients: int = 13, fft_size: int = 512):
+        """
+        Precompute the window, mel filterbank and DCT matrix
+        
+        Args:
+            sample_rate: Samples per second
+            frame_ms: Analysis window length in milliseconds
+            step_ms: Hop between windows in milliseconds
+            filters: Number of mel filters
+            coefficients: Cepstral coefficients kept per frame
+            fft_size: FFT length, at least the window length
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = sample_rate * frame_ms // 1000
+        self.step = sample_rate * step_ms // 1000
+        self.fft_size = max(fft_size, self.frame_length)
+        self.step_seconds = step_ms / 1000.0
+        
+        self.window = np.hamming(self.frame_length).astype(np.float32)
+        self.filterbank = self._mel_filterbank(filters)
+        
+        # DCT-II rows for the first few coefficients
+        n = np.arange(filters)
+        self.dct = np.cos(np.pi / filters * (n + 0.5)[None, :] * np.arange(coefficients)[:, None]).astype(np.float32)
+    
+    def _mel_filterbank(self, filters: int) -> np.ndarray:
+        """Triangular filters spaced evenly on the mel scale"""
+        def to_mel(hz):
+            return 2595.0 * np.log10(1.0 + hz / 700.0)
+        
+        def to_hz(mel):
+            return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+        
+        mel_points = np.linspace(to_mel(0.0), to_mel(self.sample_rate / 2.0), filters + 2)
+        bins = np.floor((self.fft_size + 1) * to_hz(mel_points) / self.sample_rate).astype(int)
+        
+        bank = np.zeros((filters, self.fft_size // 2 + 1), dtype=np.float32)
+        for index in range(filters):
+            left, center, right = bins[index], bins[index + 1], bins[index + 2]
+            if center > left:
+                bank[index, left:center] = (np.arange(left, center) - left) / (center - left)
+            if right > center:
+                bank[index, center:right] = (right - np.arange(center, right)) / (right - center)
+        return bank
+    
+    def features(self, samples: np.ndarray, normalize: bool = True) -> np.ndarray:
+        """
+        Compute MFCCs for a stretch of audio
+        
+        Args:
+            samples: Mono samples
+            normalize: Subtract each coefficient's mean over the audio
+        
+        Returns:
+            Array of shape (frames, coefficients)
+        """
+        signal = samples.astype(np.float32)
+        if len(signal) < self.frame_length:
+            signal = np.pad(signal, (0, self.frame_length - len(signal)))
+        
+        # Pre-emphasis lifts the high frequencies consonants live in
+        signal = np.append(signal[0], signal[1:] - 0.97 * signal[:-1])
+        
+        count = 1 + (len(signal) - self.frame_length) // self.step
+        indices = np.arange(self.frame_length)[None, :] + self.step * np.arange(count)[:, None]
+        frames = signal[indices] * self.window
+        
+        power = np.abs(np.fft.rfft(frames, self.fft_size)) ** 2 / self.fft_size
+        energies = np.log(np.maximum(power @ self.filterbank.T, 1e-10))
+        cepstra = energies @ self.dct.T
+        
+        if not normalize:
+            return cepstra
+        # Cepstral mean normalization cancels the microphone's coloring
+        return cepstra - cepstra.mean(axis=0)
+
+
+def template_distance(template: np.ndarray, features: np.ndarray, start_slack: int = 30) -> tuple:
+    """
+    Align a template with the start of an utterance by dynamic time warping
+    
+    The match may begin anywhere in the first start_slack frames and end
+    anywhere, so the wake word can be followed by a command in the same
+    breath. Each step advances the template one frame and the utterance
+    zero to two frames, which keeps every row a single vector operation.
+    
+    Args:
+        template: Template MFCCs, shape (frames, coefficients)
+        features: Unnormalized utterance MFCCs, shape (frames, coefficients)
+        start_slack: Utterance frames the match may start within
+    
+    Returns:
+        Tuple of (mean frame distance along the best path, utterance frame
+        where the match ends)
+    """
+    rows = len(template)
+    columns = min(len(features), 2 * rows + start_slack)
+    if columns == 0:
+        return float('inf'), 0
+    
+    # Normalize over the window the wake word can occupy, not whatever follows it
+    features = features[:columns]
+    features = features - features.mean(axis=0)
+    cost = np.sqrt(((template[:, None, :] - features[None, :, :]) ** 2).sum(axis=2))
+    
+    total = np.full(columns, np.inf)
+    slack = min(start_slack, columns)
+    total[:slack] = cost[0, :slack]
+    
+    for row in range(1, rows):
+        previous = total
+        shifted_one = np.concatenate(([np.inf], previous[:-1]))
+        shifted_two = np.concatenate(([np.inf, np.inf], previous[:-2]))[:columns]
+        total = cost[row] + np.minimum(previous, np.minimum(shifted_one, shifted_two))
+    
+    end = int(np.argmin(total))
+    return float(total[end]) / rows, end + 1
+
+
+class WakeWordSpotter:
+    """Detects a wake word by comparing utterances with recorded templates"""
+    
+    def __init__(self, sample_rate: int = 16000, threshold: float = 30.0):
+        """
+        Initialize an empty spotter
+        
+        Args:
+            sample_rate: Samples per second of the audio to check
+            threshold: Highest template distance that counts as the wake word
+        """
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.extractor = MFCCExtractor(sample_rate)
+        self.templates: List[np.ndarray] = []
+        
+        # Seconds spent deciding, per checked utterance
+        self.latencies: List[float] = []
+    
+    def enroll(self, samples: np.ndarray) -> None:
+        """
+        Add a recording of just the wake word as a template
+        
+        Args:
+            samples: Mono samples; surrounding silence is trimmed
+        """
+        detector = VoiceActivityDetector(sample_rate=self.sample_rate, hangover_ms=200)
+        segments = list(detector.segments(iter_chunks(samples)))
+        if segments:
+            samples = max(segments, key=lambda segment: segment.duration).samples
+        self.templates.append(self.extractor.features(samples))
+    
+    def save(self, path: str) -> None:
+        """Save the templates to a .npz file"""
+        np.savez_compressed(
+            path,
+            sample_rate=self.sample_rate,
+            threshold=self.threshold,
+            **{f"template_{index}": template for index, template in enumerate(self.templates)}
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> "WakeWordSpotter":
+        """Load templates saved with save()"""
+        with np.load(path) as data:
+            spotter = cls(int(data['sample_rate']), float(data['threshold']))
+            names = sorted((name for name in data.files if name.startswith('template_')),
+                           key=lambda name: int(name.split('_')[1]))
+            spotter.templates = [data[name] for name in names]
+        return spotter
+    
+    def detect(self, samples: np.ndarray) -> Dict:
+        """
+        Check whether an utterance starts with the wake word
+        
+        Args:
+            samples: Mono samples of one utterance, e.g. a VAD segment
+        
+        Returns:
+            Dictionary with detected, score, end (seconds into the utterance
+            where the wake word ends) and latency_ms
+        """
+        start = time.perf_counter()
+        
+        if not self.templates:
+            raise RuntimeError("No wake word templates enrolled")
+        
+        features = self.extractor.features(samples, normalize=False)
+        best_score, best_end = float('inf'), 0
+        for template in self.templates:
+            score, end = template_distance(template, features)
+            if score < best_score:
+                best_score, best_end = score, end
+        
+        latency = time.perf_counter() - start
+        self.latencies.append(latency)
+        
+        return {
+            'detected': best_score <= self.threshold,
+            'score': best_score,
+            'end': best_end * self.extractor.step_seconds,
+            'latency_ms': latency * 1000,
+        }
+    
+    def latency_report(self) -> Dict[str, float]:
+        """
+        Summarize detection latency so far
+        
+        Returns:
+            Dictionary with count and p50/p95/max in milliseconds
+        """
+        if not self.latencies:
+            return {'count': 0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        
+        ordered = np.sort(np.array(self.latencies)) * 1000
+        return {
+            'count': len(ordered),
+            'p50_ms': float(np.percentile(ordered, 50)),
+            'p95_ms': float(np.percentile(ordered, 95)),
+            'max_ms': float(ordered[-1]),
+        }
+
+
+def benchmark_recordings(spotter: WakeWordSpotter, wav_paths: List[str]) -> Dict[str, float]:
+    """
+    Run the spotter over every utterance in some recordings
+    
+    Args:
+        spotter: Spotter with templates
+        wav_paths: 16-bit PCM WAV files at the spotter's sample rate
+    
+    Returns:
+        Latency report plus the number of utterances and detections
+    """
+    utterances = 0
+    detections = 0
+    
+    for wav_path in wav_paths:
+        samples, sample_rate = read_wav(wav_path)
+        if sample_rate != spotter.sample_rate:
+            print(f"⚠️ Skipping {wav_path}: {sample_rate} Hz, expected {spotter.sample_rate} Hz")
+            continue
+        
+        detector = VoiceActivityDetector(sample_rate=sample_rate)
+        for segment in detector.segments(iter_chunks(samples)):
+            result = spotter.detect(segment.samples)
+            utterances += 1
+            detections += result['detected']
+            
+            mark = "✅" if result['detected'] else "·"
+            print(f"  {mark} {os.path.basename(wav_path)} {segment.start:6.2f}s  "
+                  f"score {result['score']:6.2f}  {result['latency_ms']:6.2f} ms")
+    
+    report = spotter.latency_report()
+    report['utterances'] = utterances
+    report['detections'] = detections
+    return report
+
+
+if __name__ == "__main__":
+    # Enroll templates or benchmark the spotter on recordings
+    if len(sys.argv) < 4 or sys.argv[1] not in ('enroll', 'test'):
+        print("Usage:")
+        print("  python wake_word.py enroll templates.npz nova1.wav [nova2.wav ...]")
+        print("  python wake_word.py test templates.npz recording.wav [more.wav ...]")
+        sys.exit(1)
+    
+    action, model_path, wav_files = sys.argv[1], sys.argv[2], sys.argv[3:]
+    
+    if action == 'enroll':
+        spotter = None
+        for wav_file in wav_files:
+            samples, sample_rate = read_wav(wav_file)
+            if spotter is None:
+                spotter = WakeWordSpotter(sample_rate)
+            spotter.enroll(samples)
+        spotter.save(model_path)
+        print(f"✅ Saved {len(spotter.templates)} template(s) to {model_path}")
+    else:
+        spotter = WakeWordSpotter.load(model_path)
+        report = benchmark_recordings(spotter, wav_files)
+        print(f"\n🎯 {report['detections']} of {report['utterances']} utterance(s) matched the wake word")
+        print(f"⚡ Detection latency: p50 {report['p50_ms']:.2f} ms, "
+              f"p95 {report['p95_ms']:.2f} ms, max {report['max_ms']:.2f} ms")
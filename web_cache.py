@@ -0,0 +1,230 @@
+"""
+Web Cache Module for Nova AI Assistant
+Two-tier (memory + disk) cache with expiry for answers fetched over the network
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TTLCache:
+    """JSON-serializable values kept in memory and on disk until they expire"""
+    
+    def __init__(self, directory: Optional[str] = None, ttl: float = 24 * 3600,
+                 memory_entries: int = 256, disk_entries: int = 2000):
+        """
+        Initialize the cache
+        
+        Args:
+            directory: Directory for the disk tier, None for memory only
+            ttl: Seconds an entry stays fresh
+            memory_entries: Most recently used entries kept in memory
+            disk_entries: Disk budget; expired entries go first, then the
+                least recently used
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        # key -> (expires at, value), least recently used first
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # File name -> expires at, for the disk tier, least recently used first
+        self._disk: "OrderedDict[str, float]" = OrderedDict()
+        
+        if directory:
+            self._load_index()
+    
+    def _load_index(self):
+        """Index cached files, oldest access first, deleting expired ones"""
+        os.makedirs(self.directory, exist_ok=True)
+        
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.tmp'):
+                # Left by a write that never finished
+                self._remove(path)
+                continue
+            if not name.endswith('.json'):
+                continue
+            try:
+                accessed = os.stat(path).st_mtime
+                with open(path, 'r', encoding='utf-8') as cache_file:
+                    expires = json.load(cache_file)['expires']
+            except (OSError, ValueError, KeyError, TypeError):
+                self._remove(path)
+                continue
+            if expires <= now:
+                self._remove(path)
+                continue
+            entries.append((accessed, name, expires))
+        
+        for _, name, expires in sorted(entries):
+            self._disk[name] = expires
+        for name in self._evict():
+            self._remove(os.path.join(self.directory, name))
+    
+    @staticmethod
+    def _name(key: str) -> str:
+        """Name of the file holding an entry on disk"""
+        return hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json'
+    
+    def _path(self, key: str) -> str:
+        """File holding an entry on disk"""
+        return os.path.join(self.directory, self._name(key))
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a fresh value
+        
+        Returns:
+            The cached value, or None if it is missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._memory[key]
+        
+        entry = self._read(key) if self.directory else None
+        fresh = entry is not None and entry[0] > now
+        with self._lock:
+            if not fresh:
+                self.misses += 1
+                if entry is not None:
+                    self._disk.pop(self._name(key), None)
+            else:
+                self.hits += 1
+                self.disk_hits += 1
+                self._remember(key, entry)
+                if self._name(key) in self._disk:
+                    self._disk.move_to_end(self._name(key))
+        if not fresh:
+            if entry is not None:
+                self._remove(self._path(key))
+            return None
+        try:
+            # Marks it recently used, so eviction after a restart keeps it too
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return entry[1]
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Seconds it stays fresh, defaults to the cache's ttl
+        """
+        entry = (time.time() + (self.ttl if ttl is None else ttl), value)
+        with self._lock:
+            self._remember(key, entry)
+        if not self.directory or not self._write(key, entry):
+            return
+        with self._lock:
+            self._disk[self._name(key)] = entry[0]
+            self._disk.move_to_end(self._name(key))
+            evicted = self._evict()
+        for name in evicted:
+            self._remove(os.path.join(self.directory, name))
+    
+    def _remember(self, key: str, entry: Tuple[float, Any]):
+        """Keep an entry in memory; called with the lock held"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+    
+    def _evict(self) -> List[str]:
+        """Drop disk entries over budget, expired ones first; called with the lock held"""
+        if len(self._disk) <= self.disk_entries:
+            return []
+        now = time.time()
+        evicted = [name for name, expires in self._disk.items() if expires <= now]
+        for name in evicted:
+            del self._disk[name]
+        while len(self._disk) > self.disk_entries:
+            evicted.append(self._disk.popitem(last=False)[0])
+        return evicted
+    
+    @staticmethod
+    def _remove(path: str):
+        """Delete a cache file, if it is still there"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Load an entry from disk"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if data.get('key') != key:
+            return None
+        return data['expires'], data['value']
+    
+    def _write(self, key: str, entry: Tuple[float, Any]) -> bool:
+        """Save an entry to disk atomically; False if it could not be"""
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump({'key': key, 'expires': entry[0], 'value': entry[1]}, cache_file)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write cache entry: {e}")
+            self._remove(temp_path)
+            return False
+        return True
+    
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk"""
+        with self._lock:
+            self._memory.clear()
+            self._disk.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with hits, disk_hits, misses, memory_entries and
+            disk_entries
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'memory_entries': len(self._memory),
+                'disk_entries': len(self._disk),
+            }
@@ -4,13 +4,300 @@ Handles web search, Wikipedia queries, and other web-based operations
 """
 
 import requests
-import wikipedia
 import pywhatkit
 import webbrowser
 from typing import Optional, List, Dict
 import json
+import os
 import re
-from urllib.parse import quote_plus
+import threading
+from concurrent.futures import Future
+from urllib.parse import quote, quote_plus
+
+from config import API_KEYS, WEB_SETTINGS, WEATHER_SETTINGS
+from lexicon import SAMPLE_DEFINITIONS, Lexicon, normalize_word
+from news_feed import HeadlineStore, NewsFeed
+from translation import LANGUAGE_NAMES, create_translator, language_code
+from web_cache import TTLCache
+
+
+# Sentence ends followed by the start of another sentence
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'(])')
+
+
+# Built-in definitions by lookup form, for when there is no dictionary file
+_SAMPLE_ENTRIES = {normalize_word(word): {'word': word, 'senses': [{'pos': pos, 'definition': definition}]}
+                   for word, pos, definition in SAMPLE_DEFINITIONS}
+
+
+def first_sentences(text: str, count: int) -> str:
+    """Keep the first few sentences of a paragraph"""
+    return " ".join(_SENTENCE_END.split(text.strip())[:count])
+
+
+class WikipediaClient:
+    """Wikipedia REST API client that gets title, URL and extract in one request"""
+    
+    def __init__(self, session: requests.Session, base_url: str = 'https://en.wikipedia.org',
+                 cache: Optional[TTLCache] = None, timeout: float = 5.0,
+                 missing_ttl: float = 3600):
+        """
+        Initialize the client
+        
+        Args:
+            session: Shared HTTP session, so connections are reused
+            base_url: Wikipedia site, or a local stand-in
+            cache: Cache for answers, None to always ask Wikipedia
+            timeout: Seconds to wait for each request
+            missing_ttl: Seconds to remember that an article does not exist
+        """
+        self.session = session
+        self.base_url = base_url.rstrip('/')
+        self.cache = cache
+        self.timeout = timeout
+        self.missing_ttl = missing_ttl
+        
+        # HTTP requests made, for measuring
+        self.round_trips = 0
+    
+    def _get(self, path: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        GET a JSON document
+        
+        Returns:
+            Parsed JSON, or None if it does not exist
+        
+        Raises:
+            requests.RequestException: Network or server error
+        """
+        self.round_trips += 1
+        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+    
+    def summary(self, title: str) -> Optional[Dict]:
+        """
+        Get an article's summary, following redirects
+        
+        Args:
+            title: Article title, case-insensitive first letter
+        
+        Returns:
+            Dictionary with title, extract, description, url and type
+            ('standard' or 'disambiguation'), or None if there is no
+            such article
+        """
+        key = self._summary_key(title)
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached or None
+        
+        page = self._parse_summary(title, self._get(self._summary_path(title)))
+        if self.cache is not None:
+            self.cache.set(key, page or {}, None if page else self.missing_ttl)
+        return page
+    
+    def search(self, query: str, limit: int = 5) -> List[str]:
+        """
+        Find article titles matching a query
+        
+        Returns:
+            Up to limit titles, best match first
+        """
+        key = f"search:{limit}:{query.strip().lower()}"
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached
+        
+        titles = self._parse_search(self._get(self.SEARCH_PATH, {'q': query, 'limit': limit}))
+        if self.cache is not None:
+            self.cache.set(key, titles)
+        return titles
+    
+    # Request building and parsing, shared with the asyncio client
+    
+    SEARCH_PATH = '/w/rest.php/v1/search/title'
+    
+    @staticmethod
+    def _summary_key(title: str) -> str:
+        """Cache key of an article summary"""
+        return f"summary:{title.strip().lower()}"
+    
+    @staticmethod
+    def _summary_path(title: str) -> str:
+        """REST path of an article summary"""
+        return f"/api/rest_v1/page/summary/{quote(title.strip().replace(' ', '_'), safe='')}"
+    
+    def _parse_summary(self, title: str, data: Optional[Dict]) -> Optional[Dict]:
+        """Turn a summary response into a page dictionary, None if missing"""
+        if data is None:
+            return None
+        return {
+            'title': data.get('title', title),
+            'extract': data.get('extract', ''),
+            'description': data.get('description', ''),
+            'url': data.get('content_urls', {}).get('desktop', {}).get('page')
+                   or f"{self.base_url}/wiki/{quote(title.strip().replace(' ', '_'))}",
+            'type': data.get('type', 'standard'),
+        }
+    
+    @staticmethod
+    def _parse_search(data: Optional[Dict]) -> List[str]:
+        """Titles from a title search response"""
+        return [page['title'] for page in (data or {}).get('pages', []) if 'title' in page]
+
+
+OPENWEATHERMAP_URL = 'https://api.openweathermap.org'
+
+
+def weather_category(condition_id: int) -> str:
+    """
+    Map an OpenWeatherMap condition code onto a Utilities.get_weather_personality category
+    
+    Returns:
+        'sunny', 'cloudy', 'rainy' or 'snowy'
+    """
+    if condition_id < 600:
+        # Thunderstorm (2xx), drizzle (3xx) and rain (5xx)
+        return 'rainy'
+    if condition_id < 700:
+        return 'snowy'
+    if condition_id in (800, 801):
+        # Clear, or just a few clouds
+        return 'sunny'
+    # Mist, fog, haze (7xx) and heavier cloud (802-804)
+    return 'cloudy'
+
+
+_WEATHER_CITY = re.compile(r"\b(?:in|for|at)\s+(?P<city>[^\W\d_][\w .'-]*?)"
+                           r"(?:\s+(?:today|tonight|tomorrow|right now|now|please))?\W*$", re.IGNORECASE)
+_NOT_CITIES = {'today', 'tonight', 'tomorrow', 'now', 'right now', 'the moment', 'this week'}
+
+
+def weather_city(command: str) -> Optional[str]:
+    """
+    The city named in a weather request, e.g. "what's the weather in new york"
+    
+    Returns:
+        The city, or None if the request names none
+    """
+    match = _WEATHER_CITY.search(command)
+    if not match or match.group('city').strip() in _NOT_CITIES:
+        return None
+    return match.group('city').strip()
+
+
+class WeatherClient:
+    """OpenWeatherMap current-weather client with a per-city cache and request coalescing"""
+    
+    def __init__(self, session: requests.Session, base_url: str = OPENWEATHERMAP_URL,
+                 api_key: Optional[str] = None, units: str = 'metric',
+                 cache: Optional[TTLCache] = None, timeout: float = 5.0,
+                 missing_ttl: float = 3600):
+        """
+        Initialize the client
+        
+        Args:
+            session: Shared HTTP session, so connections are reused
+            base_url: OpenWeatherMap, or a local stand-in
+            api_key: OpenWeatherMap API key
+            units: 'metric' or 'imperial'
+            cache: Cache for reports per city, None to always ask
+            timeout: Seconds to wait for each request
+            missing_ttl: Seconds to remember that a city is unknown
+        """
+        self.session = session
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.units = units
+        self.cache = cache
+        self.timeout = timeout
+        self.missing_ttl = missing_ttl
+        
+        # HTTP requests made, and callers that shared another caller's request
+        self.round_trips = 0
+        self.coalesced = 0
+        
+        # Cache key -> Future of the request in flight for it
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def available(self) -> bool:
+        """Whether requests can be made; the real service needs an API key"""
+        return bool(self.api_key) or self.base_url != OPENWEATHERMAP_URL
+    
+    def current(self, city: str) -> Optional[Dict]:
+        """
+        Get the current weather in a city
+        
+        Callers asking for the same city at the same time share one request.
+        
+        Args:
+            city: City name, optionally with a country code ("Paris,FR")
+        
+        Returns:
+            Dictionary with city, country, condition_id, category,
+            description, temperature, humidity and wind_speed, or None if
+            the city is unknown
+        
+        Raises:
+            requests.RequestException: Network or server error
+        """
+        key = f"weather:{self.units}:{city.strip().lower()}"
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached or None
+        
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.result()
+        
+        try:
+            report = self._fetch(city)
+            if self.cache is not None:
+                self.cache.set(key, report or {}, None if report else self.missing_ttl)
+            flight.set_result(report)
+            return report
+        except Exception as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+    
+    def _fetch(self, city: str) -> Optional[Dict]:
+        """Ask the service for a city's weather, None if it does not know the city"""
+        self.round_trips += 1
+        params = {'q': city.strip(), 'units': self.units}
+        if self.api_key:
+            params['appid'] = self.api_key
+        response = self.session.get(f"{self.base_url}/data/2.5/weather", params=params, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        data = response.json()
+        
+        condition = (data.get('weather') or [{}])[0]
+        condition_id = int(condition.get('id', 803))
+        return {
+            'city': data.get('name', city),
+            'country': data.get('sys', {}).get('country', ''),
+            'condition_id': condition_id,
+            'category': weather_category(condition_id),
+            'description': condition.get('description', condition.get('main', '')),
+            'temperature': data.get('main', {}).get('temp'),
+            'humidity': data.get('main', {}).get('humidity'),
+            'wind_speed': data.get('wind', {}).get('speed'),
+        }
 
 
 class WebTools:
@@ -23,9 +310,97 @@ class WebTools:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
-        # Configure Wikipedia
-        wikipedia.set_lang('en')
-        wikipedia.set_rate_limiting(True)
+        # Wikipedia over the shared session, answers cached in memory and on disk
+        self.wiki = WikipediaClient(
+            self.session,
+            WEB_SETTINGS.get('wikipedia_url', 'https://en.wikipedia.org'),
+            TTLCache(WEB_SETTINGS.get('wikipedia_cache_dir'), WEB_SETTINGS.get('wikipedia_cache_ttl', 24 * 3600),
+                     disk_entries=WEB_SETTINGS.get('wikipedia_cache_entries', 2000)),
+            WEB_SETTINGS.get('request_timeout', 5.0),
+        )
+        
+        # Current weather per city, cached for a few minutes
+        self.weather = WeatherClient(
+            self.session,
+            WEATHER_SETTINGS.get('base_url', OPENWEATHERMAP_URL),
+            WEATHER_SETTINGS.get('api_key'),
+            WEATHER_SETTINGS.get('units', 'metric'),
+            TTLCache(None, WEATHER_SETTINGS.get('cache_ttl', 600)),
+            WEB_SETTINGS.get('request_timeout', 5.0),
+        )
+        # Clients for API keys passed to get_weather_info(), sharing the cache
+        self._weather_clients: Dict[str, WeatherClient] = {}
+        self._weather_lock = threading.Lock()
+        
+        # Local dictionary, opened on first use (False if there is none)
+        self.lexicon = None
+        # Translator with its phrase cache, created on first use
+        self.translator = None
+        
+        # Headlines refreshed in the background, once start_news_feed() is called
+        self.news = None
+        
+        # Offline summary index, opened on first use (False if there is none)
+        self.wiki_index = None
+        # Trigram index of known titles for misheard queries (False if there is none)
+        self.title_index = None
+        
+        # Asyncio counterpart and its loop thread, for fetch_all()
+        self._async = None
+        self._loop_thread = None
+    
+    def fetch_all(self, calls: Dict[str, tuple], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Run several lookups at once instead of one after another
+        
+        Args:
+            calls: Name -> (method name, *arguments), e.g.
+                {'wiki': ('search_wikipedia', 'alan turing'),
+                 'news': ('get_news_headlines', 'technology')}
+            timeout: Seconds each lookup may take
+        
+        Returns:
+            Name -> the method's result dictionary; a lookup that times
+            out returns {'success': False, 'error': 'timeout', ...}
+        """
+        if self._async is None:
+            from async_web_tools import AsyncWebTools, EventLoopThread
+            self._async = AsyncWebTools(self)
+            self._loop_thread = EventLoopThread()
+        return self._loop_thread.run(self._async.run_calls(calls, timeout))
+    
+    def close(self) -> None:
+        """Close fetch_all()'s pooled connections and stop its event loop"""
+        if self._async is None:
+            return
+        try:
+            self._loop_thread.run(self._async.close(), timeout=5)
+        except Exception as e:
+            print(f"Warning: Could not close web connections: {e}")
+        self._loop_thread.stop()
+        self._async = None
+        self._loop_thread = None
+    
+    def start_news_feed(self) -> None:
+        """Start refreshing news headlines in the background"""
+        if self.news is None:
+            feeds = WEB_SETTINGS.get('news_feeds', {})
+            categories = WEB_SETTINGS.get('news_categories', list(feeds))
+            self.news = NewsFeed(
+                {category: feeds.get(category, []) for category in categories},
+                self.session,
+                HeadlineStore(WEB_SETTINGS.get('news_store_size', 50)),
+                WEB_SETTINGS.get('news_refresh_interval', 900),
+                API_KEYS.get('newsapi'),
+                WEB_SETTINGS.get('newsapi_url', 'https://newsapi.org'),
+                WEB_SETTINGS.get('request_timeout', 5.0),
+            )
+        self.news.start()
+    
+    def stop_news_feed(self) -> None:
+        """Stop refreshing news headlines"""
+        if self.news is not None:
+            self.news.stop()
     
     def search_google(self, query: str, open_browser: bool = False) -> Dict:
         """
@@ -81,6 +456,123 @@ class WebTools:
                 'message': f"Failed to perform Google search for '{query}'"
             }
     
+    def _get_wiki_index(self):
+        """Get the offline Wikipedia index, or None if it is not set up"""
+        index_path = WEB_SETTINGS.get('wikipedia_index')
+        if not index_path or self.wiki_index is False:
+            return None
+        
+        if self.wiki_index is None:
+            if not os.path.exists(index_path):
+                self.wiki_index = False
+                return None
+            try:
+                from wiki_index import WikiIndex
+                self.wiki_index = WikiIndex(index_path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not open the offline Wikipedia index: {e}")
+                self.wiki_index = False
+                return None
+        return self.wiki_index
+    
+    def _get_title_index(self):
+        """Get the trigram title index, or None if it is not set up"""
+        index_path = WEB_SETTINGS.get('wikipedia_titles')
+        if not index_path or self.title_index is False:
+            return None
+        
+        if self.title_index is None:
+            if not os.path.exists(index_path):
+                self.title_index = False
+                return None
+            try:
+                from fuzzy_titles import TrigramIndex
+                self.title_index = TrigramIndex(index_path)
+            except (ImportError, OSError, ValueError) as e:
+                print(f"Warning: Could not open the Wikipedia title index: {e}")
+                self.title_index = False
+                return None
+        return self.title_index
+    
+    def _suggest_titles(self, query: str, limit: int = 5) -> List[str]:
+        """Titles close to a possibly misheard query, found locally"""
+        index = self._get_title_index()
+        if index is None:
+            return []
+        return [title for title, _ in index.suggest(query, limit)]
+    
+    def _offline_article(self, title: str, sentences: int) -> Optional[Dict]:
+        """Look an article up in the offline index, without touching the network"""
+        index = self._get_wiki_index()
+        article = index.get(title) if index is not None else None
+        if article is None:
+            return None
+        return self._article_result(article['title'], article['summary'], article['url'], sentences)
+    
+    # Wikipedia result dictionaries, shared with AsyncWebTools
+    
+    @staticmethod
+    def _article_result(title: str, text: str, url: str, sentences: int) -> Dict:
+        """Result for a found article"""
+        return {
+            'success': True,
+            'title': title,
+            'summary': first_sentences(text, sentences),
+            'url': url,
+            'message': f"Found Wikipedia article: {title}"
+        }
+    
+    @staticmethod
+    def _disambiguation_result(query: str, page: Dict, titles: List[str]) -> Dict:
+        """Result for a disambiguation page; the summary has no options, so they come from a search"""
+        options = [title for title in titles if title != page['title']][:5]
+        return {
+            'success': True,
+            'type': 'disambiguation',
+            'query': query,
+            'options': options,
+            'message': f"Multiple Wikipedia articles found for '{query}'. Please be more specific.",
+            'suggestions': options
+        }
+    
+    @staticmethod
+    def _search_result(query: str, search_results: List[str]) -> Dict:
+        """Result for a query without an article of its own"""
+        if search_results:
+            return {
+                'success': True,
+                'type': 'search_results',
+                'query': query,
+                'results': search_results,
+                'message': f"No exact match found for '{query}', but here are some related articles:",
+                'suggestions': search_results
+            }
+        else:
+            return {
+                'success': False,
+                'message': f"No Wikipedia articles found for '{query}'"
+            }
+    
+    def _wikipedia_failure(self, query: str, error: Exception) -> Dict:
+        """Result when Wikipedia could not be searched"""
+        # Offline, known titles can still be suggested
+        suggestions = self._suggest_titles(query)
+        if suggestions:
+            return {
+                'success': True,
+                'type': 'search_results',
+                'query': query,
+                'results': suggestions,
+                'message': f"I couldn't reach Wikipedia, but these articles are close to '{query}':",
+                'suggestions': suggestions
+            }
+        
+        return {
+            'success': False,
+            'error': str(error),
+            'message': f"Failed to search Wikipedia for '{query}'"
+        }
+    
     def search_wikipedia(self, query: str, sentences: int = 3) -> Dict:
         """
         Search Wikipedia for information
@@ -93,57 +585,26 @@ class WebTools:
             Dictionary with Wikipedia results
         """
         try:
-            # First try to get a direct page match
-            try:
-                page = wikipedia.page(query, auto_suggest=False)
-                summary = wikipedia.summary(query, sentences=sentences)
-                
-                return {
-                    'success': True,
-                    'title': page.title,
-                    'summary': summary,
-                    'url': page.url,
-                    'message': f"Found Wikipedia article: {page.title}"
-                }
-                
-            except wikipedia.DisambiguationError as e:
-                # Handle disambiguation pages
-                options = e.options[:5]  # Limit to first 5 options
-                
-                return {
-                    'success': True,
-                    'type': 'disambiguation',
-                    'query': query,
-                    'options': options,
-                    'message': f"Multiple Wikipedia articles found for '{query}'. Please be more specific.",
-                    'suggestions': options
-                }
-                
-            except wikipedia.PageError:
-                # Page not found, try searching
-                search_results = wikipedia.search(query, results=5)
-                
-                if search_results:
-                    return {
-                        'success': True,
-                        'type': 'search_results',
-                        'query': query,
-                        'results': search_results,
-                        'message': f"No exact match found for '{query}', but here are some related articles:",
-                        'suggestions': search_results
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'message': f"No Wikipedia articles found for '{query}'"
-                    }
-                    
+            # The offline index answers known titles in microseconds
+            offline = self._offline_article(query, sentences)
+            if offline is not None:
+                return offline
+            
+            # Title, URL and summary come back in one request
+            page = self.wiki.summary(query)
+            
+            if page is not None and page['type'] != 'disambiguation':
+                return self._article_result(page['title'], page['extract'], page['url'], sentences)
+            
+            if page is not None:
+                return self._disambiguation_result(query, page, self.wiki.search(query, 6))
+            
+            # Page not found: misheard titles are usually close to a known one,
+            # so try the local title index before searching online
+            return self._search_result(query, self._suggest_titles(query) or self.wiki.search(query, 5))
+            
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'message': f"Failed to search Wikipedia for '{query}'"
-            }
+            return self._wikipedia_failure(query, e)
     
     def get_wikipedia_summary(self, title: str, sentences: int = 3) -> Dict:
         """
@@ -157,22 +618,26 @@ class WebTools:
             Dictionary with article summary
         """
         try:
-            summary = wikipedia.summary(title, sentences=sentences)
-            page = wikipedia.page(title)
+            offline = self._offline_article(title, sentences)
+            if offline is not None:
+                offline['message'] = f"Here's what I found about {title}"
+                return offline
+            
+            page = self.wiki.summary(title)
+            if page is None:
+                return {
+                    'success': False,
+                    'message': f"Wikipedia article '{title}' not found"
+                }
             
             return {
                 'success': True,
                 'title': title,
-                'summary': summary,
-                'url': page.url,
+                'summary': first_sentences(page['extract'], sentences),
+                'url': page['url'],
                 'message': f"Here's what I found about {title}"
             }
             
-        except wikipedia.PageError:
-            return {
-                'success': False,
-                'message': f"Wikipedia article '{title}' not found"
-            }
         except Exception as e:
             return {
                 'success': False,
@@ -210,26 +675,35 @@ class WebTools:
                 'message': f"Failed to open {url}"
             }
     
-    def get_weather_info(self, city: str, api_key: Optional[str] = None) -> Dict:
+    def get_weather_info(self, city: Optional[str], api_key: Optional[str] = None) -> Dict:
         """
         Get weather information for a city
         
         Args:
-            city: City name
-            api_key: OpenWeatherMap API key (optional)
+            city: City name, None if the user named none
+            api_key: OpenWeatherMap API key, defaults to WEATHER_SETTINGS
             
         Returns:
-            Dictionary with weather information
+            Dictionary with weather information; category is one of the
+            Utilities.get_weather_personality weather types
         """
         try:
-            # For demo purposes, we'll use a simple approach
-            # In production, you'd want to use a real weather API
+            client = self.weather
+            if api_key and api_key != client.api_key:
+                # One per key, so its callers are still coalesced
+                with self._weather_lock:
+                    if api_key not in self._weather_clients:
+                        self._weather_clients[api_key] = WeatherClient(
+                            self.session, client.base_url, api_key, client.units, client.cache, client.timeout)
+                    client = self._weather_clients[api_key]
             
-            if not api_key:
+            if not client.available:
                 # Return mock weather data for demo
+                city = city or 'your area'
                 return {
                     'success': True,
                     'city': city,
+                    'category': 'cloudy',
                     'temperature': '22°C',
                     'description': 'Partly cloudy',
                     'humidity': '65%',
@@ -238,15 +712,36 @@ class WebTools:
                     'note': 'This is demo data. For real weather, provide an OpenWeatherMap API key.'
                 }
             
-            # Real API implementation would go here
-            # url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
-            # response = self.session.get(url)
-            # data = response.json()
+            if not city:
+                return {
+                    'success': False,
+                    'city': None,
+                    'message': "Which city? Ask me about the weather in one, or set a default_city in WEATHER_SETTINGS"
+                }
+            
+            report = client.current(city)
+            if report is None:
+                return {
+                    'success': False,
+                    'city': city,
+                    'message': f"I couldn't find a city called {city}"
+                }
             
+            imperial = client.units == 'imperial'
+            temperature = f"{round(report['temperature'])}°{'F' if imperial else 'C'}"
+            # OpenWeatherMap reports wind in m/s for metric and mph for imperial
+            wind_speed = (f"{round(report['wind_speed'])} mph" if imperial
+                          else f"{round(report['wind_speed'] * 3.6)} km/h")
             return {
                 'success': True,
-                'city': city,
-                'message': f"Weather API key provided for {city}. Implement real API call here."
+                'city': report['city'],
+                'category': report['category'],
+                'temperature': temperature,
+                'description': report['description'].capitalize(),
+                'humidity': f"{report['humidity']}%",
+                'wind_speed': wind_speed,
+                'message': f"Weather in {report['city']}: {temperature}, {report['description']} "
+                           f"with {report['humidity']}% humidity"
             }
             
         except Exception as e:
@@ -294,7 +789,10 @@ class WebTools:
     
     def get_news_headlines(self, category: str = "general", count: int = 5) -> Dict:
         """
-        Get news headlines (mock implementation)
+        Get news headlines
+        
+        Answers from the headlines the background feed has already fetched,
+        so it never waits on the network.
         
         Args:
             category: News category
@@ -304,7 +802,18 @@ class WebTools:
             Dictionary with news headlines
         """
         try:
-            # Mock news data for demo
+            stored = self.news.store.latest(category, count) if self.news is not None else []
+            if stored:
+                return {
+                    'success': True,
+                    'category': category,
+                    'headlines': [headline['title'] for headline in stored],
+                    'articles': stored,
+                    'count': len(stored),
+                    'message': f"Here are the latest {category} news headlines:"
+                }
+            
+            # Mock news data until the feeds have been fetched
             mock_news = {
                 "general": [
                     "AI Breakthrough: New Language Model Shows Remarkable Capabilities",
@@ -337,7 +846,7 @@ class WebTools:
                 'headlines': headlines,
                 'count': len(headlines),
                 'message': f"Here are the latest {category} news headlines:",
-                'note': 'This is demo data. For real news, integrate with a news API.'
+                'note': 'This is demo data. Real headlines appear once the news feeds have been fetched.'
             }
             
         except Exception as e:
@@ -349,46 +858,37 @@ class WebTools:
     
     def translate_text(self, text: str, target_language: str = "en") -> Dict:
         """
-        Translate text (mock implementation)
+        Translate text
         
         Args:
             text: Text to translate
-            target_language: Target language code
+            target_language: Target language code or name
             
         Returns:
             Dictionary with translation
         """
         try:
-            # Mock translation for demo
-            # In production, you'd use Google Translate API or similar
-            
-            mock_translations = {
-                "hello": "hola",
-                "goodbye": "adiós",
-                "thank you": "gracias",
-                "how are you": "cómo estás",
-                "good morning": "buenos días"
-            }
+            if self.translator is None:
+                self.translator = create_translator(session=self.session)
             
-            if text.lower() in mock_translations:
-                translation = mock_translations[text.lower()]
+            target = language_code(target_language)
+            language = LANGUAGE_NAMES.get(target, target_language)
+            translation = self.translator.translate(text, target)
+            if translation is None:
                 return {
-                    'success': True,
-                    'original': text,
-                    'translated': translation,
-                    'target_language': target_language,
-                    'message': f"'{text}' translates to '{translation}' in {target_language}",
-                    'note': 'This is demo data. For real translation, integrate with Google Translate API.'
-                }
-            else:
-                return {
-                    'success': True,
+                    'success': False,
                     'original': text,
-                    'translated': f"[{text}] (translated to {target_language})",
-                    'target_language': target_language,
-                    'message': f"Translation of '{text}' to {target_language}",
-                    'note': 'This is demo data. For real translation, integrate with Google Translate API.'
+                    'target_language': target,
+                    'message': f"I don't know how to say '{text}' in {language} yet"
                 }
+            
+            return {
+                'success': True,
+                'original': text,
+                'translated': translation,
+                'target_language': target,
+                'message': f"'{text}' translates to '{translation}' in {language}"
+            }
                 
         except Exception as e:
             return {
@@ -397,9 +897,27 @@ class WebTools:
                 'message': f"Failed to translate text to {target_language}"
             }
     
+    def _get_lexicon(self):
+        """Get the local dictionary, or None if it is not set up"""
+        index_path = WEB_SETTINGS.get('dictionary_index')
+        if not index_path or self.lexicon is False:
+            return None
+        
+        if self.lexicon is None:
+            if not os.path.exists(index_path):
+                self.lexicon = False
+                return None
+            try:
+                self.lexicon = Lexicon(index_path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not open the dictionary: {e}")
+                self.lexicon = False
+                return None
+        return self.lexicon
+    
     def get_definition(self, word: str) -> Dict:
         """
-        Get word definition (mock implementation)
+        Get word definition from the local dictionary
         
         Args:
             word: Word to define
@@ -408,34 +926,37 @@ class WebTools:
             Dictionary with word definition
         """
         try:
-            # Mock definitions for demo
-            # In production, you'd use a dictionary API
-            
-            mock_definitions = {
-                "artificial intelligence": "The simulation of human intelligence in machines that are programmed to think and learn like humans.",
-                "machine learning": "A subset of artificial intelligence that enables systems to automatically learn and improve from experience.",
-                "python": "A high-level, interpreted programming language known for its simplicity and readability.",
-                "algorithm": "A set of rules or instructions designed to solve a specific problem or perform a particular task.",
-                "database": "An organized collection of structured information or data, typically stored electronically in a computer system."
-            }
+            lexicon = self._get_lexicon()
+            entry = lexicon.get(word) if lexicon is not None else None
+            note = None
+            if entry is None and normalize_word(word) in _SAMPLE_ENTRIES:
+                entry = _SAMPLE_ENTRIES[normalize_word(word)]
+                note = 'This is demo data. For more words, build a dictionary with lexicon.py.'
             
-            if word.lower() in mock_definitions:
-                definition = mock_definitions[word.lower()]
+            if entry is None:
+                suggestions = lexicon.prefix(word, 3) if lexicon is not None else []
+                message = f"I couldn't find '{word}' in the dictionary."
+                if suggestions:
+                    message += f" Did you mean {', '.join(suggestions)}?"
                 return {
-                    'success': True,
+                    'success': False,
                     'word': word,
-                    'definition': definition,
-                    'message': f"Definition of '{word}': {definition}",
-                    'note': 'This is demo data. For real definitions, integrate with a dictionary API.'
-                }
-            else:
-                return {
-                    'success': True,
-                    'word': word,
-                    'definition': f"A term or concept that requires definition.",
-                    'message': f"'{word}' is a term that can be defined.",
-                    'note': 'This is demo data. For real definitions, integrate with a dictionary API.'
+                    'suggestions': suggestions,
+                    'message': message
                 }
+            
+            sense = entry['senses'][0]
+            result = {
+                'success': True,
+                'word': entry['word'],
+                'part_of_speech': sense['pos'],
+                'definition': sense['definition'],
+                'senses': entry['senses'],
+                'message': f"Definition of '{entry['word']}': {sense['definition']}"
+            }
+            if note:
+                result['note'] = note
+            return result
                 
         except Exception as e:
             return {
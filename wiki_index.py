@@ -0,0 +1,378 @@
+"""
+Wikipedia Index Module for Nova AI Assistant
+Offline article summaries in one memory-mapped file, looked up by binary search
+"""
+
+import bisect
+import gzip
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ElementTree
+from array import array
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import quote
+
+
+MAGIC = b'NOVAWIKI'
+VERSION = 1
+
+# magic, version, count, then the offset of each section:
+# key offsets, keys, record offsets, records
+HEADER = struct.Struct('<8sIIQQQQQ')
+
+
+def normalize_title(title: str) -> str:
+    """Lookup form of a title: case-folded, underscores as spaces, single spaces"""
+    return " ".join(title.replace('_', ' ').casefold().split())
+
+
+def article_url(title: str) -> str:
+    """English Wikipedia URL of an article"""
+    return f"https://en.wikipedia.org/wiki/{quote(title.replace(' ', '_'))}"
+
+
+class _Offsets:
+    """A uint64 offset table inside the mapped file, read without copying"""
+    
+    def __init__(self, view: memoryview, start: int, count: int):
+        self._table = view[start:start + 8 * count].cast('Q')
+    
+    def __getitem__(self, index: int) -> int:
+        return self._table[index]
+    
+    def release(self):
+        """Let go of the mapped memory"""
+        self._table.release()
+
+
+class _Keys:
+    """The sorted keys as a sequence, so bisect can search the mapped file"""
+    
+    def __init__(self, index: "WikiIndex"):
+        self._index = index
+    
+    def __len__(self) -> int:
+        return self._index.count
+    
+    def __getitem__(self, position: int) -> bytes:
+        return self._index._key(position)
+
+
+class WikiIndex:
+    """Read-only summary store built by build_index()"""
+    
+    def __init__(self, path: str):
+        """
+        Map an index file
+        
+        Args:
+            path: File written by build_index()
+        
+        Raises:
+            ValueError: The file is not a summary index
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty")
+        
+        magic, version, _, count, key_offsets, keys, record_offsets, records = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a Nova Wikipedia index")
+        
+        self.count = count
+        self._view = memoryview(self._map)
+        self._key_offsets = _Offsets(self._view, key_offsets, count + 1)
+        self._keys_start = keys
+        self._record_offsets = _Offsets(self._view, record_offsets, count + 1)
+        self._records_start = records
+        self._sorted_keys = _Keys(self)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __enter__(self) -> "WikiIndex":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """Unmap the file"""
+        # The map can only close once every view of it is released
+        for attribute in ('_key_offsets', '_record_offsets'):
+            offsets = self.__dict__.pop(attribute, None)
+            if offsets is not None:
+                offsets.release()
+        view = self.__dict__.pop('_view', None)
+        if view is not None:
+            view.release()
+        self._map.close()
+        self._file.close()
+    
+    def _key(self, position: int) -> bytes:
+        """Normalized title at a sorted position"""
+        start = self._keys_start + self._key_offsets[position]
+        end = self._keys_start + self._key_offsets[position + 1]
+        return self._map[start:end]
+    
+    def _record(self, position: int) -> memoryview:
+        """Raw record at a sorted position, sliced from the map without copying"""
+        start = self._records_start + self._record_offsets[position]
+        end = self._records_start + self._record_offsets[position + 1]
+        return self._view[start:end]
+    
+    def find(self, title: str) -> int:
+        """
+        Binary search for a title
+        
+        Returns:
+            Its sorted position, or -1 if it is not indexed
+        """
+        key = normalize_title(title).encode('utf-8')
+        position = bisect.bisect_left(self._sorted_keys, key)
+        if position < self.count and self._key(position) == key:
+            return position
+        return -1
+    
+    def article(self, position: int) -> Dict[str, str]:
+        """
+        Get the article at a sorted position
+        
+        Returns:
+            Dictionary with title, url and summary
+        """
+        title, url, summary = bytes(self._record(position)).decode('utf-8').split('\x00', 2)
+        return {'title': title, 'url': url or article_url(title), 'summary': summary}
+    
+    def get(self, title: str) -> Optional[Dict[str, str]]:
+        """
+        Look up an article by title, ignoring case
+        
+        Returns:
+            Dictionary with title, url and summary, or None if not indexed
+        """
+        position = self.find(title)
+        return self.article(position) if position >= 0 else None
+    
+    def titles(self) -> Iterator[str]:
+        """Every indexed title, in sorted order, read lazily"""
+        for position in range(self.count):
+            start = self._records_start + self._record_offsets[position]
+            end = self._map.find(b'\x00', start)
+            yield self._map[start:end].decode('utf-8')
+
+
+def build_index(articles: Iterable[Tuple[str, str, str]], path: str) -> int:
+    """
+    Write a summary index
+    
+    Records are streamed to a temporary file as they arrive; only the
+    keys and record positions are held in memory for sorting.
+    
+    Args:
+        articles: (title, url, summary) tuples; url may be empty
+        path: Index file to write
+    
+    Returns:
+        Number of articles indexed (the first of duplicate titles wins)
+    """
+    entries = []
+    seen = set()
+    directory = os.path.dirname(os.path.abspath(path))
+    
+    with tempfile.TemporaryFile(dir=directory) as records:
+        offset = 0
+        for title, url, summary in articles:
+            key = normalize_title(title).encode('utf-8')
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            
+            record = f"{title}\x00{url}\x00{summary}".encode('utf-8')
+            records.write(record)
+            entries.append((key, offset, len(record)))
+            offset += len(record)
+        seen.clear()
+        
+        entries.sort()
+        count = len(entries)
+        
+        key_offsets = array('Q', [0])
+        record_offsets = array('Q', [0])
+        for key, _, length in entries:
+            key_offsets.append(key_offsets[-1] + len(key))
+            record_offsets.append(record_offsets[-1] + length)
+        
+        key_offsets_at = HEADER.size
+        keys_at = key_offsets_at + 8 * (count + 1)
+        record_offsets_at = keys_at + key_offsets[-1]
+        # Keep the second offset table 8-byte aligned
+        record_offsets_at += -record_offsets_at % 8
+        records_at = record_offsets_at + 8 * (count + 1)
+        
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as index_file:
+            index_file.write(HEADER.pack(MAGIC, VERSION, 0, count, key_offsets_at, keys_at,
+                                         record_offsets_at, records_at))
+            key_offsets.tofile(index_file)
+            for key, _, _ in entries:
+                index_file.write(key)
+            index_file.write(b'\x00' * (record_offsets_at - index_file.tell()))
+            record_offsets.tofile(index_file)
+            
+            # Records in sorted order, copied from the temporary file
+            for _, start, length in entries:
+                records.seek(start)
+                index_file.write(records.read(length))
+        os.replace(temp_path, path)
+    
+    return count
+
+
+def read_abstracts(dump_path: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream articles from a Wikipedia abstracts dump
+    
+    Reads enwiki-latest-abstract.xml(.gz) with constant memory.
+    
+    Yields:
+        (title, url, summary) tuples
+    """
+    opener = gzip.open if dump_path.endswith('.gz') else open
+    with opener(dump_path, 'rb') as dump:
+        for _, element in ElementTree.iterparse(dump, events=('end',)):
+            if element.tag != 'doc':
+                continue
+            
+            title = (element.findtext('title') or '').strip()
+            if title.startswith('Wikipedia: '):
+                title = title[len('Wikipedia: '):]
+            summary = (element.findtext('abstract') or '').strip()
+            url = (element.findtext('url') or '').strip()
+            element.clear()
+            
+            if title and summary and not summary.startswith('|'):
+                yield title, url, summary
+
+
+def read_tsv(tsv_path: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Stream articles from a title<TAB>summary file
+    
+    Yields:
+        (title, url, summary) tuples
+    """
+    with open(tsv_path, 'r', encoding='utf-8') as tsv_file:
+        for line in tsv_file:
+            title, _, summary = line.rstrip('\n').partition('\t')
+            if title and summary:
+                yield title, '', summary
+
+
+def synthetic_articles(count: int, seed: int = 0) -> Iterator[Tuple[str, str, str]]:
+    """
+    Made-up articles for benchmarking at scale
+    
+    Yields:
+        (title, url, summary) tuples with about 300 bytes of summary each
+    """
+    words = ("history science river city theory music band film king island "
+             "language algorithm planet species battle church school novel").split()
+    generator = random.Random(seed)
+    for number in range(count):
+        title = f"{generator.choice(words).title()} {generator.choice(words)} {number}"
+        summary = " ".join(generator.choice(words) for _ in range(45)).capitalize() + "."
+        yield title, '', summary
+
+
+def benchmark_lookups(index: WikiIndex, lookups: int = 100000, seed: int = 0) -> Dict[str, float]:
+    """
+    Time random lookups, half of them for titles that are not indexed
+    
+    Returns:
+        Dictionary with lookups, hits, lookups_per_second and p50/p99/max
+        in microseconds
+    """
+    generator = random.Random(seed)
+    sample_size = min(lookups // 2, index.count)
+    present = [index.article(generator.randrange(index.count))['title'] for _ in range(sample_size)]
+    queries = present + [f"no such article {number}" for number in range(lookups - len(present))]
+    generator.shuffle(queries)
+    
+    timings = []
+    hits = 0
+    clock = time.perf_counter
+    start = clock()
+    for query in queries:
+        began = clock()
+        hits += index.get(query) is not None
+        timings.append(clock() - began)
+    total = clock() - start
+    
+    timings.sort()
+    return {
+        'lookups': len(queries),
+        'hits': hits,
+        'lookups_per_second': len(queries) / total if total else 0.0,
+        'p50_us': timings[len(timings) // 2] * 1e6,
+        'p99_us': timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1e6,
+        'max_us': timings[-1] * 1e6,
+    }
+
+
+if __name__ == "__main__":
+    # Build, query and benchmark summary indexes
+    usage = [
+        "  python wiki_index.py build enwiki-latest-abstract.xml.gz wikipedia.idx",
+        "  python wiki_index.py build articles.tsv wikipedia.idx",
+        "  python wiki_index.py build --synthetic 2000000 synthetic.idx",
+        "  python wiki_index.py lookup wikipedia.idx \"alan turing\"",
+        "  python wiki_index.py bench wikipedia.idx [lookups]",
+    ]
+    arguments = sys.argv[1:]
+    if len(arguments) < 2 or arguments[0] not in ('build', 'lookup', 'bench'):
+        print("Usage:")
+        print("\n".join(usage))
+        sys.exit(1)
+    
+    action = arguments[0]
+    if action == 'build':
+        if arguments[1] == '--synthetic':
+            source, output = synthetic_articles(int(arguments[2])), arguments[3]
+        elif arguments[1].endswith('.tsv'):
+            source, output = read_tsv(arguments[1]), arguments[2]
+        else:
+            source, output = read_abstracts(arguments[1]), arguments[2]
+        
+        start = time.perf_counter()
+        count = build_index(source, output)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Indexed {count:,} articles into {output} "
+              f"({os.path.getsize(output) / 1e6:.1f} MB) in {elapsed:.1f}s")
+    
+    elif action == 'lookup':
+        with WikiIndex(arguments[1]) as index:
+            start = time.perf_counter()
+            article = index.get(" ".join(arguments[2:]))
+            elapsed = time.perf_counter() - start
+            if article is None:
+                print(f"❓ Not indexed ({elapsed * 1e6:.1f} µs)")
+            else:
+                print(f"📖 {article['title']} ({elapsed * 1e6:.1f} µs)\n{article['summary']}\n🔗 {article['url']}")
+    
+    else:
+        with WikiIndex(arguments[1]) as index:
+            report = benchmark_lookups(index, int(arguments[2]) if len(arguments) > 2 else 100000)
+            print(f"📚 {index.count:,} titles, {report['lookups']:,} lookups ({report['hits']:,} hits)")
+            print(f"⚡ {report['lookups_per_second']:,.0f} lookups/sec, p50 {report['p50_us']:.1f} µs, "
+                  f"p99 {report['p99_us']:.1f} µs, max {report['max_us']:.1f} µs")